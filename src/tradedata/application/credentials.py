@@ -7,10 +7,18 @@ Secret Service).
 Following the pattern from perfina project for consistent credential management.
 """
 
-from typing import Optional, Tuple
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import keyring
 
+# How long successfully read credentials are served from memory (seconds)
+_CACHE_TTL_SECONDS = 300.0
+
+# source -> (expiry on the time.monotonic() clock, (email, password))
+_credentials_cache: Dict[str, Tuple[float, Tuple[str, str]]] = {}
+
 
 class CredentialsNotFoundError(Exception):
     """Raised when credentials are not found in the keyring."""
@@ -30,9 +38,40 @@ def _get_service_name(source: str) -> str:
     return f"com.tradedata.{source}"
 
 
+def _credentials_key(source: str) -> str:
+    """Get keyring username under which a source's credentials are stored.
+
+    Email and password are stored together as one JSON entry so each credential
+    operation is a single keyring round trip.
+
+    Args:
+        source: Data source name (e.g., 'robinhood', 'ibkr')
+
+    Returns:
+        Keyring username (e.g., 'robinhood_credentials')
+    """
+    return f"{source}_credentials"
+
+
+def _legacy_keys(source: str) -> Tuple[str, str]:
+    """Get keyring usernames of the older one-entry-per-field format.
+
+    Args:
+        source: Data source name (e.g., 'robinhood', 'ibkr')
+
+    Returns:
+        Tuple of (email key, password key)
+    """
+    return f"{source}_email", f"{source}_password"
+
+
 def get_credentials(source: str = "robinhood") -> Tuple[str, str]:
     """Retrieve credentials from system keyring.
 
+    Successful lookups are cached in memory for _CACHE_TTL_SECONDS so repeated
+    syncs do not each pay for a keyring round trip. store_credentials() and
+    delete_credentials() invalidate the cached entry.
+
     Args:
         source: Data source name (default: 'robinhood')
 
@@ -46,10 +85,27 @@ def get_credentials(source: str = "robinhood") -> Tuple[str, str]:
         >>> email, password = get_credentials("robinhood")
         >>> print(f"Email: {email}")
     """
+    cached = _credentials_cache.get(source)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     service_name = _get_service_name(source)
 
-    email = keyring.get_password(service_name, f"{source}_email")
-    password = keyring.get_password(service_name, f"{source}_password")
+    email: Optional[str] = None
+    password: Optional[str] = None
+    stored = keyring.get_password(service_name, _credentials_key(source))
+    if stored:
+        try:
+            data: Any = json.loads(stored)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            email, password = data.get("email"), data.get("password")
+    else:
+        # Fall back to credentials stored in the older per-field format
+        email_key, password_key = _legacy_keys(source)
+        email = keyring.get_password(service_name, email_key)
+        password = keyring.get_password(service_name, password_key)
 
     if not email or not password:
         raise CredentialsNotFoundError(
@@ -57,6 +113,7 @@ def get_credentials(source: str = "robinhood") -> Tuple[str, str]:
             f"Please store credentials first using store_credentials()"
         )
 
+    _credentials_cache[source] = (time.monotonic() + _CACHE_TTL_SECONDS, (email, password))
     return email, password
 
 
@@ -78,9 +135,13 @@ def store_credentials(source: str, email: str, password: str) -> None:
         raise ValueError("Email and password must not be empty")
 
     service_name = _get_service_name(source)
+    _credentials_cache.pop(source, None)
 
-    keyring.set_password(service_name, f"{source}_email", email)
-    keyring.set_password(service_name, f"{source}_password", password)
+    keyring.set_password(
+        service_name,
+        _credentials_key(source),
+        json.dumps({"email": email, "password": password}),
+    )
 
 
 def delete_credentials(source: str) -> None:
@@ -96,18 +157,15 @@ def delete_credentials(source: str) -> None:
         >>> delete_credentials("robinhood")
     """
     service_name = _get_service_name(source)
+    _credentials_cache.pop(source, None)
 
-    try:
-        keyring.delete_password(service_name, f"{source}_email")
-    except keyring.errors.PasswordDeleteError:
-        # Credential didn't exist, that's fine
-        pass
-
-    try:
-        keyring.delete_password(service_name, f"{source}_password")
-    except keyring.errors.PasswordDeleteError:
-        # Credential didn't exist, that's fine
-        pass
+    # Also remove per-field entries so get_credentials() cannot fall back to them
+    for key in (_credentials_key(source), *_legacy_keys(source)):
+        try:
+            keyring.delete_password(service_name, key)
+        except keyring.errors.PasswordDeleteError:
+            # Credential didn't exist, that's fine
+            pass
 
 
 def resolve_credentials(
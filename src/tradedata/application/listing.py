@@ -89,6 +89,30 @@ class TransactionDetail:
     fields: list[tuple[str, str]]
 
 
+def _load_children(
+    storage: Storage, transactions: list[Transaction]
+) -> tuple[dict[str, StockOrder], dict[str, OptionOrder], dict[str, list[OptionLeg]]]:
+    """Fetch stock orders, option orders, and legs for the given transactions.
+
+    Only rows belonging to these transactions are read, using batched
+    IN (...) lookups rather than scanning the child tables.
+
+    Returns:
+        Tuple of (stock orders by id, option orders by id, legs by order id).
+    """
+    tx_ids = [tx.id for tx in transactions]
+    stock_orders = {order.id: order for order in StockOrderRepository(storage).find_by_ids(tx_ids)}
+    option_orders = {
+        order.id: order for order in OptionOrderRepository(storage).find_by_ids(tx_ids)
+    }
+
+    legs_by_order: dict[str, list[OptionLeg]] = defaultdict(list)
+    for leg in OptionLegRepository(storage).find_by_order_ids(option_orders):
+        legs_by_order[leg.order_id].append(leg)
+
+    return stock_orders, option_orders, legs_by_order
+
+
 def list_enriched_transaction_tables(
     transaction_types: Optional[list[str]] = None,
     days: Optional[int] = None,
@@ -113,18 +137,7 @@ def list_enriched_transaction_tables(
             ordered_types.append(tx.type)
         transactions_by_type[tx.type].append(tx)
 
-    tx_ids = {tx.id for tx in transactions}
-    stock_repo = StockOrderRepository(storage)
-    stock_orders = {order.id: order for order in stock_repo.find_all() if order.id in tx_ids}
-
-    option_repo = OptionOrderRepository(storage)
-    option_orders = {order.id: order for order in option_repo.find_all() if order.id in tx_ids}
-
-    leg_repo = OptionLegRepository(storage)
-    legs_by_order: dict[str, list[OptionLeg]] = defaultdict(list)
-    for leg in leg_repo.find_all():
-        if leg.order_id in option_orders:
-            legs_by_order[leg.order_id].append(leg)
+    stock_orders, option_orders, legs_by_order = _load_children(storage, transactions)
 
     tables: list[TransactionTable] = []
     for tx_type in ordered_types:
@@ -184,18 +197,7 @@ def get_transaction_details(
     if not transactions:
         return []
 
-    tx_ids = {tx.id for tx in transactions}
-    stock_repo = StockOrderRepository(storage)
-    stock_orders = {order.id: order for order in stock_repo.find_all() if order.id in tx_ids}
-
-    option_repo = OptionOrderRepository(storage)
-    option_orders = {order.id: order for order in option_repo.find_all() if order.id in tx_ids}
-
-    leg_repo = OptionLegRepository(storage)
-    legs_by_order: dict[str, list[OptionLeg]] = defaultdict(list)
-    for leg in leg_repo.find_all():
-        if leg.order_id in option_orders:
-            legs_by_order[leg.order_id].append(leg)
+    stock_orders, option_orders, legs_by_order = _load_children(storage, transactions)
 
     details: list[TransactionDetail] = []
     for tx in transactions:
@@ -0,0 +1,54 @@
+"""Application-layer realized P&L calculation over normalized orders."""
+
+from collections import defaultdict, deque
+from typing import Iterable
+
+from tradedata.data.models import StockOrder
+
+# Quantities below this are treated as fully matched (guards float drift on fractional shares)
+_EPSILON = 1e-9
+
+
+def compute_realized_pnl(orders: Iterable[StockOrder]) -> dict[str, float]:
+    """Compute FIFO realized P&L per symbol.
+
+    Sells close the oldest open long lots first; sells beyond the open long
+    quantity open short lots, which later buys close in the same FIFO order.
+    Fill price is average_price when available, else price.
+
+    Args:
+        orders: Stock orders in execution (chronological) order.
+
+    Returns:
+        Mapping of symbol to realized P&L. Every symbol seen is included.
+    """
+    open_lots: dict[str, deque[list[float]]] = defaultdict(deque)
+    realized: dict[str, float] = {}
+
+    for order in orders:
+        symbol = order.symbol
+        price = order.average_price or order.price or 0.0
+        remaining = order.quantity if order.side.lower() == "buy" else -order.quantity
+        lots = open_lots[symbol]
+        pnl = realized.get(symbol, 0.0)
+
+        # Match against open lots on the opposite side (lot[0] is signed quantity)
+        while abs(remaining) > _EPSILON and lots and (lots[0][0] > 0) != (remaining > 0):
+            lot = lots[0]
+            matched = min(abs(remaining), abs(lot[0]))
+            if lot[0] > 0:
+                pnl += (price - lot[1]) * matched
+                lot[0] -= matched
+                remaining += matched
+            else:
+                pnl += (lot[1] - price) * matched
+                lot[0] += matched
+                remaining -= matched
+            if abs(lot[0]) <= _EPSILON:
+                lots.popleft()
+
+        if abs(remaining) > _EPSILON:
+            lots.append([remaining, price])
+        realized[symbol] = pnl
+
+    return realized
@@ -4,10 +4,21 @@ Coordinates credentials, adapter calls, validation, and persistence.
 Designed to be broker-agnostic via the `source` parameter.
 """
 
-from typing import List, Optional
+import sqlite3
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from tradedata.application import credentials
-from tradedata.data.models import Position, Transaction
+from tradedata.data.models import (
+    Execution,
+    OptionLeg,
+    OptionOrder,
+    Position,
+    StockOrder,
+    Transaction,
+)
 from tradedata.data.repositories import (
     ExecutionRepository,
     OptionLegRepository,
@@ -25,7 +36,10 @@ from tradedata.data.validator import (
     validate_stock_order,
     validate_transaction,
 )
-from tradedata.sources import create_adapter
+from tradedata.sources import DataSourceAdapter, create_adapter
+
+# Raw transactions normalized and inserted together; bounds sync memory use
+_SYNC_BATCH_SIZE = 500
 
 
 def _login_adapter(adapter, username: str, password: str) -> None:
@@ -44,6 +58,147 @@ def _login_adapter(adapter, username: str, password: str) -> None:
     raise AttributeError("Adapter does not support login")
 
 
+@contextmanager
+def _open_adapter(source: str, adapter=None) -> Iterator:
+    """Yield the injected adapter, or create one for source and close it on exit."""
+    if adapter is not None:
+        yield adapter
+        return
+    created = create_adapter(source)
+    try:
+        yield created
+    finally:
+        created.close()
+
+
+def _chunked(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Yield successive lists of at most size items from any iterable."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _extract_children(
+    adapter, raw_tx: dict, transaction: Transaction
+) -> Tuple[Optional[OptionOrder], List[OptionLeg], List[Execution], Optional[StockOrder]]:
+    """Extract and validate the entities stored alongside a transaction.
+
+    The type already classified into transaction.type is passed on, so the
+    raw transaction is not classified again.
+
+    Returns:
+        Tuple of (option order, option legs, executions, stock order). Option
+        transactions yield no stock order; others yield only a stock order.
+    """
+    option_order = adapter.extract_option_order(raw_tx, transaction.id, transaction.type)
+    if option_order:
+        validate_option_order(option_order)
+
+        legs = adapter.extract_option_legs(raw_tx, option_order.id)
+        for leg in legs:
+            validate_option_leg(leg)
+
+        leg_ids = [leg.id for leg in legs] if legs else None
+        executions = adapter.extract_executions(raw_tx, transaction.id, leg_ids)
+        for execution in executions:
+            validate_execution(execution)
+        return option_order, legs, executions, None
+
+    stock_order = adapter.extract_stock_order(raw_tx, transaction.id, transaction.type)
+    if stock_order:
+        validate_stock_order(stock_order)
+    return None, [], [], stock_order
+
+
+def _store_batch(
+    adapter,
+    raw_transactions: list[dict],
+    types: Optional[list[str]],
+    storage: Storage,
+    conn: sqlite3.Connection,
+) -> list[Transaction]:
+    """Normalize, validate, and insert one batch of raw transactions.
+
+    Rows already stored (including those inserted earlier on conn) or
+    excluded by types are skipped.
+
+    Returns:
+        Transactions inserted from this batch.
+    """
+    tx_repo = TransactionRepository(storage)
+
+    # Drop unwanted types before normalizing (and serializing raw_data) when
+    # the adapter can classify raw transactions cheaply
+    classify = getattr(adapter, "classify_transaction", None)
+    if types and callable(classify):
+        raw_transactions = [
+            raw_tx
+            for raw_tx in raw_transactions
+            if (raw_type := classify(raw_tx)) is None or raw_type in types
+        ]
+
+    # Batch normalization amortizes per-row setup; duck-typed adapters only
+    # provide normalize_transaction()
+    if isinstance(adapter, DataSourceAdapter):
+        transactions = adapter.normalize_transactions(raw_transactions)
+    else:
+        transactions = [adapter.normalize_transaction(raw_tx) for raw_tx in raw_transactions]
+
+    pending: list[tuple[dict, Transaction]] = []
+    for raw_tx, transaction in zip(raw_transactions, transactions):
+        validate_transaction(transaction)
+        if types and transaction.type not in types:
+            continue
+        pending.append((raw_tx, transaction))
+
+    # One duplicate lookup per source for the whole batch
+    source_ids_by_source: dict[str, list[str]] = defaultdict(list)
+    for _, transaction in pending:
+        source_ids_by_source[transaction.source].append(transaction.source_id)
+    seen = {
+        source_name: tx_repo.find_existing_source_ids(source_name, source_ids)
+        for source_name, source_ids in source_ids_by_source.items()
+    }
+
+    to_store: list[tuple[dict, Transaction]] = []
+    for raw_tx, transaction in pending:
+        seen_source_ids = seen[transaction.source]
+        if transaction.source_id in seen_source_ids:
+            continue
+        seen_source_ids.add(transaction.source_id)
+        to_store.append((raw_tx, transaction))
+
+    # Extraction is CPU-bound parsing, so it runs serially; adapters are never
+    # called from more than one thread
+    children = [_extract_children(adapter, *item) for item in to_store]
+
+    option_orders: list[OptionOrder] = []
+    option_legs: list[OptionLeg] = []
+    executions: list[Execution] = []
+    stock_orders: list[StockOrder] = []
+    for option_order, legs, order_executions, stock_order in children:
+        if option_order:
+            option_orders.append(option_order)
+            option_legs.extend(legs)
+            executions.extend(order_executions)
+        elif stock_order:
+            stock_orders.append(stock_order)
+
+    stored_transactions = [transaction for _, transaction in to_store]
+
+    # One batched insert per table, parents before children
+    tx_repo.create_many(stored_transactions, conn=conn)
+    OptionOrderRepository(storage).create_many(option_orders, conn=conn)
+    OptionLegRepository(storage).create_many(option_legs, conn=conn)
+    ExecutionRepository(storage).create_many(executions, conn=conn)
+    StockOrderRepository(storage).create_many(stock_orders, conn=conn)
+
+    return stored_transactions
+
+
 def sync_transactions(
     source: str = "robinhood",
     start_date: Optional[str] = None,
@@ -61,12 +216,18 @@ def sync_transactions(
     4. Extract raw transactions
     5. Normalize, validate, and persist transaction + related entities
 
+    Raw transactions are processed in batches of _SYNC_BATCH_SIZE as the
+    adapter yields them, so only one batch of models is held at a time. All
+    batches are written in a single database transaction; if any transaction
+    or child entity fails, nothing from this sync is stored.
+
     Args:
         source: Data source name (default: 'robinhood')
         start_date: Optional start date filter (ISO string)
         end_date: Optional end date filter (ISO string)
         storage: Optional Storage instance (defaults to configured database)
-        adapter: Optional adapter instance (for testing or custom sources)
+        adapter: Optional adapter instance (for testing or custom sources). Adapters
+            created here are closed when the sync ends; injected ones are left open.
         types: Optional list of transaction types to include (e.g., ['stock', 'option'])
 
     Returns:
@@ -80,54 +241,29 @@ def sync_transactions(
     """
     username, password = credentials.get_credentials(source)
 
-    adapter = adapter or create_adapter(source)
-    _login_adapter(adapter, username, password)
+    with _open_adapter(source, adapter) as adapter:
+        _login_adapter(adapter, username, password)
 
-    raw_transactions = adapter.extract_transactions(start_date=start_date, end_date=end_date)
+        if isinstance(adapter, DataSourceAdapter):
+            batches: Iterable[list[dict]] = adapter.iter_transactions(
+                start_date=start_date, end_date=end_date, page_size=_SYNC_BATCH_SIZE
+            )
+        else:
+            batches = _chunked(
+                adapter.extract_transactions(start_date=start_date, end_date=end_date),
+                _SYNC_BATCH_SIZE,
+            )
 
-    storage = storage or Storage()
-    tx_repo = TransactionRepository(storage)
-    option_order_repo = OptionOrderRepository(storage)
-    leg_repo = OptionLegRepository(storage)
-    execution_repo = ExecutionRepository(storage)
-    stock_repo = StockOrderRepository(storage)
-
-    stored_transactions: list[Transaction] = []
+        storage = storage or Storage()
+        stored_transactions: list[Transaction] = []
 
-    for raw_tx in raw_transactions:
-        transaction = adapter.normalize_transaction(raw_tx)
-        validate_transaction(transaction)
-        if types and transaction.type not in types:
-            continue
-        if tx_repo.exists_by_source_id(transaction.source, transaction.source_id):
-            continue
+        # One transaction for the whole sync, filled batch by batch as raw data
+        # streams in; any failure leaves the database exactly as it was.
         with storage.transaction() as conn:
-            tx_repo.create(transaction, conn=conn)
-
-            option_order = adapter.extract_option_order(raw_tx, transaction.id)
-            if option_order:
-                validate_option_order(option_order)
-                option_order_repo.create(option_order, conn=conn)
-
-                legs = adapter.extract_option_legs(raw_tx, option_order.id)
-                for leg in legs:
-                    validate_option_leg(leg)
-                    leg_repo.create(leg, conn=conn)
-
-                leg_ids = [leg.id for leg in legs] if legs else None
-                executions = adapter.extract_executions(raw_tx, transaction.id, leg_ids)
-                for execution in executions:
-                    validate_execution(execution)
-                    execution_repo.create(execution, conn=conn)
-            else:
-                stock_order = adapter.extract_stock_order(raw_tx, transaction.id)
-                if stock_order:
-                    validate_stock_order(stock_order)
-                    stock_repo.create(stock_order, conn=conn)
-
-        stored_transactions.append(transaction)
+            for batch in batches:
+                stored_transactions.extend(_store_batch(adapter, batch, types, storage, conn))
 
-    return stored_transactions
+        return stored_transactions
 
 
 def sync_positions(
@@ -147,7 +283,8 @@ def sync_positions(
     Args:
         source: Data source name (default: 'robinhood')
         storage: Optional Storage instance (defaults to configured database)
-        adapter: Optional adapter instance (for testing or custom sources)
+        adapter: Optional adapter instance (for testing or custom sources). Adapters
+            created here are closed when the sync ends; injected ones are left open.
 
     Returns:
         List of stored Position models.
@@ -160,20 +297,20 @@ def sync_positions(
     """
     username, password = credentials.get_credentials(source)
 
-    adapter = adapter or create_adapter(source)
-    _login_adapter(adapter, username, password)
-
-    raw_positions = adapter.extract_positions()
+    with _open_adapter(source, adapter) as adapter:
+        _login_adapter(adapter, username, password)
 
-    storage = storage or Storage()
-    position_repo = PositionRepository(storage)
+        raw_positions = adapter.extract_positions()
 
-    stored_positions: list[Position] = []
+        storage = storage or Storage()
+        position_repo = PositionRepository(storage)
 
-    for raw_pos in raw_positions:
-        position = adapter.normalize_position(raw_pos)
-        validate_position(position)
-        position_repo.create(position)
-        stored_positions.append(position)
+        if isinstance(adapter, DataSourceAdapter):
+            stored_positions: list[Position] = adapter.normalize_positions(raw_positions)
+        else:
+            stored_positions = [adapter.normalize_position(raw_pos) for raw_pos in raw_positions]
+        for position in stored_positions:
+            validate_position(position)
 
-    return stored_positions
+        position_repo.create_many(stored_positions)
+        return stored_positions
@@ -41,7 +41,7 @@ def login(
 
     try:
         # Attempt login (adapters handle session/MFA flows)
-        create_adapter(source, username=email_value, password=password_value)
+        create_adapter(source, username=email_value, password=password_value).close()
     except Exception as exc:  # pragma: no cover - pass through unknown adapter errors
         click.echo(f"Error: failed to login to {source}: {exc}", err=True)
         raise SystemExit(1) from exc
@@ -10,16 +10,11 @@ from rich.console import Console
 from rich.table import Table
 
 from tradedata.application import listing
+from tradedata.cli.params import CsvType, flatten_csv
 
 
-def _table(headers: list[str], rows: Iterable[list[str]]) -> str:
-    """Render a simple table using rich."""
-    table = Table(show_header=True, header_style="bold", box=box.SIMPLE, expand=True)
-    for header in headers:
-        table.add_column(header, overflow="fold")
-    for row in rows:
-        table.add_row(*row)
-
+def _render(table: Table) -> str:
+    """Render a rich table to plain text."""
     buffer = StringIO()
     console = Console(
         force_terminal=False,
@@ -34,6 +29,16 @@ def _table(headers: list[str], rows: Iterable[list[str]]) -> str:
     return str(output).rstrip()
 
 
+def _table(headers: list[str], rows: Iterable[list[str]]) -> str:
+    """Render a simple table using rich."""
+    table = Table(show_header=True, header_style="bold", box=box.SIMPLE, expand=True)
+    for header in headers:
+        table.add_column(header, overflow="fold")
+    for row in rows:
+        table.add_row(*row)
+    return _render(table)
+
+
 def _detail_table(fields: list[tuple[str, str]]) -> str:
     """Render key/value transaction detail table."""
     table = Table(show_header=True, header_style="bold", box=box.SIMPLE, expand=True)
@@ -41,19 +46,7 @@ def _detail_table(fields: list[tuple[str, str]]) -> str:
     table.add_column("Value", overflow="fold")
     for field, value in fields:
         table.add_row(field, value)
-
-    buffer = StringIO()
-    console = Console(
-        force_terminal=False,
-        color_system=None,
-        width=120,
-        soft_wrap=True,
-        record=True,
-        file=buffer,
-    )
-    console.print(table)
-    output = buffer.getvalue()
-    return str(output).rstrip()
+    return _render(table)
 
 
 @click.group(name="show")
@@ -65,6 +58,7 @@ def show() -> None:
 @click.option(
     "--type",
     "transaction_types",
+    type=CsvType(),
     multiple=True,
     help=(
         "Filter by transaction types (repeatable or comma-separated, "
@@ -99,7 +93,7 @@ def show() -> None:
     help="Show transaction(s) by source ID (mutually exclusive with --id).",
 )
 def show_transactions(
-    transaction_types: tuple[str, ...],
+    transaction_types: tuple[tuple[str, ...], ...],
     days: Optional[int],
     raw: bool,
     transaction_ids: tuple[str, ...],
@@ -119,20 +113,23 @@ def show_transactions(
             click.echo("No transactions found.")
             return
 
-        for idx, detail in enumerate(details):
-            click.echo(f"Transaction {detail.transaction_id}")
-            click.echo(_detail_table(detail.fields))
-            if idx < len(details) - 1:
-                click.echo()
+        # Build the whole output first and write it with a single echo
+        click.echo(
+            "\n\n".join(
+                f"Transaction {detail.transaction_id}\n{_detail_table(detail.fields)}"
+                for detail in details
+            )
+        )
         return
 
-    tx_types = _parse_types_option(transaction_types)
+    tx_types = flatten_csv(transaction_types)
     if raw:
         transactions = listing.list_transactions(transaction_types=tx_types, days=days, last=last)
         if not transactions:
             click.echo("No transactions found.")
             return
 
+        blocks: list[str] = []
         for tx in transactions:
             merged = {
                 "id": tx.id,
@@ -145,8 +142,8 @@ def show_transactions(
             raw_dict = tx.get_raw_data_dict()
             for key, value in raw_dict.items():
                 merged[f"raw.{key}"] = value
-            click.echo(json.dumps(merged, indent=2, sort_keys=True))
-            click.echo()
+            blocks.append(json.dumps(merged, indent=2, sort_keys=True) + "\n\n")
+        click.echo("".join(blocks), nl=False)
         return
 
     tables = listing.list_enriched_transaction_tables(
@@ -156,11 +153,13 @@ def show_transactions(
         click.echo("No transactions found.")
         return
 
-    for idx, table in enumerate(tables):
-        click.echo(f"{table.transaction_type.capitalize()} transactions")
-        click.echo(_table(table.headers, table.rows))
-        if idx < len(tables) - 1:
-            click.echo()
+    click.echo(
+        "\n\n".join(
+            f"{table.transaction_type.capitalize()} transactions\n"
+            + _table(table.headers, table.rows)
+            for table in tables
+        )
+    )
 
 
 @show.command("positions")
@@ -190,14 +189,3 @@ def show_positions() -> None:
         rows,
     )
     click.echo(output)
-
-
-def _parse_types_option(types: Optional[tuple[str, ...]]) -> Optional[list[str]]:
-    """Flatten repeatable/CSV types into a list."""
-    if not types:
-        return None
-    flattened: list[str] = []
-    for entry in types:
-        parts = [part.strip() for part in entry.replace(",", " ").split() if part.strip()]
-        flattened.extend(parts)
-    return flattened or None
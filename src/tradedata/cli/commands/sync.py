@@ -5,6 +5,7 @@ from typing import Optional
 import click
 
 from tradedata.application import robinhood_sync
+from tradedata.cli.params import CsvType, flatten_csv
 
 
 @click.group()
@@ -19,6 +20,7 @@ def sync() -> None:
 @click.option(
     "--types",
     "-t",
+    type=CsvType(),
     multiple=True,
     help=(
         "Transaction types to include; repeat or comma-separate "
@@ -29,10 +31,10 @@ def sync_transactions(
     source: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    types: Optional[tuple[str, ...]] = None,
+    types: Optional[tuple[tuple[str, ...], ...]] = None,
 ) -> None:
     """Sync transactions into the local database."""
-    parsed_types = _parse_types_option(types)
+    parsed_types = flatten_csv(types)
     transactions = robinhood_sync.sync_transactions(
         source=source,
         start_date=start_date,
@@ -48,14 +50,3 @@ def sync_positions(source: str) -> None:
     """Sync positions into the local database."""
     positions = robinhood_sync.sync_positions(source=source)
     click.echo(f"Synced {len(positions)} positions from {source}.")
-
-
-def _parse_types_option(types: Optional[tuple[str, ...]]) -> Optional[list[str]]:
-    """Flatten repeatable/CSV types into a list."""
-    if not types:
-        return None
-    flattened: list[str] = []
-    for entry in types:
-        parts = [part.strip() for part in entry.replace(",", " ").split() if part.strip()]
-        flattened.extend(parts)
-    return flattened or None
@@ -0,0 +1,30 @@
+"""Click parameter types and helpers shared by CLI commands."""
+
+from typing import Iterable, Optional
+
+import click
+
+
+class CsvType(click.ParamType):
+    """Click type splitting a comma/space-separated option value into parts."""
+
+    name = "csv"
+
+    def convert(self, value, param, ctx) -> tuple[str, ...]:
+        """Split value into stripped, non-empty parts (already-split values pass through)."""
+        if isinstance(value, tuple):
+            return value
+        return tuple(value.replace(",", " ").split())
+
+
+def flatten_csv(values: Optional[Iterable[tuple[str, ...]]]) -> Optional[list[str]]:
+    """Flatten a repeatable CsvType option into a list, or None when empty.
+
+    Args:
+        values: Parts of each occurrence of the option, as split by CsvType.
+
+    Returns:
+        All parts in order, or None if no parts were given.
+    """
+    flattened = [part for entry in values or () for part in entry]
+    return flattened or None
@@ -0,0 +1,60 @@
+"""Identifier generation for stored entities."""
+
+import os
+import threading
+import time
+import uuid
+
+# rand_a holds a 12-bit sequence so IDs minted in the same millisecond sort in order
+_SEQUENCE_MASK = 0xFFF
+_RAND_B_MASK = (1 << 62) - 1
+
+# Millisecond and sequence of the last ID issued, shared by every call in the process
+_lock = threading.Lock()
+_last_ms = -1
+_last_sequence = _SEQUENCE_MASK
+
+
+def new_ids(count: int) -> list[str]:
+    """Generate time-ordered UUID (version 7) strings.
+
+    IDs share the current millisecond timestamp as their prefix, so rows
+    inserted together land next to each other in SQLite's primary key index
+    instead of at random positions. The 12-bit sequence continues across calls
+    within a millisecond (moving on to the next millisecond when it runs out,
+    or when the clock steps back), so every ID sorts after all IDs issued
+    before it in this process. All randomness comes from a single os.urandom
+    read for the batch.
+
+    Args:
+        count: Number of IDs to generate
+
+    Returns:
+        List of UUID strings in the canonical 8-4-4-4-12 form
+    """
+    if count <= 0:
+        return []
+    global _last_ms, _last_sequence
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            ms, sequence = now_ms, 0
+        else:
+            ms, sequence = _last_ms, _last_sequence + 1
+        slots: list[tuple[int, int]] = []
+        for _ in range(count):
+            if sequence > _SEQUENCE_MASK:
+                ms, sequence = ms + 1, 0
+            slots.append((ms, sequence))
+            sequence += 1
+        _last_ms, _last_sequence = slots[-1]
+
+    version_and_variant = (0x7 << 76) | (0b10 << 62)
+    raw = os.urandom(8 * count)
+    ids: list[str] = []
+    append = ids.append
+    for (ms, sequence), offset in zip(slots, range(0, 8 * count, 8)):
+        rand_b = int.from_bytes(raw[offset : offset + 8], "big") & _RAND_B_MASK
+        value = (ms << 80) | version_and_variant | (sequence << 64) | rand_b
+        append(str(uuid.UUID(int=value)))
+    return ids
@@ -2,19 +2,34 @@
 
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import ClassVar, Generic, Iterable, Optional, Protocol, Sequence, TypeVar
 
 from tradedata.data.storage import Storage
 
-T = TypeVar("T")
+
+class _Row(Protocol):
+    """Model that serializes to a row tuple in its table's column order."""
+
+    def to_db_tuple(self) -> tuple: ...
+
+
+T = TypeVar("T", bound=_Row)
+
+# Lowest SQLITE_MAX_VARIABLE_NUMBER across supported SQLite builds (< 3.32)
+_MAX_SQL_VARIABLES = 999
 
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository for all entity repositories.
 
     Provides common CRUD operations that can be overridden by subclasses.
+    Subclasses set _TABLE and _COLUMNS (in to_db_tuple() order); the batched
+    SQL helpers only interpolate these fixed identifiers.
     """
 
+    _TABLE: ClassVar[str]
+    _COLUMNS: ClassVar[tuple[str, ...]]
+
     def __init__(self, storage: Storage):
         """Initialize repository with storage dependency.
 
@@ -48,6 +63,25 @@ class BaseRepository(ABC, Generic[T]):
         """
         pass
 
+    def create_many(self, entities: list[T], conn: Optional[sqlite3.Connection] = None) -> list[T]:
+        """Create several entities with batched multi-row inserts.
+
+        Args:
+            entities: Entity instances to create.
+            conn: Optional connection to use for atomic writes.
+
+        Returns:
+            Created entity instances.
+        """
+        rows = [self._to_row(entity) for entity in entities]
+        if conn is not None:
+            self._insert_many(conn, rows)
+            return entities
+
+        with self.storage.transaction() as tx_conn:
+            self._insert_many(tx_conn, rows)
+        return entities
+
     @abstractmethod
     def update(self, entity: T, conn: Optional[sqlite3.Connection] = None) -> T:
         """Update an existing entity.
@@ -82,3 +116,111 @@ class BaseRepository(ABC, Generic[T]):
             List of all entity instances.
         """
         pass
+
+    def count(self) -> int:
+        """Count rows in _TABLE without loading them.
+
+        Returns:
+            Number of stored entities.
+        """
+        table, _ = self._identifiers()
+        # The table name comes from the validated class constant
+        row = self.storage.fetchone(f"SELECT COUNT(*) FROM {table}")  # nosec B608
+        return int(row[0]) if row else 0
+
+    def _to_row(self, entity: T) -> tuple:
+        """Return the row tuple for entity, in _COLUMNS order.
+
+        Args:
+            entity: Entity instance.
+
+        Returns:
+            Row values for a batched insert.
+        """
+        return entity.to_db_tuple()
+
+    @classmethod
+    def _identifiers(cls, *columns: str) -> tuple[str, str]:
+        """Return the table name and a column list checked against the class constants.
+
+        Args:
+            columns: Columns to list; defaults to all of _COLUMNS.
+
+        Returns:
+            Tuple of (table name, comma-separated column list).
+
+        Raises:
+            ValueError: If the constants are not plain identifiers or a column
+                is not one of _COLUMNS.
+        """
+        names = (cls._TABLE, *cls._COLUMNS)
+        if not all(name.isidentifier() for name in names):
+            raise ValueError(f"{cls.__name__} has invalid table or column names")
+        unknown = [column for column in columns if column not in cls._COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown {cls._TABLE} columns: {', '.join(unknown)}")
+        return cls._TABLE, ", ".join(columns or cls._COLUMNS)
+
+    def _insert_many(self, conn: sqlite3.Connection, rows: Sequence[tuple]) -> None:
+        """Insert rows into _TABLE using multi-row VALUES statements.
+
+        Rows are split into chunks so no statement binds more than
+        _MAX_SQL_VARIABLES parameters.
+
+        Args:
+            conn: Connection to execute on.
+            rows: Row tuples in _COLUMNS order.
+        """
+        if not rows:
+            return
+        table, column_list = self._identifiers()
+        placeholder = "(" + ", ".join("?" * len(self._COLUMNS)) + ")"
+        # Identifiers come from the validated class constants; values are bound.
+        sql = f"INSERT INTO {table} ({column_list}) VALUES "  # nosec B608
+        chunk_size = max(1, _MAX_SQL_VARIABLES // len(self._COLUMNS))
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            conn.execute(
+                sql + ", ".join([placeholder] * len(chunk)),
+                [value for row in chunk for value in row],
+            )
+
+    def _fetchall_in(
+        self,
+        column: str,
+        values: Iterable,
+        select: Sequence[str] = (),
+        where: Optional[dict[str, object]] = None,
+    ) -> list[tuple]:
+        """Fetch rows from _TABLE whose column matches any of values.
+
+        Uses chunked ``IN (...)`` queries so no statement binds more than
+        _MAX_SQL_VARIABLES parameters.
+
+        Args:
+            column: Column compared against values.
+            values: Values for the IN list (duplicates are ignored).
+            select: Columns to return; defaults to all of _COLUMNS.
+            where: Extra ``column = value`` filters ANDed before the IN list.
+
+        Returns:
+            Rows from all chunks, in chunk order.
+        """
+        where = where or {}
+        table, column_list = self._identifiers(*select)
+        self._identifiers(column, *where)
+        params = tuple(where.values())
+        conditions = "".join(f"{name} = ? AND " for name in where)
+        # Identifiers come from the validated class constants; values are bound.
+        sql = f"SELECT {column_list} FROM {table} WHERE {conditions}{column} IN "  # nosec B608
+        unique = list(dict.fromkeys(values))
+        chunk_size = _MAX_SQL_VARIABLES - len(params)
+        rows: list[tuple] = []
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start : start + chunk_size]
+            rows.extend(
+                self.storage.fetchall(
+                    sql + "(" + ", ".join("?" * len(chunk)) + ")", (*params, *chunk)
+                )
+            )
+        return rows
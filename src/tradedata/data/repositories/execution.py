@@ -9,6 +9,10 @@ from tradedata.data.repositories.base import BaseRepository
 class ExecutionRepository(BaseRepository[Execution]):
     """Repository for Execution entities."""
 
+    _TABLE = "executions"
+    # Column order matches Execution.to_db_tuple()
+    _COLUMNS = ("id", "order_id", "leg_id", "price", "quantity", "timestamp", "settlement_date")
+
     def get_by_id(self, entity_id: str) -> Optional[Execution]:
         """Get execution by ID."""
         row = self.storage.fetchone(
@@ -1,6 +1,6 @@
 """Repository for OptionLeg entities."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from tradedata.data.models import OptionLeg
 from tradedata.data.repositories.base import BaseRepository
@@ -9,6 +9,19 @@ from tradedata.data.repositories.base import BaseRepository
 class OptionLegRepository(BaseRepository[OptionLeg]):
     """Repository for OptionLeg entities."""
 
+    _TABLE = "option_legs"
+    # Column order matches OptionLeg.to_db_tuple()
+    _COLUMNS = (
+        "id",
+        "order_id",
+        "strike_price",
+        "expiration_date",
+        "option_type",
+        "side",
+        "position_effect",
+        "ratio_quantity",
+    )
+
     def get_by_id(self, entity_id: str) -> Optional[OptionLeg]:
         """Get option leg by ID."""
         row = self.storage.fetchone(
@@ -119,3 +132,8 @@ class OptionLegRepository(BaseRepository[OptionLeg]):
             (order_id,),
         )
         return [OptionLeg.from_db_row(row) for row in rows]
+
+    def find_by_order_ids(self, order_ids: Iterable[str]) -> list[OptionLeg]:
+        """Find option legs for any of the given order IDs with batched lookups."""
+        rows = self._fetchall_in("order_id", order_ids)
+        return [OptionLeg.from_db_row(row) for row in rows]
@@ -1,6 +1,6 @@
 """Repository for OptionOrder entities."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from tradedata.data.models import OptionOrder
 from tradedata.data.repositories.base import BaseRepository
@@ -9,6 +9,18 @@ from tradedata.data.repositories.base import BaseRepository
 class OptionOrderRepository(BaseRepository[OptionOrder]):
     """Repository for OptionOrder entities."""
 
+    _TABLE = "option_orders"
+    # Column order matches OptionOrder.to_db_tuple()
+    _COLUMNS = (
+        "id",
+        "chain_symbol",
+        "opening_strategy",
+        "closing_strategy",
+        "direction",
+        "premium",
+        "net_amount",
+    )
+
     def get_by_id(self, entity_id: str) -> Optional[OptionOrder]:
         """Get option order by ID."""
         row = self.storage.fetchone(
@@ -94,6 +106,11 @@ class OptionOrderRepository(BaseRepository[OptionOrder]):
             cursor = tx_conn.execute("DELETE FROM option_orders WHERE id = ?", (entity_id,))
             return bool(cursor.rowcount > 0)
 
+    def find_by_ids(self, ids: Iterable[str]) -> list[OptionOrder]:
+        """Find option orders for the given IDs with batched lookups."""
+        rows = self._fetchall_in("id", ids)
+        return [OptionOrder.from_db_row(row) for row in rows]
+
     def find_all(self) -> list[OptionOrder]:
         """Find all option orders."""
         rows = self.storage.fetchall(
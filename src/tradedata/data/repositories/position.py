@@ -9,6 +9,20 @@ from tradedata.data.repositories.base import BaseRepository
 class PositionRepository(BaseRepository[Position]):
     """Repository for Position entities."""
 
+    _TABLE = "positions"
+    # Column order matches Position.to_db_tuple()
+    _COLUMNS = (
+        "id",
+        "source",
+        "account_id",
+        "symbol",
+        "quantity",
+        "cost_basis",
+        "current_price",
+        "unrealized_pnl",
+        "last_updated",
+    )
+
     def get_by_id(self, entity_id: str) -> Optional[Position]:
         """Get position by ID."""
         row = self.storage.fetchone(
@@ -1,6 +1,6 @@
 """Repository for StockOrder entities."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from tradedata.data.models import StockOrder
 from tradedata.data.repositories.base import BaseRepository
@@ -9,6 +9,10 @@ from tradedata.data.repositories.base import BaseRepository
 class StockOrderRepository(BaseRepository[StockOrder]):
     """Repository for StockOrder entities."""
 
+    _TABLE = "stock_orders"
+    # Column order matches StockOrder.to_db_tuple()
+    _COLUMNS = ("id", "symbol", "side", "quantity", "price", "average_price")
+
     def get_by_id(self, entity_id: str) -> Optional[StockOrder]:
         """Get stock order by ID."""
         row = self.storage.fetchone(
@@ -86,6 +90,11 @@ class StockOrderRepository(BaseRepository[StockOrder]):
             cursor = tx_conn.execute("DELETE FROM stock_orders WHERE id = ?", (entity_id,))
             return bool(cursor.rowcount > 0)
 
+    def find_by_ids(self, ids: Iterable[str]) -> list[StockOrder]:
+        """Find stock orders for the given IDs with batched lookups."""
+        rows = self._fetchall_in("id", ids)
+        return [StockOrder.from_db_row(row) for row in rows]
+
     def find_all(self) -> list[StockOrder]:
         """Find all stock orders."""
         rows = self.storage.fetchall(
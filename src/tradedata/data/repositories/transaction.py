@@ -1,6 +1,6 @@
 """Repository for Transaction entities."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from tradedata.data.models import Transaction
 from tradedata.data.repositories.base import BaseRepository
@@ -9,6 +9,10 @@ from tradedata.data.repositories.base import BaseRepository
 class TransactionRepository(BaseRepository[Transaction]):
     """Repository for Transaction entities."""
 
+    _TABLE = "transactions"
+    # Column order matches Transaction.to_db_tuple()
+    _COLUMNS = ("id", "source", "source_id", "type", "created_at", "account_id", "raw_data")
+
     def exists_by_source_id(self, source: str, source_id: str) -> bool:
         """Check if a transaction exists for a given source/source_id."""
         row = self.storage.fetchone(
@@ -19,6 +23,17 @@ class TransactionRepository(BaseRepository[Transaction]):
         )
         return row is not None
 
+    def find_existing_source_ids(self, source: str, source_ids: Iterable[str]) -> set[str]:
+        """Return the subset of source_ids already stored for a source.
+
+        Looks up the whole batch with chunked IN (...) queries instead of one
+        query per ID.
+        """
+        rows = self._fetchall_in(
+            "source_id", source_ids, select=("source_id",), where={"source": source}
+        )
+        return {row[0] for row in rows}
+
     def get_by_id(self, entity_id: str) -> Optional[Transaction]:
         """Get transaction by ID."""
         row = self.storage.fetchone(
@@ -9,6 +9,16 @@ from tradedata.data.repositories.base import BaseRepository
 class TransactionLinkRepository(BaseRepository[TransactionLink]):
     """Repository for TransactionLink entities."""
 
+    _TABLE = "transaction_links"
+    # Column order matches TransactionLink.to_db_tuple()
+    _COLUMNS = (
+        "id",
+        "opening_transaction_id",
+        "closing_transaction_id",
+        "link_type",
+        "created_at",
+    )
+
     def get_by_id(self, entity_id: str) -> Optional[TransactionLink]:
         """Get transaction link by ID."""
         row = self.storage.fetchone(
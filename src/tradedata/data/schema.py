@@ -55,6 +55,15 @@ def create_database_directory(db_path: str) -> None:
     db_dir.mkdir(parents=True, exist_ok=True)
 
 
+def enable_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply the pragmas every tradedata connection relies on.
+
+    Args:
+        conn: Connection to configure.
+    """
+    conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+
+
 def get_schema_sql() -> str:
     """Get SQL schema for all tables.
 
@@ -180,7 +189,7 @@ def initialize_database(db_path: Optional[str] = None) -> sqlite3.Connection:
     create_database_directory(path)
 
     conn = sqlite3.connect(path)
-    conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+    enable_pragmas(conn)
 
     schema_sql = get_schema_sql()
     conn.executescript(schema_sql)
@@ -1,5 +1,6 @@
 """Low-level SQLite storage operations with connection and transaction management."""
 
+import os
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
@@ -7,10 +8,15 @@ from typing import Optional
 
 from tradedata.data.schema import (
     create_database_directory,
+    enable_pragmas,
     get_db_path,
     get_schema_sql,
 )
 
+# Set to "1" for throwaway databases (e.g., test suites): skips journaling to
+# disk and fsync entirely, trading crash safety for write speed
+FAST_ENV_VAR = "TRADEDATA_TEST_FAST"
+
 
 class Storage:
     """Low-level SQLite storage with connection and transaction management.
@@ -33,6 +39,8 @@ class Storage:
         """
         self._db_path = get_db_path(db_path)
         self._connection: Optional[sqlite3.Connection] = None
+        # Number of transaction() blocks currently open on this storage
+        self._transaction_depth = 0
         self._ensure_database_initialized()
 
     @property
@@ -53,24 +61,48 @@ class Storage:
         if self._db_path != ":memory:":
             db_file = Path(self._db_path)
             if not db_file.exists():
-                # Create and initialize database
-                conn = sqlite3.connect(self._db_path)
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.executescript(get_schema_sql())
-                conn.close()
+                # Create and initialize database, keeping the connection for reuse
+                self.connect().executescript(get_schema_sql())
 
     def connect(self) -> sqlite3.Connection:
         """Get or create a database connection.
 
+        The connection is opened once and reused by every repository sharing
+        this Storage until close() is called.
+
         Returns:
-            SQLite connection. Connection has foreign keys enabled.
+            SQLite connection in autocommit mode: statements outside
+            transaction() commit immediately. Connection has foreign keys
+            enabled; file databases also use WAL journaling with
+            synchronous=NORMAL, or an in-memory journal with synchronous=OFF
+            when TRADEDATA_TEST_FAST=1.
         """
         if self._connection is None:
-            self._connection = sqlite3.connect(self._db_path)
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            # Repositories issue dozens of distinct statements (plus one per
+            # batch size from multi-row inserts); keep them all prepared.
+            # isolation_level=None: transaction() issues BEGIN itself rather than
+            # relying on the sqlite3 module's implicit transactions around DML
+            self._connection = sqlite3.connect(
+                self._db_path, isolation_level=None, cached_statements=256
+            )
+            enable_pragmas(self._connection)
             # Initialize schema for in-memory databases
             if self._db_path == ":memory:":
                 self._connection.executescript(get_schema_sql())
+            elif os.getenv(FAST_ENV_VAR) == "1":
+                self._connection.execute("PRAGMA journal_mode = MEMORY")
+                self._connection.execute("PRAGMA synchronous = OFF")
+                self._connection.execute("PRAGMA temp_store = MEMORY")
+            else:
+                # WAL with synchronous=NORMAL syncs once per checkpoint rather
+                # than twice per commit, and stays durable across app crashes
+                self._connection.execute("PRAGMA journal_mode = WAL")
+                self._connection.execute("PRAGMA synchronous = NORMAL")
+                self._connection.execute("PRAGMA temp_store = MEMORY")
+                # Negative cache_size is in KiB: 64 MiB page cache
+                self._connection.execute("PRAGMA cache_size = -65536")
+                # Read pages through a memory map (up to 256 MiB) instead of read() calls
+                self._connection.execute("PRAGMA mmap_size = 268435456")
         return self._connection
 
     def close(self) -> None:
@@ -91,7 +123,9 @@ class Storage:
     def transaction(self):
         """Context manager for database transactions.
 
-        Automatically commits on success, rolls back on exception.
+        Automatically commits on success, rolls back on exception. Nested
+        blocks use SAVEPOINTs: an inner failure undoes only the inner block,
+        and nothing is committed until the outermost block exits.
 
         Yields:
             SQLite connection for use within transaction.
@@ -102,12 +136,33 @@ class Storage:
                 conn.execute("UPDATE ...")
         """
         conn = self.connect()
+        depth = self._transaction_depth
+        self._transaction_depth += 1
         try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+            if depth == 0:
+                conn.execute("BEGIN")
+                try:
+                    yield conn
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+            else:
+                # Open the outer transaction explicitly; releasing a savepoint
+                # that started the transaction would commit it
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                savepoint = f"sp_{depth}"
+                conn.execute(f"SAVEPOINT {savepoint}")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                    raise
+                conn.execute(f"RELEASE {savepoint}")
+        finally:
+            self._transaction_depth -= 1
 
     def execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
         """Execute a single SQL statement.
@@ -119,7 +174,10 @@ class Storage:
         Returns:
             Cursor with results. Use cursor.lastrowid to get inserted row ID.
         """
-        conn = self.connect()
+        # Read the open connection directly; connect() is only needed the first time
+        conn = self._connection
+        if conn is None:
+            conn = self.connect()
         return conn.execute(sql, parameters)
 
     def executemany(self, sql: str, parameters: list[tuple]) -> sqlite3.Cursor:
@@ -132,7 +190,9 @@ class Storage:
         Returns:
             Cursor with results.
         """
-        conn = self.connect()
+        conn = self._connection
+        if conn is None:
+            conn = self.connect()
         return conn.executemany(sql, parameters)
 
     def executescript(self, sql: str) -> None:
@@ -141,7 +201,9 @@ class Storage:
         Args:
             sql: SQL script with multiple statements.
         """
-        conn = self.connect()
+        conn = self._connection
+        if conn is None:
+            conn = self.connect()
         conn.executescript(sql)
 
     def fetchone(self, sql: str, parameters: tuple = ()) -> Optional[tuple]:
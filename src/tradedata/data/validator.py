@@ -4,7 +4,9 @@ Validates normalized data to ensure integrity before storage.
 Fails hard and fast on any validation error.
 """
 
+import re
 from datetime import datetime
+from functools import lru_cache
 
 from tradedata.data.models import (
     Execution,
@@ -16,6 +18,9 @@ from tradedata.data.models import (
     TransactionLink,
 )
 
+# 8-4-4-4-12 hyphen-separated groups, compiled once at import
+_UUID_SHAPE = re.compile(r"[^-]{8}-[^-]{4}-[^-]{4}-[^-]{4}-[^-]{12}")
+
 
 class ValidationError(Exception):
     """Raised when data validation fails."""
@@ -23,9 +28,13 @@ class ValidationError(Exception):
     pass
 
 
+# Expiration and settlement dates repeat across most legs and executions in a sync
+@lru_cache(maxsize=1024)
 def _is_valid_iso_timestamp(timestamp: str) -> bool:
     """Check if string is valid ISO 8601 timestamp.
 
+    Results are memoized per string; callers only pass str values.
+
     Args:
         timestamp: String to validate
 
@@ -54,14 +63,8 @@ def _is_uuid(value: str) -> bool:
     """
     try:
         # Simple UUID check: 36 chars, hyphens in right places
-        if len(value) != 36:
-            return False
-        parts = value.split("-")
-        if len(parts) != 5:
-            return False
-        # Check lengths: 8-4-4-4-12
-        return [len(p) for p in parts] == [8, 4, 4, 4, 12]
-    except (AttributeError, TypeError):
+        return _UUID_SHAPE.fullmatch(value) is not None
+    except TypeError:
         return False
 
 
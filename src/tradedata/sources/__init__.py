@@ -8,16 +8,14 @@ This package provides:
 
 from tradedata.sources.base import DataSourceAdapter
 from tradedata.sources.factory import SourceFactory, create_adapter, get_factory
-from tradedata.sources.robinhood import RobinhoodAdapter
 
-# Auto-register common adapters
-_factory = get_factory()
-if not _factory.is_registered("robinhood"):
-    _factory.register("robinhood", RobinhoodAdapter)
+# Importing adapters registers them with the default factory via `source_name`
+from tradedata.sources.robinhood import RobinhoodAdapter
 
 __all__ = [
     "DataSourceAdapter",
     "SourceFactory",
     "create_adapter",
+    "get_factory",
     "RobinhoodAdapter",
 ]
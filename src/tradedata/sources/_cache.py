@@ -0,0 +1,133 @@
+"""TTL cache for data source extraction calls, persisted in SQLite.
+
+Used by DataSourceAdapter subclasses that set `cache_ttl` to avoid re-hitting
+rate-limited broker APIs for identical requests.
+
+Results are stored as plain JSON text in the cache database, so brokerage
+responses are written to disk unencrypted. The JSON round trip also means cache
+hits only return JSON-native types (e.g., tuples come back as lists).
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# (process ID, cache path) -> open connection, so each process connects once per path
+_connections: dict[tuple[int, str], sqlite3.Connection] = {}
+_lock = threading.Lock()
+
+
+def get_cache_path() -> str:
+    """Get cache database path from environment variable or default.
+
+    Priority:
+    1. TRADEDATA_CACHE_PATH environment variable
+    2. Default: ~/.tradedata/cache.db
+
+    Returns:
+        Cache database path as string.
+    """
+    env_path = os.getenv("TRADEDATA_CACHE_PATH")
+    if env_path:
+        return env_path
+    return str(Path.home() / ".tradedata" / "cache.db")
+
+
+def _connect(cache_path: str) -> sqlite3.Connection:
+    """Return this process's cache connection, creating directory and table on first use.
+
+    Callers must hold _lock, since the connection is shared across threads.
+    """
+    key = (os.getpid(), cache_path)
+    conn = _connections.get(key)
+    if conn is not None:
+        return conn
+    if cache_path != ":memory:":
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path, check_same_thread=False)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS source_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        """
+    )
+    _connections[key] = conn
+    return conn
+
+
+def _make_key(owner: str, scope: str, method: str, args: tuple, kwargs: dict[str, Any]) -> str:
+    """Hash the call signature into a stable cache key."""
+    payload = json.dumps([owner, scope, method, list(args), sorted(kwargs.items())], default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cached_source_call(ttl: int = 3600) -> Callable[[F], F]:
+    """Cache a source extraction method's JSON-serializable result for `ttl` seconds.
+
+    Keyed by (module-qualified adapter class, adapter cache_scope(), method name,
+    args, kwargs), so cached results are shared only across instances of the same
+    class and scope.
+    Results are stored unencrypted as JSON, and cache hits return the decoded JSON
+    (tuples become lists), so only use this for JSON-native results.
+
+    Args:
+        ttl: Time-to-live in seconds for cached results.
+
+    Returns:
+        Decorator for adapter methods.
+    """
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            owner = type(self)
+            key = _make_key(
+                f"{owner.__module__}.{owner.__qualname__}",
+                self.cache_scope(),
+                fn.__name__,
+                args,
+                kwargs,
+            )
+            cache_path = get_cache_path()
+            with _lock:
+                row = (
+                    _connect(cache_path)
+                    .execute(
+                        "SELECT value FROM source_cache WHERE key = ? AND expires_at > ?",
+                        (key, time.time()),
+                    )
+                    .fetchone()
+                )
+            if row is not None:
+                return json.loads(row[0])
+
+            result = fn(self, *args, **kwargs)
+            value = json.dumps(result)
+            with _lock:
+                conn = _connect(cache_path)
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO source_cache (key, value, expires_at)
+                        VALUES (?, ?, ?)
+                        """,
+                        (key, value, time.time() + ttl),
+                    )
+            return result
+
+        # Lets DataSourceAdapter re-wrap inherited methods with a subclass's TTL
+        wrapper._uncached = fn  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -3,10 +3,15 @@
 Provides unified interface for extracting and normalizing data from different sources.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Iterable, Iterator, Optional
 
-from tradedata.data.models import Transaction
+from tradedata.data.models import Position, Transaction
+from tradedata.sources._cache import cached_source_call
+
+# Extraction methods wrapped with cached_source_call when cache_ttl is set
+_CACHED_METHODS = ("extract_transactions", "extract_positions")
 
 
 class DataSourceAdapter(ABC):
@@ -19,8 +24,55 @@ class DataSourceAdapter(ABC):
     1. Implement extract_transactions() to fetch raw transaction data
     2. Implement extract_positions() to fetch current positions
     3. Implement normalize_transaction() to convert source-specific format to unified schema
+
+    Async variants (extract_transactions_async(), extract_positions_async()) default to
+    running the synchronous methods in a worker thread; adapters backed by an async
+    HTTP client can override them directly.
+
+    Subclasses may set `cache_ttl` (seconds) to cache extract_transactions() and
+    extract_positions() results on disk, keyed by adapter class, cache_scope() and
+    call arguments. Cached responses are stored unencrypted; see
+    tradedata.sources._cache. iter_transactions() is not cached itself: the default
+    implementation reads through extract_transactions(), but adapters that override
+    it (e.g., RobinhoodAdapter, as used by sync) always fetch from the source.
+
+    Subclasses declared with a `source_name` class keyword are registered with the
+    default factory at import time:
+
+        class RobinhoodAdapter(DataSourceAdapter, source_name="robinhood"):
+            ...
     """
 
+    _REGISTRY: ClassVar[dict[str, type["DataSourceAdapter"]]] = {}
+    cache_ttl: Optional[int] = None
+
+    def __init_subclass__(cls, source_name: Optional[str] = None, **kwargs: Any) -> None:
+        """Register the subclass under `source_name` and apply extraction caching.
+
+        Args:
+            source_name: Optional source name to auto-register the adapter under.
+
+        Raises:
+            ValueError: If source_name is already registered.
+        """
+        super().__init_subclass__(**kwargs)
+        if source_name is not None:
+            if source_name in DataSourceAdapter._REGISTRY:
+                raise ValueError(f"Source '{source_name}' is already registered")
+            DataSourceAdapter._REGISTRY[source_name] = cls
+
+        # Re-wrap inherited methods too, so a subclass's cache_ttl (including None)
+        # applies to everything it exposes, not just the methods it overrides
+        for name in _CACHED_METHODS:
+            method = getattr(cls, name)
+            original = getattr(method, "_uncached", method)
+            if getattr(original, "__isabstractmethod__", False):
+                continue
+            if cls.cache_ttl is not None:
+                setattr(cls, name, cached_source_call(cls.cache_ttl)(original))
+            elif original is not method:
+                setattr(cls, name, original)
+
     @abstractmethod
     def extract_transactions(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
@@ -41,6 +93,47 @@ class DataSourceAdapter(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release resources held by the adapter (e.g., pooled HTTP connections).
+
+        The default implementation does nothing.
+        """
+
+    def cache_scope(self) -> str:
+        """Identify the account this instance reads, for extraction cache keys.
+
+        Adapters with `cache_ttl` set should override this so instances logged in
+        to different accounts never share cached results.
+
+        Returns:
+            Scope string; the default empty scope is shared by all instances.
+        """
+        return ""
+
+    def iter_transactions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Extract transactions from source as a stream of chunks.
+
+        Default implementation slices the result of extract_transactions();
+        adapters that fetch in pages or per endpoint can override it to yield
+        each chunk as soon as it arrives.
+
+        Args:
+            start_date: Optional start date filter (ISO format string, e.g., '2025-01-01')
+            end_date: Optional end date filter (ISO format string, e.g., '2025-12-31')
+            page_size: Maximum number of transactions per yielded chunk.
+
+        Yields:
+            Lists of raw transaction dictionaries, each at most page_size long.
+        """
+        transactions = self.extract_transactions(start_date, end_date)
+        for offset in range(0, len(transactions), page_size):
+            yield transactions[offset : offset + page_size]
+
     @abstractmethod
     def extract_positions(self) -> list[dict[str, Any]]:
         """Extract current positions from source.
@@ -69,3 +162,101 @@ class DataSourceAdapter(ABC):
             ValueError: If raw_transaction is missing required fields.
         """
         pass
+
+    async def extract_transactions_async(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Extract transactions from source without blocking the event loop.
+
+        Args:
+            start_date: Optional start date filter (ISO format string, e.g., '2025-01-01')
+            end_date: Optional end date filter (ISO format string, e.g., '2025-12-31')
+
+        Returns:
+            List of raw transaction dictionaries, as returned by extract_transactions().
+        """
+        return await asyncio.to_thread(self.extract_transactions, start_date, end_date)
+
+    async def extract_positions_async(self) -> list[dict[str, Any]]:
+        """Extract current positions from source without blocking the event loop.
+
+        Returns:
+            List of raw position dictionaries, as returned by extract_positions().
+        """
+        return await asyncio.to_thread(self.extract_positions)
+
+    async def extract_many(
+        self, date_ranges: Iterable[tuple[Optional[str], Optional[str]]]
+    ) -> list[list[dict[str, Any]]]:
+        """Extract transactions for several date ranges concurrently.
+
+        Args:
+            date_ranges: Iterable of (start_date, end_date) tuples.
+
+        Returns:
+            One list of raw transaction dictionaries per date range, in input order.
+        """
+        results = await asyncio.gather(
+            *(self.extract_transactions_async(start, end) for start, end in date_ranges)
+        )
+        return list(results)
+
+    def normalize_transactions(self, raw_transactions: list[dict[str, Any]]) -> list[Transaction]:
+        """Convert a batch of source-specific transactions to unified schema.
+
+        Default implementation calls normalize_transaction() per item; adapters
+        can override it to amortize per-row setup across the batch.
+
+        Args:
+            raw_transactions: Raw transaction dictionaries from extract_transactions()
+
+        Returns:
+            Transaction model instances, in input order.
+
+        Raises:
+            ValueError: If any raw transaction is missing required fields.
+        """
+        return [self.normalize_transaction(raw) for raw in raw_transactions]
+
+    def normalize_position(self, raw_position: dict[str, Any]) -> Position:
+        """Convert a source-specific position to unified schema.
+
+        Args:
+            raw_position: Raw position dictionary from extract_positions()
+
+        Returns:
+            Position model instance with normalized data.
+
+        Raises:
+            NotImplementedError: If the adapter does not support positions.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not normalize positions")
+
+    def normalize_positions(self, raw_positions: list[dict[str, Any]]) -> list[Position]:
+        """Convert a batch of source-specific positions to unified schema.
+
+        Default implementation calls normalize_position() per item; adapters
+        can override it to amortize per-row setup across the batch.
+
+        Args:
+            raw_positions: Raw position dictionaries from extract_positions()
+
+        Returns:
+            Position model instances, in input order.
+        """
+        return [self.normalize_position(raw) for raw in raw_positions]
+
+    def classify_transaction(self, raw_transaction: dict[str, Any]) -> Optional[str]:
+        """Return the type normalize_transaction() would assign, if cheaply known.
+
+        Lets callers drop unwanted transaction types before paying for full
+        normalization (including raw_data serialization). Default returns None,
+        meaning the type is only known after normalizing.
+
+        Args:
+            raw_transaction: Raw transaction dictionary from extract_transactions()
+
+        Returns:
+            Transaction type string, or None if unknown without normalizing.
+        """
+        return None
@@ -3,6 +3,7 @@
 Provides a unified way to create and register data source adapters.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Type
 
 from tradedata.sources.base import DataSourceAdapter
@@ -23,9 +24,15 @@ class SourceFactory:
         adapter = factory.create_adapter('robinhood')
     """
 
-    def __init__(self):
-        """Initialize factory with empty registry."""
-        self._registry: dict[str, Type[DataSourceAdapter]] = {}
+    def __init__(self, registry: Optional[dict[str, Type[DataSourceAdapter]]] = None):
+        """Initialize factory with an optional shared registry.
+
+        Args:
+            registry: Optional registry dict to use; defaults to a new empty registry.
+        """
+        self._registry: dict[str, Type[DataSourceAdapter]] = (
+            registry if registry is not None else {}
+        )
 
     def register(self, source_name: str, adapter_class: Type[DataSourceAdapter]) -> None:
         """Register a new source adapter type.
@@ -62,15 +69,56 @@ class SourceFactory:
         Raises:
             ValueError: If source_name is not registered.
         """
-        if source_name not in self._registry:
+        try:
+            adapter_class = self._registry[source_name]
+        except KeyError:
             available = ", ".join(self._registry.keys()) if self._registry else "none"
             raise ValueError(
                 f"Source '{source_name}' is not registered. Available sources: {available}"
-            )
+            ) from None
 
-        adapter_class = self._registry[source_name]
         return adapter_class(*args, **kwargs)
 
+    def extract_all(
+        self,
+        sources: dict[str, dict[str, Any]],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Extract transactions from several sources concurrently.
+
+        Each source's extract_transactions() call runs in its own worker thread,
+        since calls to independent brokers block on separate network requests.
+        Every adapter created here is closed before returning, even on error.
+
+        Args:
+            sources: Mapping of source name to adapter constructor keyword arguments.
+            start_date: Optional start date filter (ISO format string)
+            end_date: Optional end date filter (ISO format string)
+
+        Returns:
+            Mapping of source name to its list of raw transaction dictionaries.
+
+        Raises:
+            ValueError: If any source name is not registered.
+        """
+        if not sources:
+            return {}
+
+        adapters: dict[str, DataSourceAdapter] = {}
+        try:
+            for name, kwargs in sources.items():
+                adapters[name] = self.create_adapter(name, **kwargs)
+            with ThreadPoolExecutor(max_workers=min(16, len(adapters))) as executor:
+                futures = {
+                    name: executor.submit(adapter.extract_transactions, start_date, end_date)
+                    for name, adapter in adapters.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+        finally:
+            for adapter in adapters.values():
+                adapter.close()
+
     def is_registered(self, source_name: str) -> bool:
         """Check if a source is registered.
 
@@ -91,19 +139,20 @@ class SourceFactory:
         return list(self._registry.keys())
 
 
-# Global factory instance
-_default_factory: Optional[SourceFactory] = None
+# Global factory instance, created at import time so get_factory() needs no lazy
+# initialization (and no lock) when called from multiple threads.
+_default_factory: SourceFactory = SourceFactory(registry=DataSourceAdapter._REGISTRY)
 
 
 def get_factory() -> SourceFactory:
     """Get the default global factory instance.
 
+    The default factory shares the registry populated by adapters declared with
+    a `source_name` class keyword.
+
     Returns:
         Global SourceFactory instance.
     """
-    global _default_factory
-    if _default_factory is None:
-        _default_factory = SourceFactory()
     return _default_factory
 
 
@@ -3,16 +3,15 @@
 Extracts and normalizes trading data from Robinhood API using robin_stocks library.
 """
 
-import json
-import uuid
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional, Protocol, cast
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Protocol, cast
 
 try:
     import robin_stocks.robinhood as rh_module
 except ImportError:
     rh_module = None  # type: ignore
 
+from tradedata.data.ids import new_ids
 from tradedata.data.models import (
     Execution,
     OptionLeg,
@@ -23,6 +22,184 @@ from tradedata.data.models import (
 )
 from tradedata.sources.base import DataSourceAdapter
 
+_UTC = timezone.utc
+_MIDNIGHT = datetime.min.time()
+# Open date-filter bounds
+_MIN_UTC = datetime.min.replace(tzinfo=_UTC)
+_MAX_UTC = datetime.max.replace(tzinfo=_UTC)
+
+# Timestamp fields in priority order, across orders, dividends and transfers
+_TIMESTAMP_FIELDS = (
+    "created_at",
+    "updated_at",
+    "last_transaction_at",
+    "execution_date",
+    "timestamp",
+    "payable_date",
+    "record_date",
+    "expected_landing_datetime",
+    "expected_landing_date",
+)
+
+# Option leg expiration date fields in priority order
+_EXPIRATION_FIELDS = ("expiration_date", "expires_at", "expiry", "expiration")
+
+
+# Known option type / side / position effect spellings -> canonical lowercase string,
+# so common values reuse one string object instead of allocating via str.lower()
+_CANONICAL_LOWER = {
+    variant: canonical
+    for canonical in ("call", "put", "buy", "sell", "open", "close")
+    for variant in (canonical, canonical.capitalize(), canonical.upper())
+}
+
+
+def _lower(value: str) -> str:
+    """Lowercase an enum-like API value, reusing canonical strings when known."""
+    return _CANONICAL_LOWER.get(value) or value.lower()
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO string with a 'Z' suffix."""
+    return datetime.now(_UTC).replace(tzinfo=None).isoformat() + "Z"
+
+
+def _lazy_utc_now() -> Callable[[], str]:
+    """Return a function giving _utc_now_iso(), read from the clock on first call only."""
+    cached: list[str] = []
+
+    def now() -> str:
+        if not cached:
+            cached.append(_utc_now_iso())
+        return cached[0]
+
+    return now
+
+
+def _utc_sort_key(value: str) -> Optional[str]:
+    """Return a string key that orders like the timestamp, for Robinhood UTC formats.
+
+    Robinhood timestamps are UTC with a 'Z' suffix, with or without microseconds
+    (e.g., '2025-01-15T10:30:00.123456Z'). Normalized to microsecond precision their
+    string order is their time order, so no datetime needs to be built.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Key in 'YYYY-MM-DDTHH:MM:SS.ffffffZ' form, or None for any other format
+    """
+    if len(value) == 27 and value[26] == "Z" and value[19] == "." and value[10] == "T":
+        return value
+    if len(value) == 20 and value[19] == "Z" and value[10] == "T":
+        return value[:19] + ".000000Z"
+    return None
+
+
+def _utc_sort_key_from_datetime(value: datetime) -> str:
+    """Format a timezone-aware datetime as a key comparable with _utc_sort_key()."""
+    utc_value = value.astimezone(_UTC).replace(tzinfo=None)
+    return utc_value.isoformat(timespec="microseconds") + "Z"
+
+
+def _empty_raw_data(raw: dict[str, Any]) -> str:
+    """Return an empty JSON object in place of serialized raw data."""
+    return "{}"
+
+
+class _ResolvedAPI(NamedTuple):
+    """robin_stocks callables resolved for a specific module object."""
+
+    get_stock_orders: Callable[[], list[dict[str, Any]]]
+    get_option_orders: Callable[[], list[dict[str, Any]]]
+    get_stock_positions: Callable[[], list[dict[str, Any]]]
+    get_option_positions: Callable[[], list[dict[str, Any]]]
+    get_symbol_by_url: Callable[[str], Optional[str]]
+    get_dividends: Callable[[], list[dict[str, Any]]]
+    get_bank_transfers: Callable[[], list[dict[str, Any]]]
+    get_crypto_orders: Callable[[], list[dict[str, Any]]]
+
+
+# Field -> (label, candidate attribute paths tried in order)
+_API_CANDIDATES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "get_stock_orders": (
+        "stock orders",
+        ("orders.get_all_stock_orders", "get_all_stock_orders"),
+    ),
+    "get_option_orders": (
+        "option orders",
+        ("options.get_all_option_orders", "get_all_option_orders"),
+    ),
+    "get_stock_positions": (
+        "stock positions",
+        ("stocks.get_all_stock_positions", "get_open_stock_positions", "get_all_positions"),
+    ),
+    "get_option_positions": (
+        "option positions",
+        ("options.get_all_option_positions", "get_open_option_positions", "get_all_positions"),
+    ),
+    "get_symbol_by_url": (
+        "symbol resolution by instrument URL",
+        ("stocks.get_symbol_by_url", "get_symbol_by_url"),
+    ),
+    "get_dividends": ("dividends", ("get_dividends",)),
+    "get_bank_transfers": ("bank transfers", ("get_bank_transfers",)),
+    "get_crypto_orders": (
+        "crypto orders",
+        ("crypto.get_all_crypto_orders", "get_all_crypto_orders"),
+    ),
+}
+
+
+def _resolve_callable(rh_module: Any, candidates: tuple[str, ...], label: str) -> Any:
+    """Return the first callable found at one of the candidate attribute paths.
+
+    Args:
+        rh_module: robin_stocks.robinhood module (or compatible object)
+        candidates: Dotted attribute paths to try in order
+        label: Human-readable API name for the error message
+
+    Returns:
+        Resolved callable
+
+    Raises:
+        AttributeError: If none of the candidates resolve to a callable.
+    """
+    for path in candidates:
+        fn = rh_module
+        for part in path.split("."):
+            fn = getattr(fn, part, None)
+        if callable(fn):
+            return fn
+    raise AttributeError(
+        f"robin_stocks missing required API for {label}. Expected one of: {list(candidates)}"
+    )
+
+
+def _get_session(rh_module: Any) -> Any:
+    """Return robin_stocks' shared requests.Session, if the module exposes one."""
+    return getattr(getattr(rh_module, "helper", None), "SESSION", None)
+
+
+def _resolve_api(rh_module: Any) -> _ResolvedAPI:
+    """Resolve all required robin_stocks callables.
+
+    Args:
+        rh_module: robin_stocks.robinhood module (or compatible object)
+
+    Returns:
+        Resolved API callables
+
+    Raises:
+        AttributeError: If any required API is missing.
+    """
+    return _ResolvedAPI(
+        **{
+            field: _resolve_callable(rh_module, candidates, label)
+            for field, (label, candidates) in _API_CANDIDATES.items()
+        }
+    )
+
 
 class RobinhoodAPIWrapper:
     """Wrapper for robin_stocks.robinhood to provide flat method access.
@@ -37,179 +214,81 @@ class RobinhoodAPIWrapper:
 
         Args:
             rh_module: robin_stocks.robinhood module instance
+
+        Raises:
+            AttributeError: If the module is missing a required API.
         """
         self.rh = rh_module
+        # Callables resolved once per wrapper, so later wrappers see patched modules
+        self._api = _resolve_api(rh_module)
+        # HTTPS adapter replaced by configure_session(), restored by close()
+        self._previous_https_adapter: Optional[Any] = None
+
+    def configure_session(self) -> None:
+        """Mount a pooled, retrying HTTPS adapter on robin_stocks' shared session.
+
+        The existing session is kept (it carries the login headers); only its HTTPS
+        transport is replaced so endpoint fetches reuse warm connections and
+        transient GET failures are retried with backoff. close() restores the
+        original transport.
+        """
+        session = _get_session(self.rh)
+        if session is None or self._previous_https_adapter is not None:
+            return
 
-        def _resolve_callable(candidates: list[tuple[str, Any]], label: str):
-            for name, getter in candidates:
-                try:
-                    fn = getter()
-                except AttributeError:
-                    continue
-                if callable(fn):
-                    return fn
-            raise AttributeError(
-                f"robin_stocks missing required API for {label}. "
-                f"Expected one of: {[name for name, _ in candidates]}"
-            )
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
-        self._get_stock_orders: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [
-                    (
-                        "orders.get_all_stock_orders",
-                        lambda: getattr(
-                            getattr(self.rh, "orders", None), "get_all_stock_orders", None
-                        ),
-                    ),
-                    (
-                        "get_all_stock_orders",
-                        lambda: getattr(self.rh, "get_all_stock_orders", None),
-                    ),
-                ],
-                "stock orders",
-            ),
-        )
-        self._get_option_orders: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [
-                    (
-                        "options.get_all_option_orders",
-                        lambda: getattr(
-                            getattr(self.rh, "options", None), "get_all_option_orders", None
-                        ),
-                    ),
-                    (
-                        "get_all_option_orders",
-                        lambda: getattr(self.rh, "get_all_option_orders", None),
-                    ),
-                ],
-                "option orders",
-            ),
-        )
-        self._get_stock_positions: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [
-                    (
-                        "stocks.get_all_stock_positions",
-                        lambda: getattr(
-                            getattr(self.rh, "stocks", None), "get_all_stock_positions", None
-                        ),
-                    ),
-                    (
-                        "get_open_stock_positions",
-                        lambda: getattr(self.rh, "get_open_stock_positions", None),
-                    ),
-                    ("get_all_positions", lambda: getattr(self.rh, "get_all_positions", None)),
-                ],
-                "stock positions",
-            ),
-        )
-        self._get_option_positions: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [
-                    (
-                        "options.get_all_option_positions",
-                        lambda: getattr(
-                            getattr(self.rh, "options", None), "get_all_option_positions", None
-                        ),
-                    ),
-                    (
-                        "get_open_option_positions",
-                        lambda: getattr(self.rh, "get_open_option_positions", None),
-                    ),
-                    ("get_all_positions", lambda: getattr(self.rh, "get_all_positions", None)),
-                ],
-                "option positions",
-            ),
-        )
-        self._get_symbol_by_url: Callable[[str], Optional[str]] = cast(
-            Callable[[str], Optional[str]],
-            _resolve_callable(
-                [
-                    (
-                        "stocks.get_symbol_by_url",
-                        lambda: getattr(
-                            getattr(self.rh, "stocks", None), "get_symbol_by_url", None
-                        ),
-                    ),
-                    ("get_symbol_by_url", lambda: getattr(self.rh, "get_symbol_by_url", None)),
-                ],
-                "symbol resolution by instrument URL",
-            ),
-        )
-        self._get_dividends: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [("get_dividends", lambda: getattr(self.rh, "get_dividends", None))],
-                "dividends",
-            ),
-        )
-        self._get_bank_transfers: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [("get_bank_transfers", lambda: getattr(self.rh, "get_bank_transfers", None))],
-                "bank transfers",
-            ),
-        )
-        self._get_crypto_orders: Callable[[], list[dict[str, Any]]] = cast(
-            Callable[[], list[dict[str, Any]]],
-            _resolve_callable(
-                [
-                    (
-                        "crypto.get_all_crypto_orders",
-                        lambda: getattr(
-                            getattr(self.rh, "crypto", None), "get_all_crypto_orders", None
-                        ),
-                    ),
-                    (
-                        "get_all_crypto_orders",
-                        lambda: getattr(self.rh, "get_all_crypto_orders", None),
-                    ),
-                ],
-                "crypto orders",
-            ),
+        self._previous_https_adapter = session.adapters.get("https://")
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
         )
 
+    def close(self) -> None:
+        """Close the pooled HTTPS adapter and restore the session's original one."""
+        session = _get_session(self.rh)
+        if session is None or self._previous_https_adapter is None:
+            return
+        session.get_adapter("https://").close()
+        session.mount("https://", self._previous_https_adapter)
+        self._previous_https_adapter = None
+
     def login(self, username: str, password: str) -> dict[str, Any]:
         """Login to Robinhood account."""
         return cast(dict[str, Any], self.rh.login(username, password))
 
     def get_all_stock_orders(self) -> list[dict[str, Any]]:
         """Get all stock orders via orders.get_all_stock_orders()."""
-        return self._get_stock_orders() or []
+        return self._api.get_stock_orders() or []
 
     def get_all_option_orders(self) -> list[dict[str, Any]]:
         """Get all option orders via options.get_all_option_orders()."""
-        return self._get_option_orders() or []
+        return self._api.get_option_orders() or []
 
     def get_open_stock_positions(self) -> list[dict[str, Any]]:
         """Get open stock positions via stocks.get_all_stock_positions()."""
-        return self._get_stock_positions() or []
+        return self._api.get_stock_positions() or []
 
     def get_open_option_positions(self) -> list[dict[str, Any]]:
         """Get open option positions via options.get_all_option_positions()."""
-        return self._get_option_positions() or []
+        return self._api.get_option_positions() or []
 
     def get_symbol_by_url(self, instrument_url: str) -> Optional[str]:
         """Resolve symbol from instrument URL when provided by robin_stocks."""
-        return self._get_symbol_by_url(instrument_url)
+        return self._api.get_symbol_by_url(instrument_url)
 
     def get_dividends(self) -> list[dict[str, Any]]:
         """Get dividends."""
-        return self._get_dividends() or []
+        return self._api.get_dividends() or []
 
     def get_bank_transfers(self) -> list[dict[str, Any]]:
         """Get bank/ACH transfers."""
-        return self._get_bank_transfers() or []
+        return self._api.get_bank_transfers() or []
 
     def get_crypto_orders(self) -> list[dict[str, Any]]:
         """Get crypto orders."""
-        return self._get_crypto_orders() or []
+        return self._api.get_crypto_orders() or []
 
 
 class RobinhoodAPI(Protocol):
@@ -280,13 +359,15 @@ class RobinhoodAPI(Protocol):
         ...
 
 
-class RobinhoodAdapter(DataSourceAdapter):
+class RobinhoodAdapter(DataSourceAdapter, source_name="robinhood"):
     """Robinhood data source adapter.
 
     Implements DataSourceAdapter interface to extract and normalize
     trading data from Robinhood API.
 
-    Requires authentication via robin_stocks.login() before use.
+    Requires authentication via robin_stocks.login() before use. When built on
+    robin_stocks itself, the adapter tunes robin_stocks' shared HTTP session;
+    call close() when done to restore it.
     """
 
     def __init__(
@@ -294,6 +375,8 @@ class RobinhoodAdapter(DataSourceAdapter):
         username: Optional[str] = None,
         password: Optional[str] = None,
         robin_stocks: Optional[RobinhoodAPI] = None,
+        store_raw_data: bool = True,
+        raw_data_encoder: Optional[Callable[[dict[str, Any]], str]] = None,
     ):
         """Initialize Robinhood adapter.
 
@@ -303,6 +386,12 @@ class RobinhoodAdapter(DataSourceAdapter):
             robin_stocks: Robinhood API implementation (defaults to robin_stocks.robinhood).
                          Must implement RobinhoodAPI protocol.
                          Can be injected for testing or alternative implementations.
+            store_raw_data: If False, normalized transactions carry an empty JSON
+                            object as raw_data instead of the serialized API payload.
+                            Details derived from raw_data (e.g., symbols in listings)
+                            are then unavailable.
+            raw_data_encoder: Optional function serializing a raw dict to a JSON string
+                              (defaults to Transaction.dump_raw_data).
 
         Note:
             If username and password are provided, login will be attempted.
@@ -310,18 +399,36 @@ class RobinhoodAdapter(DataSourceAdapter):
         """
         self.username = username
         self.password = password
+        self.store_raw_data = store_raw_data
+        self.raw_data_encoder = raw_data_encoder
+        # Wrapper built (and owned) by this adapter; injected APIs are left untouched
+        self._wrapper: Optional[RobinhoodAPIWrapper] = None
         if robin_stocks is not None:
             self.rh: RobinhoodAPI = robin_stocks
         elif rh_module is not None:
-            self.rh = RobinhoodAPIWrapper(rh_module)
+            self._wrapper = RobinhoodAPIWrapper(rh_module)
+            self._wrapper.configure_session()
+            self.rh = self._wrapper
         else:
             raise ImportError(
                 "robin_stocks is not installed. Install it with: pip install robin-stocks"
             )
 
+        # Instrument URL -> symbol, so repeated lots of one instrument resolve once
+        self._symbol_cache: dict[str, Optional[str]] = {}
+
         if username and password:
             self.rh.login(username, password)
 
+    def close(self) -> None:
+        """Restore robin_stocks' shared session if this adapter configured it."""
+        if self._wrapper is not None:
+            self._wrapper.close()
+
+    def cache_scope(self) -> str:
+        """Scope extraction caching to the logged-in username."""
+        return self.username or ""
+
     def extract_transactions(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> list[dict[str, Any]]:
@@ -338,46 +445,57 @@ class RobinhoodAdapter(DataSourceAdapter):
         Raises:
             Exception: If API call fails or authentication is required.
         """
-        transactions = []
-
-        # Get stock orders - fail hard if API call fails
-        stock_orders = self.rh.get_all_stock_orders()
-        if stock_orders:
-            transactions.extend(stock_orders)
-
-        # Get option orders - fail hard if API call fails
-        option_orders = self.rh.get_all_option_orders()
-        if option_orders:
-            transactions.extend(option_orders)
-
-        # Get dividends
-        dividends = self.rh.get_dividends()
-        if dividends:
-            for div in dividends:
-                self._assert_required_fields(div, ["id", "amount"], "dividend")
-            transactions.extend(dividends)
-
-        # Get bank/ACH transfers
-        transfers = self.rh.get_bank_transfers()
-        if transfers:
-            for transfer in transfers:
-                self._assert_required_fields(transfer, ["id", "amount", "direction"], "transfer")
-            transactions.extend(transfers)
-
-        # Get crypto orders
-        crypto_orders = self.rh.get_crypto_orders()
-        if crypto_orders:
-            for crypto in crypto_orders:
-                self._assert_required_fields(
-                    crypto, ["id", "currency_code", "side", "quantity"], "crypto"
-                )
-            transactions.extend(crypto_orders)
+        return [tx for chunk in self.iter_transactions(start_date, end_date) for tx in chunk]
 
-        # Filter by date if provided
-        if start_date or end_date:
-            transactions = self._filter_by_date(transactions, start_date, end_date)
+    def iter_transactions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Extract transactions from Robinhood API one endpoint at a time.
 
-        return transactions
+        Each endpoint's results are validated, date-filtered, and yielded before the
+        next endpoint is fetched.
+
+        Args:
+            start_date: Optional start date filter (ISO format string, e.g., '2025-01-01')
+            end_date: Optional end date filter (ISO format string, e.g., '2025-12-31')
+            page_size: Maximum number of transactions per yielded chunk.
+
+        Yields:
+            Lists of raw transaction dictionaries, each at most page_size long.
+
+        Raises:
+            Exception: If API call fails or authentication is required.
+            ValueError: If dividends, transfers, or crypto orders miss required fields.
+        """
+        # (fetch, required fields, label) per endpoint - fail hard if any API call fails
+        endpoints: list[tuple[Callable[[], list[dict[str, Any]]], list[str], str]] = [
+            (self.rh.get_all_stock_orders, [], "stock"),
+            (self.rh.get_all_option_orders, [], "option"),
+            (self.rh.get_dividends, ["id", "amount"], "dividend"),
+            (self.rh.get_bank_transfers, ["id", "amount", "direction"], "transfer"),
+            (self.rh.get_crypto_orders, ["id", "currency_code", "side", "quantity"], "crypto"),
+        ]
+
+        # One endpoint at a time: robin_stocks shares a single requests.Session,
+        # which is not guaranteed to be thread-safe
+        for fetch, required_fields, label in endpoints:
+            batch = fetch()
+            if not batch:
+                continue
+
+            if required_fields:
+                for item in batch:
+                    self._assert_required_fields(item, required_fields, label)
+
+            # Filter by date if provided
+            if start_date or end_date:
+                batch = self._filter_by_date(batch, start_date, end_date)
+
+            for offset in range(0, len(batch), page_size):
+                yield batch[offset : offset + page_size]
 
     def extract_positions(self) -> list[dict[str, Any]]:
         """Extract current positions from Robinhood API.
@@ -414,32 +532,48 @@ class RobinhoodAdapter(DataSourceAdapter):
         Raises:
             ValueError: If raw_transaction is missing required fields.
         """
-        # Determine transaction type
-        transaction_type = self._determine_transaction_type(raw_transaction)
+        return self.normalize_transactions([raw_transaction])[0]
 
-        # Extract common fields
-        source_id = raw_transaction.get("id") or raw_transaction.get("order_id", "")
-        created_at = self._extract_timestamp(raw_transaction)
-        account_id = raw_transaction.get("account", "")
+    def normalize_transactions(self, raw_transactions: list[dict[str, Any]]) -> list[Transaction]:
+        """Convert a batch of Robinhood transactions to unified schema.
 
-        # Create transaction ID (UUID)
-        transaction_id = str(uuid.uuid4())
+        Method and function lookups are bound once per batch instead of per row.
 
-        # Store raw data as JSON
-        raw_data_json = json.dumps(raw_transaction)
+        Args:
+            raw_transactions: Raw transaction dictionaries from Robinhood API
 
-        # Create Transaction model
-        transaction = Transaction(
-            id=transaction_id,
-            source="robinhood",
-            source_id=str(source_id),
-            type=transaction_type,
-            created_at=created_at,
-            account_id=account_id if account_id else None,
-            raw_data=raw_data_json,
-        )
+        Returns:
+            Transaction model instances, in input order.
+
+        Raises:
+            ValueError: If any raw transaction is missing required fields.
+        """
+        determine_type = self._determine_transaction_type
+        find_timestamp = self._find_timestamp
+        now = _lazy_utc_now()
+        if not self.store_raw_data:
+            dumps: Callable[[dict[str, Any]], str] = _empty_raw_data
+        else:
+            dumps = self.raw_data_encoder or Transaction.dump_raw_data
+
+        transactions: list[Transaction] = []
+        append = transactions.append
+        for transaction_id, raw in zip(new_ids(len(raw_transactions)), raw_transactions):
+            source_id = raw.get("id") or raw.get("order_id", "")
+            account_id = raw.get("account", "")
+            append(
+                Transaction(
+                    id=transaction_id,
+                    source="robinhood",
+                    source_id=str(source_id),
+                    type=determine_type(raw),
+                    created_at=find_timestamp(raw) or now(),
+                    account_id=account_id if account_id else None,
+                    raw_data=dumps(raw),
+                )
+            )
 
-        return transaction
+        return transactions
 
     def _filter_by_date(
         self,
@@ -457,42 +591,82 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             Filtered list of transactions
         """
+        # Parse the bounds once rather than per transaction; open bounds become the
+        # extreme datetimes so each row needs a single chained comparison.
+        start_dt = self._parse_date_bound(start_date, end_of_day=False) or _MIN_UTC
+        end_dt = self._parse_date_bound(end_date, end_of_day=True) or _MAX_UTC
+        # Robinhood's own UTC timestamps compare as strings against the bounds in
+        # the same canonical form; anything else falls back to datetime parsing.
+        start_key = _utc_sort_key_from_datetime(start_dt)
+        end_key = _utc_sort_key_from_datetime(end_dt)
+        find_timestamp = self._find_timestamp
+        parse_timestamp = self._parse_timestamp
+        now = _lazy_utc_now()
         filtered = []
 
         for tx in transactions:
-            tx_date = self._extract_timestamp(tx)
+            tx_date = find_timestamp(tx) or now()
             if not tx_date:
                 continue
 
-            # Parse transaction timestamp, ensuring it's timezone-aware (UTC)
-            tx_datetime = datetime.fromisoformat(tx_date.replace("Z", "+00:00"))
-            if tx_datetime.tzinfo is None:
-                # If still naive, assume UTC
-                tx_datetime = tx_datetime.replace(tzinfo=timezone.utc)
-
-            if start_date:
-                start_dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-                # Ensure start_date is timezone-aware (UTC) for comparison
-                if start_dt.tzinfo is None:
-                    start_dt = start_dt.replace(tzinfo=timezone.utc)
-                if tx_datetime < start_dt:
-                    continue
-
-            if end_date:
-                end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-                # Ensure end_date is timezone-aware (UTC) for comparison
-                if end_dt.tzinfo is None:
-                    end_dt = end_dt.replace(tzinfo=timezone.utc)
-                # If end_date is date-only (no time component), include entire day
-                if end_dt.time() == datetime.min.time():
-                    end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-                if tx_datetime > end_dt:
+            tx_key = _utc_sort_key(tx_date)
+            if tx_key is not None:
+                if not start_key <= tx_key <= end_key:
                     continue
+            elif not start_dt <= parse_timestamp(tx_date) <= end_dt:
+                continue
 
             filtered.append(tx)
 
         return filtered
 
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO timestamp into a timezone-aware datetime (UTC if naive).
+
+        Args:
+            value: ISO format timestamp, optionally ending in 'Z'
+
+        Returns:
+            Timezone-aware datetime
+        """
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            # If still naive, assume UTC
+            parsed = parsed.replace(tzinfo=_UTC)
+        return parsed
+
+    @staticmethod
+    def _parse_date_bound(value: Optional[str], end_of_day: bool) -> Optional[datetime]:
+        """Parse a date filter bound into a timezone-aware datetime.
+
+        Args:
+            value: Optional ISO date or datetime string
+            end_of_day: If True, a date-only value is extended to the end of that day
+
+        Returns:
+            Parsed datetime (UTC if no timezone given), or None if value is empty
+        """
+        if not value:
+            return None
+
+        bound = RobinhoodAdapter._parse_timestamp(value)
+        # If end date is date-only (no time component), include entire day
+        if end_of_day and bound.time() == _MIDNIGHT:
+            bound = bound.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return bound
+
+    def classify_transaction(self, raw_transaction: dict[str, Any]) -> Optional[str]:
+        """Return the transaction type without normalizing the transaction.
+
+        Args:
+            raw_transaction: Raw transaction dictionary from Robinhood API
+
+        Returns:
+            Transaction type string (e.g., 'stock', 'option', 'crypto', 'dividend')
+        """
+        return self._determine_transaction_type(raw_transaction)
+
     def _determine_transaction_type(self, raw_transaction: dict[str, Any]) -> str:
         """Determine transaction type from raw data.
 
@@ -502,7 +676,7 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             Transaction type string (e.g., 'stock', 'option', 'crypto', 'dividend')
         """
-        instrument = raw_transaction.get("instrument", "")
+        instrument = raw_transaction.get("instrument") or ""
         tx_type_field = str(raw_transaction.get("type", "")).lower()
 
         # Check for option-specific fields
@@ -552,47 +726,56 @@ class RobinhoodAdapter(DataSourceAdapter):
             raw_transaction: Raw transaction dictionary
 
         Returns:
-            ISO format timestamp string
+            ISO format timestamp string (the current time if none is found)
         """
-        # Try various timestamp fields
-        timestamp_fields = [
-            "created_at",
-            "updated_at",
-            "last_transaction_at",
-            "execution_date",
-            "timestamp",
-            "payable_date",
-            "record_date",
-            "expected_landing_datetime",
-            "expected_landing_date",
-        ]
+        # Default to current time if no timestamp found
+        return self._find_timestamp(raw_transaction) or _utc_now_iso()
 
-        for field in timestamp_fields:
-            if field in raw_transaction and raw_transaction[field]:
-                timestamp = raw_transaction[field]
+    @staticmethod
+    def _find_timestamp(raw_transaction: dict[str, Any]) -> Optional[str]:
+        """Return the first ISO timestamp field of a raw payload, or None if absent.
+
+        Batch callers fall back to a _lazy_utc_now() clock on None, so the
+        current time is only read when some row actually lacks a timestamp.
+
+        Args:
+            raw_transaction: Raw transaction dictionary
+
+        Returns:
+            ISO format timestamp string, or None if no timestamp field is set
+        """
+        get = raw_transaction.get
+        for field in _TIMESTAMP_FIELDS:
+            timestamp = get(field)
+            if timestamp:
                 # Ensure ISO format
                 if isinstance(timestamp, str):
                     return timestamp
                 # If it's a datetime object, convert to ISO
                 if hasattr(timestamp, "isoformat"):
                     return str(timestamp.isoformat())
-
-        # Default to current time if no timestamp found
-        return datetime.utcnow().isoformat() + "Z"
+        return None
 
     def extract_option_order(
-        self, raw_transaction: dict[str, Any], transaction_id: str
+        self,
+        raw_transaction: dict[str, Any],
+        transaction_id: str,
+        transaction_type: Optional[str] = None,
     ) -> Optional[OptionOrder]:
         """Extract OptionOrder from raw transaction.
 
         Args:
             raw_transaction: Raw transaction dictionary from Robinhood API
             transaction_id: Transaction ID to use as foreign key
+            transaction_type: Type already determined for raw_transaction (e.g.,
+                Transaction.type); classified here when omitted
 
         Returns:
             OptionOrder model instance, or None if not an option order
         """
-        if self._determine_transaction_type(raw_transaction) != "option":
+        if transaction_type is None:
+            transaction_type = self._determine_transaction_type(raw_transaction)
+        if transaction_type != "option":
             return None
 
         # Extract option order fields
@@ -625,21 +808,32 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             List of OptionLeg model instances
         """
-        legs = []
-        raw_legs = raw_transaction.get("legs", [])
+        return list(self.iter_option_legs(raw_transaction, option_order_id))
+
+    def iter_option_legs(
+        self, raw_transaction: dict[str, Any], option_order_id: str
+    ) -> Iterator[OptionLeg]:
+        """Yield OptionLeg models from raw transaction one at a time.
 
-        for raw_leg in raw_legs:
-            leg_id = str(uuid.uuid4())
+        Args:
+            raw_transaction: Raw transaction dictionary from Robinhood API
+            option_order_id: Option order ID to use as foreign key
 
+        Yields:
+            OptionLeg model instances, in leg order
+        """
+        raw_legs = raw_transaction.get("legs", [])
+
+        for leg_id, raw_leg in zip(new_ids(len(raw_legs)), raw_legs):
             # Extract leg fields
             strike_price = self._safe_float(raw_leg.get("strike_price", 0)) or 0.0
             expiration_date = self._extract_expiration_date(raw_leg)
-            option_type = raw_leg.get("option_type", "").lower()
-            side = raw_leg.get("side", "").lower()
-            position_effect = raw_leg.get("position_effect", "").lower()
+            option_type = _lower(raw_leg.get("option_type", ""))
+            side = _lower(raw_leg.get("side", ""))
+            position_effect = _lower(raw_leg.get("position_effect", ""))
             ratio_quantity = int(raw_leg.get("ratio_quantity", 1))
 
-            leg = OptionLeg(
+            yield OptionLeg(
                 id=leg_id,
                 order_id=option_order_id,
                 strike_price=strike_price,
@@ -649,9 +843,6 @@ class RobinhoodAdapter(DataSourceAdapter):
                 position_effect=position_effect,
                 ratio_quantity=ratio_quantity,
             )
-            legs.append(leg)
-
-        return legs
 
     def extract_executions(
         self,
@@ -669,11 +860,30 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             List of Execution model instances
         """
-        executions = []
+        return list(self.iter_executions(raw_transaction, transaction_id, leg_ids))
+
+    def iter_executions(
+        self,
+        raw_transaction: dict[str, Any],
+        transaction_id: str,
+        leg_ids: Optional[list[str]] = None,
+    ) -> Iterator[Execution]:
+        """Yield Execution models from raw transaction one at a time.
+
+        Args:
+            raw_transaction: Raw transaction dictionary from Robinhood API
+            transaction_id: Transaction ID to use as foreign key
+            leg_ids: Optional list of leg IDs to match executions to legs
+
+        Yields:
+            Execution model instances, in execution order
+        """
         raw_executions = raw_transaction.get("executions", [])
 
+        exec_ids = new_ids(len(raw_executions))
+        now = _lazy_utc_now()
         for idx, raw_exec in enumerate(raw_executions):
-            exec_id = str(uuid.uuid4())
+            exec_id = exec_ids[idx]
 
             # Match execution to leg if leg_ids provided
             leg_id = None
@@ -682,10 +892,10 @@ class RobinhoodAdapter(DataSourceAdapter):
 
             price = self._safe_float(raw_exec.get("price", 0)) or 0.0
             quantity = self._safe_float(raw_exec.get("quantity", 0)) or 0.0
-            timestamp = self._extract_timestamp(raw_exec)
+            timestamp = self._find_timestamp(raw_exec) or now()
             settlement_date = raw_exec.get("settlement_date")
 
-            execution = Execution(
+            yield Execution(
                 id=exec_id,
                 order_id=transaction_id,
                 leg_id=leg_id,
@@ -694,23 +904,27 @@ class RobinhoodAdapter(DataSourceAdapter):
                 timestamp=timestamp,
                 settlement_date=settlement_date,
             )
-            executions.append(execution)
-
-        return executions
 
     def extract_stock_order(
-        self, raw_transaction: dict[str, Any], transaction_id: str
+        self,
+        raw_transaction: dict[str, Any],
+        transaction_id: str,
+        transaction_type: Optional[str] = None,
     ) -> Optional[StockOrder]:
         """Extract StockOrder from raw transaction.
 
         Args:
             raw_transaction: Raw transaction dictionary from Robinhood API
             transaction_id: Transaction ID to use as foreign key
+            transaction_type: Type already determined for raw_transaction (e.g.,
+                Transaction.type); classified here when omitted
 
         Returns:
             StockOrder model instance, or None if not a stock order
         """
-        if self._determine_transaction_type(raw_transaction) != "stock":
+        if transaction_type is None:
+            transaction_type = self._determine_transaction_type(raw_transaction)
+        if transaction_type != "stock":
             return None
 
         # Extract stock order fields
@@ -719,7 +933,7 @@ class RobinhoodAdapter(DataSourceAdapter):
         )
         if not symbol:
             raise ValueError("Stock order missing symbol and instrument could not be resolved")
-        side = raw_transaction.get("side", "").lower()
+        side = _lower(raw_transaction.get("side", ""))
         quantity = self._safe_float(raw_transaction.get("quantity", 0)) or 0.0
         price = self._safe_float(raw_transaction.get("price")) or 0.0
         average_price = self._safe_float(raw_transaction.get("average_price")) or 0.0
@@ -742,32 +956,51 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             Position model instance with normalized data.
         """
-        position_id = str(uuid.uuid4())
-        symbol = (
-            raw_position.get("symbol")
-            or raw_position.get("chain_symbol")
-            or self._resolve_symbol_from_instrument(raw_position)
-        )
-        if not symbol:
-            raise ValueError("Position missing symbol and instrument could not be resolved")
-        quantity = self._safe_float(raw_position.get("quantity", 0)) or 0.0
-        cost_basis = self._safe_float(raw_position.get("cost_basis")) or 0.0
-        current_price = self._safe_float(raw_position.get("current_price")) or 0.0
-        unrealized_pnl = self._safe_float(raw_position.get("unrealized_pnl")) or 0.0
-        last_updated = self._extract_timestamp(raw_position)
-        account_id = self._extract_account_id(raw_position)
-
-        return Position(
-            id=position_id,
-            source="robinhood",
-            account_id=account_id,
-            symbol=symbol,
-            quantity=quantity,
-            cost_basis=cost_basis,
-            current_price=current_price,
-            unrealized_pnl=unrealized_pnl,
-            last_updated=last_updated,
-        )
+        return self.normalize_positions([raw_position])[0]
+
+    def normalize_positions(self, raw_positions: list[dict[str, Any]]) -> list[Position]:
+        """Convert a batch of Robinhood positions to unified schema.
+
+        Method lookups and UUID generation are done once per batch instead of per
+        row; the clock is read at most once, and only if a row lacks a timestamp.
+
+        Args:
+            raw_positions: Raw position dictionaries from Robinhood API
+
+        Returns:
+            Position model instances, in input order.
+
+        Raises:
+            ValueError: If a position has no symbol and its instrument cannot be resolved.
+        """
+        safe_float = self._safe_float
+        resolve_symbol = self._resolve_symbol_from_instrument
+        find_timestamp = self._find_timestamp
+        extract_account_id = self._extract_account_id
+        now = _lazy_utc_now()
+
+        positions: list[Position] = []
+        append = positions.append
+        for position_id, raw in zip(new_ids(len(raw_positions)), raw_positions):
+            get = raw.get
+            symbol = get("symbol") or get("chain_symbol") or resolve_symbol(raw)
+            if not symbol:
+                raise ValueError("Position missing symbol and instrument could not be resolved")
+            append(
+                Position(
+                    id=position_id,
+                    source="robinhood",
+                    account_id=extract_account_id(raw),
+                    symbol=symbol,
+                    quantity=safe_float(get("quantity", 0)) or 0.0,
+                    cost_basis=safe_float(get("cost_basis")) or 0.0,
+                    current_price=safe_float(get("current_price")) or 0.0,
+                    unrealized_pnl=safe_float(get("unrealized_pnl")) or 0.0,
+                    last_updated=find_timestamp(raw) or now(),
+                )
+            )
+
+        return positions
 
     def _extract_account_id(self, payload: dict[str, Any]) -> Optional[str]:
         """Extract account identifier from payload (URL or id/last4)."""
@@ -782,7 +1015,8 @@ class RobinhoodAdapter(DataSourceAdapter):
             return last_segment or trimmed
         return account_str
 
-    def _safe_float(self, value: Any) -> Optional[float]:
+    @staticmethod
+    def _safe_float(value: Any) -> Optional[float]:
         """Safely convert value to float.
 
         Args:
@@ -791,8 +1025,15 @@ class RobinhoodAdapter(DataSourceAdapter):
         Returns:
             Float value, or None if conversion fails
         """
-        if value is None:
+        # Fast paths for the common API value types; empty strings would otherwise
+        # raise and be caught on every missing field.
+        value_type = type(value)
+        if value_type is float:
+            return cast(float, value)
+        if value is None or value == "":
             return None
+        if value_type is int:
+            return float(value)
         try:
             return float(value)
         except (ValueError, TypeError):
@@ -808,11 +1049,9 @@ class RobinhoodAdapter(DataSourceAdapter):
             ISO format expiration date string
         """
         # Try various expiration date fields
-        exp_fields = ["expiration_date", "expires_at", "expiry", "expiration"]
-
-        for field in exp_fields:
-            if field in raw_leg and raw_leg[field]:
-                exp_date = raw_leg[field]
+        for field in _EXPIRATION_FIELDS:
+            exp_date = raw_leg.get(field)
+            if exp_date:
                 if isinstance(exp_date, str):
                     return exp_date
                 if hasattr(exp_date, "isoformat"):
@@ -826,13 +1065,15 @@ class RobinhoodAdapter(DataSourceAdapter):
         instrument_url = raw_item.get("instrument")
         if not instrument_url:
             return None
+        if instrument_url in self._symbol_cache:
+            return self._symbol_cache[instrument_url]
         resolver = getattr(self.rh, "get_symbol_by_url", None)
         if resolver is None or not callable(resolver):
             raise AttributeError("robin_stocks missing required API for symbol resolution")
         resolved_symbol = resolver(instrument_url)
-        if resolved_symbol is None:
-            return None
-        return str(resolved_symbol)
+        symbol = None if resolved_symbol is None else str(resolved_symbol)
+        self._symbol_cache[instrument_url] = symbol
+        return symbol
 
     def _assert_required_fields(self, raw_item: dict[str, Any], fields: list[str], label: str):
         """Ensure required fields are present; fail fast otherwise."""
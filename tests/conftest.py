@@ -0,0 +1,13 @@
+"""Suite-wide test fixtures."""
+
+import pytest
+
+from tradedata.data.storage import FAST_ENV_VAR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_sqlite():
+    """Skip journaling and fsync for the throwaway databases tests create."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(FAST_ENV_VAR, "1")
+        yield
@@ -0,0 +1,105 @@
+"""Shared fixtures for application-layer tests."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from tradedata.data.models import Position, Transaction
+
+# Reference time shared by every fixture; computed once at import
+_NOW = datetime.now(timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+
+
+def _stock_transaction(tx_id: str, created_at: datetime) -> Transaction:
+    """Build a stock Transaction with empty raw data."""
+    return Transaction(
+        id=tx_id,
+        source="robinhood",
+        source_id=f"rh-{tx_id}",
+        type="stock",
+        created_at=created_at.isoformat(),
+        account_id=None,
+        raw_data="{}",
+    )
+
+
+@pytest.fixture(scope="session")
+def stock_transactions():
+    """Stock transactions created now, one day ago, and 30 days ago (newest first)."""
+    return (
+        _stock_transaction("tx-new", _NOW),
+        _stock_transaction("tx-mid", _NOW - timedelta(days=1)),
+        _stock_transaction("tx-old", _NOW - timedelta(days=30)),
+    )
+
+
+@pytest.fixture(scope="session")
+def position():
+    """A single AAPL stock position."""
+    return Position(
+        id="pos-1",
+        source="robinhood",
+        account_id="acc-1",
+        symbol="AAPL",
+        quantity=10.0,
+        cost_basis=150.0,
+        current_price=155.0,
+        unrealized_pnl=50.0,
+        last_updated=_NOW_ISO,
+    )
+
+
+class _FakeRepo:
+    """Repository stand-in whose find_all() reads one attribute of a controller."""
+
+    def __init__(self, controller, attr):
+        self._controller = controller
+        self._attr = attr
+
+    def find_all(self):
+        return list(getattr(self._controller, self._attr))
+
+    def find_by_ids(self, ids):
+        wanted = set(ids)
+        return [item for item in self.find_all() if item.id in wanted]
+
+    def find_by_order_ids(self, order_ids):
+        wanted = set(order_ids)
+        return [item for item in self.find_all() if item.order_id in wanted]
+
+
+class _FakeStorage:
+    """Storage stand-in that accepts any constructor arguments."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+# Listing-module repository class -> controller attribute serving its rows
+_LISTING_REPOS = {
+    "TransactionRepository": "transactions",
+    "PositionRepository": "positions",
+    "OptionOrderRepository": "option_orders",
+    "OptionLegRepository": "option_legs",
+    "StockOrderRepository": "stock_orders",
+}
+
+
+@pytest.fixture
+def listing_repos(monkeypatch):
+    """Patch Storage and every repository in the listing module once.
+
+    Returns a controller whose attributes (transactions, positions,
+    option_orders, option_legs, stock_orders) hold the rows each fake
+    repository serves; tests assign to them instead of re-patching.
+    """
+    controller = SimpleNamespace(**{attr: () for attr in _LISTING_REPOS.values()})
+    monkeypatch.setattr("tradedata.application.listing.Storage", _FakeStorage)
+    for name, attr in _LISTING_REPOS.items():
+        monkeypatch.setattr(
+            f"tradedata.application.listing.{name}",
+            lambda _storage=None, attr=attr: _FakeRepo(controller, attr),
+        )
+    return controller
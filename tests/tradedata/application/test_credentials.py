@@ -1,10 +1,11 @@
 """Tests for credential management."""
 
-from unittest.mock import patch
+import json
+from types import SimpleNamespace
 
-import keyring.errors
 import pytest
 
+from tradedata.application import credentials
 from tradedata.application.credentials import (
     CredentialsNotFoundError,
     delete_credentials,
@@ -13,162 +14,189 @@ from tradedata.application.credentials import (
 )
 
 
+class FakePasswordDeleteError(Exception):
+    """Stand-in for keyring.errors.PasswordDeleteError."""
+
+
+@pytest.fixture
+def fake_keyring(monkeypatch):
+    """Return a function that replaces keyring.<name> with a call recorder.
+
+    The credentials module's keyring is swapped for a namespace so no real
+    backend is touched. The recorder returns (or raises) the queued results in
+    order, then None, and the function returns the list of recorded call
+    argument tuples.
+    """
+    fake_module = SimpleNamespace(
+        errors=SimpleNamespace(PasswordDeleteError=FakePasswordDeleteError)
+    )
+    monkeypatch.setattr(credentials, "keyring", fake_module)
+    monkeypatch.setattr(credentials, "_credentials_cache", {})
+
+    def install(name, results=()):
+        calls = []
+        queued = iter(results)
+
+        def fake(*args):
+            calls.append(args)
+            result = next(queued, None)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        setattr(fake_module, name, fake)
+        return calls
+
+    return install
+
+
+def _blob(email, password):
+    """Serialize credentials the way store_credentials does."""
+    return json.dumps({"email": email, "password": password})
+
+
+SOURCES = pytest.mark.parametrize(
+    ("source", "email", "password"),
+    [
+        ("robinhood", "user@example.com", "secure_password"),
+        ("ibkr", "ibkr@example.com", "ibkr_password"),
+    ],
+)
+
+
 class TestGetCredentials:
     """Tests for get_credentials function."""
 
-    @patch("tradedata.application.credentials.keyring.get_password")
-    def test_get_credentials_success(self, mock_get_password):
-        """Test successful credential retrieval."""
-        # Setup
-        mock_get_password.side_effect = ["user@example.com", "secure_password"]
-
-        # Execute
-        email, password = get_credentials("robinhood")
-
-        # Assert
-        assert email == "user@example.com"
-        assert password == "secure_password"
-        assert mock_get_password.call_count == 2
-        mock_get_password.assert_any_call("com.tradedata.robinhood", "robinhood_email")
-        mock_get_password.assert_any_call("com.tradedata.robinhood", "robinhood_password")
-
-    @patch("tradedata.application.credentials.keyring.get_password")
-    def test_get_credentials_not_found_missing_email(self, mock_get_password):
-        """Test error when email is not found."""
-        # Setup
-        mock_get_password.side_effect = [None, "password"]
-
-        # Execute & Assert
+    @SOURCES
+    def test_get_credentials_success(self, fake_keyring, source, email, password):
+        """Test credential retrieval takes a single keyring read."""
+        calls = fake_keyring("get_password", [_blob(email, password)])
+
+        assert get_credentials(source) == (email, password)
+        assert calls == [(f"com.tradedata.{source}", f"{source}_credentials")]
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            [_blob(None, "password")],
+            [_blob("user@example.com", None)],
+            ["not json"],
+            [None, None, None],
+        ],
+        ids=["missing-email", "missing-password", "corrupt", "nothing-stored"],
+    )
+    def test_get_credentials_not_found(self, fake_keyring, stored):
+        """Test error when credentials are missing or incomplete."""
+        fake_keyring("get_password", stored)
+
         with pytest.raises(CredentialsNotFoundError) as exc_info:
             get_credentials("robinhood")
 
         assert "not found in keyring" in str(exc_info.value)
         assert "robinhood" in str(exc_info.value)
 
-    @patch("tradedata.application.credentials.keyring.get_password")
-    def test_get_credentials_not_found_missing_password(self, mock_get_password):
-        """Test error when password is not found."""
-        # Setup
-        mock_get_password.side_effect = ["user@example.com", None]
-
-        # Execute & Assert
-        with pytest.raises(CredentialsNotFoundError) as exc_info:
-            get_credentials("robinhood")
-
-        assert "not found in keyring" in str(exc_info.value)
+    def test_get_credentials_legacy_per_field_entries(self, fake_keyring):
+        """Test fallback to credentials stored one entry per field."""
+        calls = fake_keyring("get_password", [None, "user@example.com", "secure_password"])
 
-    @patch("tradedata.application.credentials.keyring.get_password")
-    def test_get_credentials_different_source(self, mock_get_password):
-        """Test credentials retrieval for different source."""
-        # Setup
-        mock_get_password.side_effect = ["ibkr@example.com", "ibkr_password"]
+        assert get_credentials("robinhood") == ("user@example.com", "secure_password")
+        assert calls == [
+            ("com.tradedata.robinhood", "robinhood_credentials"),
+            ("com.tradedata.robinhood", "robinhood_email"),
+            ("com.tradedata.robinhood", "robinhood_password"),
+        ]
 
-        # Execute
-        email, password = get_credentials("ibkr")
+    def test_get_credentials_cached_until_expiry(self, fake_keyring, monkeypatch):
+        """Test repeated lookups reuse the cached value until the TTL lapses."""
+        calls = fake_keyring(
+            "get_password",
+            [_blob("user@example.com", "old"), _blob("user@example.com", "new")],
+        )
+        now = [1000.0]
+        monkeypatch.setattr(credentials.time, "monotonic", lambda: now[0])
+
+        assert get_credentials("robinhood") == ("user@example.com", "old")
+        assert get_credentials("robinhood") == ("user@example.com", "old")
+        assert len(calls) == 1
+
+        now[0] += credentials._CACHE_TTL_SECONDS
+        assert get_credentials("robinhood") == ("user@example.com", "new")
+        assert len(calls) == 2
+
+    def test_store_and_delete_invalidate_cache(self, fake_keyring):
+        """Test writes drop the cached credentials for that source."""
+        calls = fake_keyring("get_password", [_blob("a@example.com", "pw")] * 3)
+        fake_keyring("set_password")
+        fake_keyring("delete_password")
+
+        get_credentials("robinhood")
+        store_credentials("robinhood", "a@example.com", "pw")
+        get_credentials("robinhood")
+        delete_credentials("robinhood")
+        get_credentials("robinhood")
 
-        # Assert
-        assert email == "ibkr@example.com"
-        assert password == "ibkr_password"
-        mock_get_password.assert_any_call("com.tradedata.ibkr", "ibkr_email")
-        mock_get_password.assert_any_call("com.tradedata.ibkr", "ibkr_password")
+        assert len(calls) == 3
 
 
 class TestStoreCredentials:
     """Tests for store_credentials function."""
 
-    @patch("tradedata.application.credentials.keyring.set_password")
-    def test_store_credentials_success(self, mock_set_password):
-        """Test successful credential storage."""
-        # Execute
-        store_credentials("robinhood", "user@example.com", "secure_password")
+    @SOURCES
+    def test_store_credentials_success(self, fake_keyring, source, email, password):
+        """Test credential storage takes a single keyring write."""
+        calls = fake_keyring("set_password")
 
-        # Assert
-        assert mock_set_password.call_count == 2
-        mock_set_password.assert_any_call(
-            "com.tradedata.robinhood", "robinhood_email", "user@example.com"
-        )
-        mock_set_password.assert_any_call(
-            "com.tradedata.robinhood", "robinhood_password", "secure_password"
-        )
+        store_credentials(source, email, password)
 
-    @patch("tradedata.application.credentials.keyring.set_password")
-    def test_store_credentials_empty_email(self, mock_set_password):
-        """Test error when email is empty."""
-        # Execute & Assert
-        with pytest.raises(ValueError) as exc_info:
-            store_credentials("robinhood", "", "password")
+        assert calls == [
+            (f"com.tradedata.{source}", f"{source}_credentials", _blob(email, password))
+        ]
 
-        assert "must not be empty" in str(exc_info.value)
-        mock_set_password.assert_not_called()
+    @pytest.mark.parametrize(
+        ("email", "password"),
+        [("", "password"), ("user@example.com", "")],
+        ids=["empty-email", "empty-password"],
+    )
+    def test_store_credentials_empty_value(self, fake_keyring, email, password):
+        """Test error when email or password is empty."""
+        calls = fake_keyring("set_password")
 
-    @patch("tradedata.application.credentials.keyring.set_password")
-    def test_store_credentials_empty_password(self, mock_set_password):
-        """Test error when password is empty."""
-        # Execute & Assert
         with pytest.raises(ValueError) as exc_info:
-            store_credentials("robinhood", "user@example.com", "")
+            store_credentials("robinhood", email, password)
 
         assert "must not be empty" in str(exc_info.value)
-        mock_set_password.assert_not_called()
-
-    @patch("tradedata.application.credentials.keyring.set_password")
-    def test_store_credentials_different_source(self, mock_set_password):
-        """Test credential storage for different source."""
-        # Execute
-        store_credentials("ibkr", "ibkr@example.com", "ibkr_pass")
-
-        # Assert
-        mock_set_password.assert_any_call("com.tradedata.ibkr", "ibkr_email", "ibkr@example.com")
-        mock_set_password.assert_any_call("com.tradedata.ibkr", "ibkr_password", "ibkr_pass")
+        assert calls == []
 
 
 class TestDeleteCredentials:
     """Tests for delete_credentials function."""
 
-    @patch("tradedata.application.credentials.keyring.delete_password")
-    def test_delete_credentials_success(self, mock_delete_password):
-        """Test successful credential deletion."""
-        # Execute
-        delete_credentials("robinhood")
-
-        # Assert
-        assert mock_delete_password.call_count == 2
-        mock_delete_password.assert_any_call("com.tradedata.robinhood", "robinhood_email")
-        mock_delete_password.assert_any_call("com.tradedata.robinhood", "robinhood_password")
-
-    @patch("tradedata.application.credentials.keyring.delete_password")
-    def test_delete_credentials_not_found(self, mock_delete_password):
-        """Test deletion when credentials don't exist (should not raise error)."""
-        # Setup - simulate credentials not found
-        mock_delete_password.side_effect = keyring.errors.PasswordDeleteError("Not found")
-
-        # Execute - should not raise error
-        delete_credentials("robinhood")
+    @pytest.mark.parametrize("source", ["robinhood", "ibkr"])
+    def test_delete_credentials_success(self, fake_keyring, source):
+        """Test deletion removes the combined entry and legacy per-field entries."""
+        calls = fake_keyring("delete_password")
 
-        # Assert
-        assert mock_delete_password.call_count == 2
+        delete_credentials(source)
 
-    @patch("tradedata.application.credentials.keyring.delete_password")
-    def test_delete_credentials_partial_exists(self, mock_delete_password):
-        """Test deletion when only one credential exists."""
-        # Setup - first deletion succeeds, second raises error
-        mock_delete_password.side_effect = [
-            None,  # Email deletion succeeds
-            keyring.errors.PasswordDeleteError("Not found"),  # Password not found
+        service = f"com.tradedata.{source}"
+        assert calls == [
+            (service, f"{source}_credentials"),
+            (service, f"{source}_email"),
+            (service, f"{source}_password"),
         ]
 
-        # Execute - should not raise error
-        delete_credentials("robinhood")
-
-        # Assert
-        assert mock_delete_password.call_count == 2
+    @pytest.mark.parametrize(
+        "missing",
+        [[True, True, True], [False, True, True]],
+        ids=["nothing-stored", "only-combined-entry"],
+    )
+    def test_delete_credentials_tolerates_missing_entries(self, fake_keyring, missing):
+        """Test deletion does not raise when entries don't exist."""
+        calls = fake_keyring(
+            "delete_password",
+            [FakePasswordDeleteError("Not found") if m else None for m in missing],
+        )
 
-    @patch("tradedata.application.credentials.keyring.delete_password")
-    def test_delete_credentials_different_source(self, mock_delete_password):
-        """Test credential deletion for different source."""
-        # Execute
-        delete_credentials("ibkr")
+        delete_credentials("robinhood")
 
-        # Assert
-        mock_delete_password.assert_any_call("com.tradedata.ibkr", "ibkr_email")
-        mock_delete_password.assert_any_call("com.tradedata.ibkr", "ibkr_password")
+        assert len(calls) == 3
@@ -0,0 +1,67 @@
+"""Tests for realized P&L calculation."""
+
+import pytest
+
+from tradedata.application.pnl import compute_realized_pnl
+from tradedata.data.models import StockOrder
+
+
+def _order(symbol: str, side: str, quantity: float, price: float) -> StockOrder:
+    return StockOrder(
+        id=f"{symbol}-{side}-{quantity}-{price}",
+        symbol=symbol,
+        side=side,
+        quantity=quantity,
+        price=price,
+        average_price=None,
+    )
+
+
+def test_compute_realized_pnl_matches_fifo():
+    """Sells close the oldest buy lots first."""
+    orders = [
+        _order("AAPL", "buy", 10, 100.0),
+        _order("AAPL", "buy", 10, 110.0),
+        _order("AAPL", "sell", 15, 120.0),
+    ]
+
+    # 10 @ (120-100) + 5 @ (120-110)
+    assert compute_realized_pnl(orders) == {"AAPL": pytest.approx(250.0)}
+
+
+def test_compute_realized_pnl_tracks_symbols_independently():
+    """Each symbol keeps its own lots; unclosed symbols report zero."""
+    orders = [
+        _order("AAPL", "buy", 1, 100.0),
+        _order("MSFT", "buy", 2, 300.0),
+        _order("AAPL", "sell", 1, 90.0),
+    ]
+
+    assert compute_realized_pnl(orders) == {
+        "AAPL": pytest.approx(-10.0),
+        "MSFT": pytest.approx(0.0),
+    }
+
+
+def test_compute_realized_pnl_handles_short_lots():
+    """Selling more than held opens a short lot that a later buy closes."""
+    orders = [
+        _order("TSLA", "buy", 1, 200.0),
+        _order("TSLA", "sell", 3, 210.0),
+        _order("TSLA", "buy", 2, 190.0),
+    ]
+
+    # Long close: 1 @ (210-200); short close: 2 @ (210-190)
+    assert compute_realized_pnl(orders) == {"TSLA": pytest.approx(50.0)}
+
+
+def test_compute_realized_pnl_prefers_average_price():
+    """average_price is used as the fill price when present."""
+    orders = [
+        StockOrder(id="1", symbol="AAPL", side="buy", quantity=1, price=100.0, average_price=101.0),
+        StockOrder(
+            id="2", symbol="AAPL", side="sell", quantity=1, price=110.0, average_price=111.0
+        ),
+    ]
+
+    assert compute_realized_pnl(orders) == {"AAPL": pytest.approx(10.0)}
@@ -25,6 +25,7 @@ from tradedata.data.repositories import (
 )
 from tradedata.data.storage import Storage
 from tradedata.data.validator import ValidationError
+from tradedata.sources.base import DataSourceAdapter
 
 
 class FakeAdapter:
@@ -45,6 +46,9 @@ class FakeAdapter:
         self.extract_args = (start_date, end_date)
         return [self.raw_option, self.raw_stock]
 
+    def classify_transaction(self, raw_transaction):
+        return "option" if raw_transaction is self.raw_option else "stock"
+
     def normalize_transaction(self, raw_transaction):
         if raw_transaction is self.raw_option:
             return Transaction(
@@ -54,7 +58,7 @@ class FakeAdapter:
                 type="option",
                 created_at="2025-01-01T00:00:00Z",
                 account_id=None,
-                raw_data=json.dumps(raw_transaction),
+                raw_data=Transaction.dump_raw_data(raw_transaction),
             )
 
         return Transaction(
@@ -64,10 +68,10 @@ class FakeAdapter:
             type="stock",
             created_at="2025-01-02T00:00:00Z",
             account_id=None,
-            raw_data=json.dumps(raw_transaction),
+            raw_data=Transaction.dump_raw_data(raw_transaction),
         )
 
-    def extract_option_order(self, raw_transaction, transaction_id):
+    def extract_option_order(self, raw_transaction, transaction_id, transaction_type=None):
         if raw_transaction is not self.raw_option:
             return None
 
@@ -125,7 +129,7 @@ class FakeAdapter:
             )
         ]
 
-    def extract_stock_order(self, raw_transaction, transaction_id):
+    def extract_stock_order(self, raw_transaction, transaction_id, transaction_type=None):
         if raw_transaction is not self.raw_stock:
             return None
 
@@ -164,10 +168,10 @@ def test_sync_transactions_persists_option_and_stock(monkeypatch):
     execution_repo = ExecutionRepository(storage)
     stock_repo = StockOrderRepository(storage)
 
-    assert len(tx_repo.find_all()) == 2
+    assert tx_repo.count() == 2
     assert option_repo.get_by_id(adapter.option_tx_id) is not None
-    assert len(leg_repo.find_all()) == 2
-    assert len(execution_repo.find_all()) == 1
+    assert leg_repo.count() == 2
+    assert execution_repo.count() == 1
     assert stock_repo.get_by_id(adapter.stock_tx_id) is not None
 
 
@@ -192,7 +196,74 @@ def test_sync_transactions_filters_types(monkeypatch):
     assert stored[0].type == "stock"
 
     tx_repo = TransactionRepository(storage)
-    assert len(tx_repo.find_all()) == 1
+    assert tx_repo.count() == 1
+
+
+def test_sync_transactions_filters_types_before_normalizing(monkeypatch):
+    """Ensure adapters that classify raw rows skip normalizing unwanted types."""
+
+    class RecordingAdapter(FakeAdapter):
+        def __init__(self):
+            super().__init__()
+            self.normalized = []
+
+        def normalize_transaction(self, raw_transaction):
+            self.normalized.append(raw_transaction)
+            return super().normalize_transaction(raw_transaction)
+
+    adapter = RecordingAdapter()
+    monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
+
+    stored = robinhood_sync.sync_transactions(
+        storage=Storage(db_path=":memory:"), adapter=adapter, types=["stock"]
+    )
+
+    assert [tx.type for tx in stored] == ["stock"]
+    assert adapter.normalized == [adapter.raw_stock]
+
+
+def test_sync_transactions_normalizes_each_batch_at_once(monkeypatch):
+    """Ensure DataSourceAdapter subclasses get one normalize_transactions call per batch."""
+
+    class BatchAdapter(FakeAdapter, DataSourceAdapter):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def extract_positions(self):
+            return []
+
+        def normalize_transactions(self, raw_transactions):
+            self.batches.append(list(raw_transactions))
+            return super().normalize_transactions(raw_transactions)
+
+    adapter = BatchAdapter()
+    monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
+
+    stored = robinhood_sync.sync_transactions(storage=Storage(db_path=":memory:"), adapter=adapter)
+
+    assert [tx.type for tx in stored] == ["option", "stock"]
+    assert adapter.batches == [[adapter.raw_option, adapter.raw_stock]]
+
+
+def test_sync_transactions_streams_batches(monkeypatch):
+    """Ensure generator input is processed in batches and deduplicated across them."""
+
+    class StreamingAdapter(FakeAdapter):
+        def extract_transactions(self, start_date=None, end_date=None):
+            yield self.raw_option
+            yield self.raw_stock
+            yield self.raw_stock
+
+    monkeypatch.setattr(robinhood_sync, "_SYNC_BATCH_SIZE", 1)
+    monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
+    storage = Storage(db_path=":memory:")
+
+    stored = robinhood_sync.sync_transactions(storage=storage, adapter=StreamingAdapter())
+
+    assert [tx.type for tx in stored] == ["option", "stock"]
+    assert TransactionRepository(storage).count() == 2
+    assert OptionLegRepository(storage).count() == 2
 
 
 def test_sync_transactions_is_atomic(monkeypatch):
@@ -205,10 +276,10 @@ def test_sync_transactions_is_atomic(monkeypatch):
         lambda source: ("user", "pw"),
     )
 
-    def fail_create(self, entity, conn=None):
+    def fail_create_many(self, entities, conn=None):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(OptionLegRepository, "create", fail_create)
+    monkeypatch.setattr(OptionLegRepository, "create_many", fail_create_many)
 
     with pytest.raises(RuntimeError):
         robinhood_sync.sync_transactions(
@@ -223,11 +294,30 @@ def test_sync_transactions_is_atomic(monkeypatch):
     execution_repo = ExecutionRepository(storage)
     stock_repo = StockOrderRepository(storage)
 
-    assert len(tx_repo.find_all()) == 0
-    assert len(option_repo.find_all()) == 0
-    assert len(leg_repo.find_all()) == 0
-    assert len(execution_repo.find_all()) == 0
-    assert len(stock_repo.find_all()) == 0
+    assert tx_repo.count() == 0
+    assert option_repo.count() == 0
+    assert leg_repo.count() == 0
+    assert execution_repo.count() == 0
+    assert stock_repo.count() == 0
+
+
+def test_sync_transactions_rolls_back_earlier_transactions(monkeypatch):
+    """Ensure a failure on a later transaction also discards earlier ones."""
+    storage = Storage(db_path=":memory:")
+    monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
+
+    def fail_create_many(self, entities, conn=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(StockOrderRepository, "create_many", fail_create_many)
+
+    with pytest.raises(RuntimeError):
+        robinhood_sync.sync_transactions(storage=storage, adapter=FakeAdapter())
+
+    assert TransactionRepository(storage).find_all() == []
+    assert OptionOrderRepository(storage).find_all() == []
+    assert OptionLegRepository(storage).find_all() == []
+    assert ExecutionRepository(storage).find_all() == []
 
 
 def test_sync_transactions_uses_factory_when_adapter_not_provided(monkeypatch):
@@ -251,6 +341,7 @@ def test_sync_transactions_uses_factory_when_adapter_not_provided(monkeypatch):
     mock_adapter.extract_transactions.assert_called_once_with(
         start_date="2025-01-01", end_date="2025-02-01"
     )
+    mock_adapter.close.assert_called_once_with()
 
 
 def test_sync_transactions_raises_on_validation_failure(monkeypatch):
@@ -271,9 +362,11 @@ def test_sync_transactions_raises_on_validation_failure(monkeypatch):
     bad_adapter.extract_stock_order.return_value = None
 
     monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
-    monkeypatch.setattr(
-        robinhood_sync, "validate_transaction", MagicMock(side_effect=ValidationError("boom"))
-    )
+
+    def fail_validation(_item):
+        raise ValidationError("boom")
+
+    monkeypatch.setattr(robinhood_sync, "validate_transaction", fail_validation)
 
     storage = Storage(db_path=":memory:")
 
@@ -317,10 +410,10 @@ def test_sync_transactions_skips_existing(monkeypatch):
                 raw_data="{}",
             )
 
-        def extract_option_order(self, raw_tx, transaction_id):
+        def extract_option_order(self, raw_tx, transaction_id, transaction_type=None):
             return None
 
-        def extract_stock_order(self, raw_tx, transaction_id):
+        def extract_stock_order(self, raw_tx, transaction_id, transaction_type=None):
             return None
 
         def extract_option_legs(self, raw_tx, order_id):
@@ -336,7 +429,7 @@ def test_sync_transactions_skips_existing(monkeypatch):
     stored = robinhood_sync.sync_transactions(storage=storage, adapter=Adapter())
 
     assert stored == []
-    assert len(tx_repo.find_all()) == 1
+    assert tx_repo.count() == 1
 
 
 class FakePositionAdapter:
@@ -410,6 +503,25 @@ def test_sync_positions_persists_positions(monkeypatch):
     assert account_ids == {"acc-123", "acc-456"}
 
 
+def test_sync_positions_uses_per_row_normalize_position_fallback(monkeypatch):
+    """Ensure adapters implementing only normalize_position still sync positions."""
+
+    class PerRowAdapter(FakePositionAdapter, DataSourceAdapter):
+        def extract_transactions(self, start_date=None, end_date=None):
+            return []
+
+        def normalize_transaction(self, raw_transaction):
+            raise NotImplementedError
+
+    monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
+    storage = Storage(db_path=":memory:")
+
+    stored = robinhood_sync.sync_positions(storage=storage, adapter=PerRowAdapter())
+
+    assert [position.symbol for position in stored] == ["AAPL", "MSFT"]
+    assert PositionRepository(storage).count() == 2
+
+
 def test_sync_positions_uses_factory_when_adapter_not_provided(monkeypatch):
     """Ensure factory creation and login are invoked for positions."""
     mock_adapter = MagicMock()
@@ -427,6 +539,7 @@ def test_sync_positions_uses_factory_when_adapter_not_provided(monkeypatch):
     robinhood_sync.create_adapter.assert_called_once_with("robinhood")
     mock_adapter.login.assert_called_once_with("user", "pw")
     mock_adapter.extract_positions.assert_called_once_with()
+    mock_adapter.close.assert_called_once_with()
 
 
 def test_sync_positions_raises_on_validation_failure(monkeypatch):
@@ -446,9 +559,11 @@ def test_sync_positions_raises_on_validation_failure(monkeypatch):
     )
 
     monkeypatch.setattr(robinhood_sync.credentials, "get_credentials", lambda source: ("u", "p"))
-    monkeypatch.setattr(
-        robinhood_sync, "validate_position", MagicMock(side_effect=ValidationError("boom"))
-    )
+
+    def fail_validation(_item):
+        raise ValidationError("boom")
+
+    monkeypatch.setattr(robinhood_sync, "validate_position", fail_validation)
 
     storage = Storage(db_path=":memory:")
 
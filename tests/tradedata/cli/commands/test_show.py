@@ -2,26 +2,38 @@
 
 from datetime import datetime, timezone
 
-from click.testing import CliRunner
-
 from tradedata.application.listing import TransactionDetail, TransactionTable
 from tradedata.cli.main import cli
 from tradedata.data.models import Position, Transaction
 
-
-def test_show_transactions_invokes_listing(monkeypatch):
+# Fixed inputs shared by the tests below, built once at import
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
+_TX = Transaction(
+    id="tx-recent",
+    source="robinhood",
+    source_id="rh-1",
+    type="stock",
+    created_at=_NOW_ISO,
+    account_id=None,
+    raw_data="{}",
+)
+
+_POSITION = Position(
+    id="pos-1",
+    source="robinhood",
+    account_id="acc-1",
+    symbol="AAPL",
+    quantity=10.0,
+    cost_basis=150.0,
+    current_price=155.0,
+    unrealized_pnl=50.0,
+    last_updated=_NOW_ISO,
+)
+
+
+def test_show_transactions_invokes_listing(monkeypatch, runner):
     """Ensure CLI passes filters to application layer and prints rows."""
-    now = datetime.now(timezone.utc)
-    tx = Transaction(
-        id="tx-recent",
-        source="robinhood",
-        source_id="rh-1",
-        type="stock",
-        created_at=now.isoformat(),
-        account_id=None,
-        raw_data="{}",
-    )
-
     captured = {}
 
     def fake_list_enriched(transaction_types=None, days=None, last=None, storage=None):
@@ -32,7 +44,7 @@ def test_show_transactions_invokes_listing(monkeypatch):
             TransactionTable(
                 transaction_type="stock",
                 headers=["ID", "Type"],
-                rows=[[tx.id, tx.type]],
+                rows=[[_TX.id, _TX.type]],
             )
         ]
 
@@ -41,8 +53,11 @@ def test_show_transactions_invokes_listing(monkeypatch):
         fake_list_enriched,
     )
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["show", "transactions", "--type", "stock,crypto", "--days", "10"])
+    result = runner.invoke(
+        cli,
+        ["show", "transactions", "--type", "stock,crypto", "--days", "10"],
+        catch_exceptions=False,
+    )
 
     assert result.exit_code == 0
     assert captured["transaction_types"] == ["stock", "crypto"]
@@ -52,7 +67,48 @@ def test_show_transactions_invokes_listing(monkeypatch):
     assert "stock" in result.output
 
 
-def test_show_transactions_detail_by_id(monkeypatch):
+def test_show_transactions_mixes_repeated_and_csv_types(monkeypatch, runner):
+    """Ensure repeated and comma-separated --type values are flattened in order."""
+    captured = {}
+
+    def fake_list_enriched(transaction_types=None, days=None, last=None, storage=None):
+        captured["transaction_types"] = transaction_types
+        return []
+
+    monkeypatch.setattr(
+        "tradedata.cli.commands.show.listing.list_enriched_transaction_tables",
+        fake_list_enriched,
+    )
+
+    result = runner.invoke(
+        cli,
+        ["show", "transactions", "--type", "stock, option", "--type", "crypto"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert captured["transaction_types"] == ["stock", "option", "crypto"]
+
+
+def test_show_transactions_separates_tables(monkeypatch, runner):
+    """Ensure multiple tables are titled and separated by a blank line."""
+    monkeypatch.setattr(
+        "tradedata.cli.commands.show.listing.list_enriched_transaction_tables",
+        lambda transaction_types=None, days=None, last=None, storage=None: [
+            TransactionTable(transaction_type="stock", headers=["ID"], rows=[["tx-1"]]),
+            TransactionTable(transaction_type="option", headers=["ID"], rows=[["tx-2"]]),
+        ],
+    )
+
+    result = runner.invoke(cli, ["show", "transactions"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert result.output.startswith("Stock transactions\n")
+    assert "\n\nOption transactions\n" in result.output
+    assert result.output.endswith("tx-2\n")
+
+
+def test_show_transactions_detail_by_id(monkeypatch, runner):
     """Ensure detail lookup by id renders fields and ignores other filters."""
     captured = {}
 
@@ -71,8 +127,9 @@ def test_show_transactions_detail_by_id(monkeypatch):
         fake_get_details,
     )
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["show", "transactions", "--id", "tx-1", "--days", "5"])
+    result = runner.invoke(
+        cli, ["show", "transactions", "--id", "tx-1", "--days", "5"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert captured["ids"] == ["tx-1"]
@@ -81,30 +138,18 @@ def test_show_transactions_detail_by_id(monkeypatch):
     assert "bar" in result.output
 
 
-def test_show_positions_invokes_listing(monkeypatch):
+def test_show_positions_invokes_listing(monkeypatch, runner):
     """Ensure CLI prints positions returned by application layer."""
-    position = Position(
-        id="pos-1",
-        source="robinhood",
-        account_id="acc-1",
-        symbol="AAPL",
-        quantity=10.0,
-        cost_basis=150.0,
-        current_price=155.0,
-        unrealized_pnl=50.0,
-        last_updated=datetime.now(timezone.utc).isoformat(),
-    )
 
     def fake_list_positions():
-        return [position]
+        return [_POSITION]
 
     monkeypatch.setattr(
         "tradedata.cli.commands.show.listing.list_positions",
         fake_list_positions,
     )
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["show", "positions"])
+    result = runner.invoke(cli, ["show", "positions"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "AAPL" in result.output
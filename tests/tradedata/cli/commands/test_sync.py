@@ -1,11 +1,10 @@
 """Tests for CLI sync commands."""
 
-from click.testing import CliRunner
-
+from tradedata.application import robinhood_sync
 from tradedata.cli.main import cli
 
 
-def test_sync_transactions_invokes_app(monkeypatch):
+def test_sync_transactions_invokes_app(monkeypatch, runner):
     """Ensure CLI calls app sync_transactions with options."""
     calls = {}
 
@@ -13,12 +12,8 @@ def test_sync_transactions_invokes_app(monkeypatch):
         calls["sync_transactions"] = (source, start_date, end_date, types)
         return [{"id": "tx1"}, {"id": "tx2"}]
 
-    monkeypatch.setattr(
-        "tradedata.cli.commands.sync.robinhood_sync.sync_transactions",
-        fake_sync_transactions,
-    )
+    monkeypatch.setattr(robinhood_sync, "sync_transactions", fake_sync_transactions)
 
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -33,6 +28,7 @@ def test_sync_transactions_invokes_app(monkeypatch):
             "--types",
             "stock,option",
         ],
+        catch_exceptions=False,
     )
 
     assert result.exit_code == 0
@@ -45,7 +41,27 @@ def test_sync_transactions_invokes_app(monkeypatch):
     assert "Synced 2 transactions" in result.output
 
 
-def test_sync_positions_invokes_app(monkeypatch):
+def test_sync_transactions_flattens_repeated_types(monkeypatch, runner):
+    """Ensure repeated and comma-separated --types values are flattened in order."""
+    calls = {}
+
+    def fake_sync_transactions(source, start_date=None, end_date=None, types=None):
+        calls["types"] = types
+        return []
+
+    monkeypatch.setattr(robinhood_sync, "sync_transactions", fake_sync_transactions)
+
+    result = runner.invoke(
+        cli,
+        ["sync", "transactions", "-t", "stock", "-t", "option, crypto"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert calls["types"] == ["stock", "option", "crypto"]
+
+
+def test_sync_positions_invokes_app(monkeypatch, runner):
     """Ensure CLI calls app sync_positions."""
     calls = {}
 
@@ -53,13 +69,11 @@ def test_sync_positions_invokes_app(monkeypatch):
         calls["sync_positions"] = source
         return [{"id": "pos1"}]
 
-    monkeypatch.setattr(
-        "tradedata.cli.commands.sync.robinhood_sync.sync_positions",
-        fake_sync_positions,
-    )
+    monkeypatch.setattr(robinhood_sync, "sync_positions", fake_sync_positions)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["sync", "positions", "--source", "robinhood"])
+    result = runner.invoke(
+        cli, ["sync", "positions", "--source", "robinhood"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert calls["sync_positions"] == "robinhood"
@@ -0,0 +1,10 @@
+"""Shared fixtures for CLI tests."""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """CLI runner shared by all tests; each invoke sets up its own isolation."""
+    return CliRunner()
@@ -1,150 +1,106 @@
 """Tests for CLI login command."""
 
-from click.testing import CliRunner
+from types import SimpleNamespace
 
-from tradedata.application import CredentialsNotFoundError
+import pytest
+
+from tradedata.application import CredentialsNotFoundError, credentials
+from tradedata.cli.commands import login as login_command
 from tradedata.cli.main import cli
 
+# Answers to the email and password prompts
+_PROMPT_INPUT = "user@example.com\nsecret\n"
+_FRESH_PROMPT_INPUT = "fresh@example.com\nnewpass\n"
 
-def test_login_uses_stored_credentials(monkeypatch):
-    """If stored creds exist, reuse them without prompting."""
-    calls = {}
+
+@pytest.fixture
+def login_fakes(monkeypatch):
+    """Patch adapter creation and credential storage for the login command.
+
+    Returns a controller: set ``stored`` to the keyring credentials (None when
+    missing) and ``login_error`` to make adapter creation fail; calls made by
+    the command are recorded in ``calls``.
+    """
+    fakes = SimpleNamespace(
+        stored=("cached@example.com", "cachedpass"),
+        login_error=None,
+        calls={},
+    )
 
     def fake_create_adapter(source, username=None, password=None):
-        calls["create_adapter"] = (source, username, password)
-        return object()
+        if fakes.login_error is not None:
+            raise fakes.login_error
+        fakes.calls["create_adapter"] = (source, username, password)
+        return SimpleNamespace(close=lambda: None)
 
     def fake_get_credentials(source):
-        return ("cached@example.com", "cachedpass")
+        if fakes.stored is None:
+            raise CredentialsNotFoundError("no creds")
+        return fakes.stored
 
     def fake_store_credentials(source, email, password):
-        calls["store_credentials"] = (source, email, password)
+        fakes.calls["store_credentials"] = (source, email, password)
 
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.create_adapter",
-        fake_create_adapter,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.get_credentials",
-        fake_get_credentials,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.store_credentials",
-        fake_store_credentials,
-    )
+    monkeypatch.setattr(login_command, "create_adapter", fake_create_adapter)
+    monkeypatch.setattr(credentials, "get_credentials", fake_get_credentials)
+    monkeypatch.setattr(credentials, "store_credentials", fake_store_credentials)
+    return fakes
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["login", "robinhood"])
+
+def test_login_uses_stored_credentials(login_fakes, runner):
+    """If stored creds exist, reuse them without prompting."""
+    result = runner.invoke(cli, ["login", "robinhood"], catch_exceptions=False)
 
     assert result.exit_code == 0
-    assert calls["create_adapter"] == ("robinhood", "cached@example.com", "cachedpass")
-    assert calls["store_credentials"] == ("robinhood", "cached@example.com", "cachedpass")
+    assert login_fakes.calls["create_adapter"] == (
+        "robinhood",
+        "cached@example.com",
+        "cachedpass",
+    )
+    assert login_fakes.calls["store_credentials"] == (
+        "robinhood",
+        "cached@example.com",
+        "cachedpass",
+    )
 
 
-def test_login_prompts_when_missing(monkeypatch):
+def test_login_prompts_when_missing(login_fakes, runner):
     """Prompts when no stored credentials and then stores them."""
-    calls = {}
-
-    def fake_create_adapter(source, username=None, password=None):
-        calls["create_adapter"] = (source, username, password)
-        return object()
-
-    def fake_get_credentials(source):
-        raise CredentialsNotFoundError("no creds")
-
-    def fake_store_credentials(source, email, password):
-        calls["store_credentials"] = (source, email, password)
-
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.create_adapter",
-        fake_create_adapter,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.get_credentials",
-        fake_get_credentials,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.store_credentials",
-        fake_store_credentials,
-    )
+    login_fakes.stored = None
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["login", "robinhood"], input="user@example.com\nsecret\n")
+    result = runner.invoke(cli, ["login", "robinhood"], input=_PROMPT_INPUT, catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Logged in to robinhood" in result.output
-    assert calls["create_adapter"] == ("robinhood", "user@example.com", "secret")
-    assert calls["store_credentials"] == ("robinhood", "user@example.com", "secret")
+    assert login_fakes.calls["create_adapter"] == ("robinhood", "user@example.com", "secret")
+    assert login_fakes.calls["store_credentials"] == ("robinhood", "user@example.com", "secret")
 
 
-def test_login_force_reprompts_even_with_stored(monkeypatch):
+def test_login_force_reprompts_even_with_stored(login_fakes, runner):
     """Force flag should re-prompt even if stored creds exist."""
-    calls = {}
-
-    def fake_create_adapter(source, username=None, password=None):
-        calls["create_adapter"] = (source, username, password)
-        return object()
-
-    def fake_get_credentials(source):
-        return ("cached@example.com", "cachedpass")
-
-    def fake_store_credentials(source, email, password):
-        calls["store_credentials"] = (source, email, password)
-
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.create_adapter",
-        fake_create_adapter,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.get_credentials",
-        fake_get_credentials,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.store_credentials",
-        fake_store_credentials,
-    )
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         ["login", "robinhood", "--force"],
-        input="fresh@example.com\nnewpass\n",
+        input=_FRESH_PROMPT_INPUT,
+        catch_exceptions=False,
     )
 
     assert result.exit_code == 0
-    assert calls["create_adapter"] == ("robinhood", "fresh@example.com", "newpass")
-    assert calls["store_credentials"] == ("robinhood", "fresh@example.com", "newpass")
+    assert login_fakes.calls["create_adapter"] == ("robinhood", "fresh@example.com", "newpass")
+    assert login_fakes.calls["store_credentials"] == (
+        "robinhood",
+        "fresh@example.com",
+        "newpass",
+    )
 
 
-def test_login_failure_does_not_store(monkeypatch):
+def test_login_failure_does_not_store(login_fakes, runner):
     """If login fails, exit non-zero and do not store credentials."""
-    calls = {}
-
-    def fake_create_adapter(source, username=None, password=None):
-        raise RuntimeError("boom")
-
-    def fake_get_credentials(source):
-        raise CredentialsNotFoundError("no creds")
-
-    def fake_store_credentials(source, email, password):
-        calls["store_credentials"] = True
-
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.create_adapter",
-        fake_create_adapter,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.get_credentials",
-        fake_get_credentials,
-    )
-    monkeypatch.setattr(
-        "tradedata.cli.commands.login.credentials.store_credentials",
-        fake_store_credentials,
-    )
+    login_fakes.stored = None
+    login_fakes.login_error = RuntimeError("boom")
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["login", "robinhood"], input="user@example.com\nsecret\n")
+    result = runner.invoke(cli, ["login", "robinhood"], input=_PROMPT_INPUT)
 
     assert result.exit_code != 0
     assert "failed to login" in result.output
-    assert "store_credentials" not in calls
+    assert "store_credentials" not in login_fakes.calls
@@ -0,0 +1,35 @@
+"""Shared fixtures for repository tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from tradedata.data.storage import Storage
+
+# Children before parents so foreign keys never block the cleanup
+_TABLES = (
+    "transaction_links",
+    "executions",
+    "option_legs",
+    "option_orders",
+    "stock_orders",
+    "positions",
+    "transactions",
+)
+
+
+@pytest.fixture(scope="session")
+def _session_storage() -> Iterator[Storage]:
+    """In-memory storage whose schema is created once per session."""
+    storage = Storage(db_path=":memory:")
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def storage(_session_storage: Storage) -> Iterator[Storage]:
+    """Shared in-memory storage, emptied after each test."""
+    yield _session_storage
+    with _session_storage.transaction() as conn:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table}")
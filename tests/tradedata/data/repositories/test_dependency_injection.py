@@ -1,11 +1,11 @@
 """Tests for repository dependency injection."""
 
-import json
-
 from tradedata.data.models import Transaction
 from tradedata.data.repositories import TransactionRepository
 from tradedata.data.storage import Storage
 
+_EMPTY_JSON = "{}"
+
 
 class TestRepositoryDependencyInjection:
     """Tests for repository dependency injection."""
@@ -25,7 +25,7 @@ class TestRepositoryDependencyInjection:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
 
         repo1.create(tx)
@@ -1,18 +1,16 @@
 """Tests for ExecutionRepository."""
 
-import json
-
 from tradedata.data.models import Execution, Transaction
 from tradedata.data.repositories import ExecutionRepository, TransactionRepository
-from tradedata.data.storage import Storage
+
+_EMPTY_JSON = "{}"
 
 
 class TestExecutionRepository:
     """Tests for ExecutionRepository."""
 
-    def test_create_and_get_by_id(self):
+    def test_create_and_get_by_id(self, storage):
         """Test creating and retrieving an execution."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = ExecutionRepository(storage)
 
@@ -24,7 +22,7 @@ class TestExecutionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -46,11 +44,8 @@ class TestExecutionRepository:
         assert retrieved.price == 2.50
         assert retrieved.quantity == 10.0
 
-        storage.close()
-
-    def test_find_by_order_id(self):
+    def test_find_by_order_id(self, storage):
         """Test finding executions by order ID."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = ExecutionRepository(storage)
 
@@ -62,7 +57,7 @@ class TestExecutionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -90,5 +85,3 @@ class TestExecutionRepository:
 
         order1_execs = repo.find_by_order_id("order-1")
         assert len(order1_execs) == 2
-
-        storage.close()
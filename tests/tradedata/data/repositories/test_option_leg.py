@@ -1,40 +1,31 @@
 """Tests for OptionLegRepository."""
 
-import json
-
 from tradedata.data.models import OptionLeg, OptionOrder, Transaction
 from tradedata.data.repositories import (
     OptionLegRepository,
     OptionOrderRepository,
     TransactionRepository,
 )
-from tradedata.data.storage import Storage
 
+_EMPTY_JSON = "{}"
 
-class TestOptionLegRepository:
-    """Tests for OptionLegRepository."""
 
-    def test_create_and_get_by_id(self):
-        """Test creating and retrieving an option leg."""
-        storage = Storage(db_path=":memory:")
-        tx_repo = TransactionRepository(storage)
-        order_repo = OptionOrderRepository(storage)
-        repo = OptionLegRepository(storage)
-
-        # Create parent transaction and option order first
-        transaction = Transaction(
-            id="order-1",
+def _create_parent_order(storage, order_id: str = "order-1") -> None:
+    """Create the transaction and option order an option leg references."""
+    TransactionRepository(storage).create(
+        Transaction(
+            id=order_id,
             source="robinhood",
-            source_id="rh-123",
+            source_id=f"rh-{order_id}",
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
-        tx_repo.create(transaction)
-
-        order = OptionOrder(
-            id="order-1",
+    )
+    OptionOrderRepository(storage).create(
+        OptionOrder(
+            id=order_id,
             chain_symbol="AAPL",
             opening_strategy="vertical_call_spread",
             closing_strategy=None,
@@ -42,7 +33,16 @@ class TestOptionLegRepository:
             premium=100.50,
             net_amount=-100.50,
         )
-        order_repo.create(order)
+    )
+
+
+class TestOptionLegRepository:
+    """Tests for OptionLegRepository."""
+
+    def test_create_and_get_by_id(self, storage):
+        """Test creating and retrieving an option leg."""
+        _create_parent_order(storage)
+        repo = OptionLegRepository(storage)
 
         leg = OptionLeg(
             id="leg-1",
@@ -63,38 +63,11 @@ class TestOptionLegRepository:
         assert retrieved.strike_price == 150.0
         assert retrieved.option_type == "call"
 
-        storage.close()
-
-    def test_find_by_order_id(self):
+    def test_find_by_order_id(self, storage):
         """Test finding option legs by order ID."""
-        storage = Storage(db_path=":memory:")
-        tx_repo = TransactionRepository(storage)
-        order_repo = OptionOrderRepository(storage)
-        repo = OptionLegRepository(storage)
-
-        # Create parent transactions and option orders first
         for order_id in ["order-1", "order-2"]:
-            transaction = Transaction(
-                id=order_id,
-                source="robinhood",
-                source_id=f"rh-{order_id}",
-                type="option",
-                created_at="2025-12-02T10:00:00Z",
-                account_id="acc-123",
-                raw_data=json.dumps({}),
-            )
-            tx_repo.create(transaction)
-
-            order = OptionOrder(
-                id=order_id,
-                chain_symbol="AAPL",
-                opening_strategy="vertical_call_spread",
-                closing_strategy=None,
-                direction="debit",
-                premium=100.50,
-                net_amount=-100.50,
-            )
-            order_repo.create(order)
+            _create_parent_order(storage, order_id)
+        repo = OptionLegRepository(storage)
 
         leg1 = OptionLeg(
             id="leg-1",
@@ -134,4 +107,30 @@ class TestOptionLegRepository:
         order1_legs = repo.find_by_order_id("order-1")
         assert len(order1_legs) == 2
 
-        storage.close()
+        batched = repo.find_by_order_ids(["order-1", "order-2", "order-1", "missing"])
+        assert [leg.id for leg in batched] == ["leg-1", "leg-2", "leg-3"]
+
+    def test_create_many_chunks_large_batches(self, storage):
+        """Test batched creation across more rows than one statement can bind."""
+        _create_parent_order(storage)
+        repo = OptionLegRepository(storage)
+
+        # 8 columns per row -> 124 rows per statement, so this spans two chunks
+        legs = [
+            OptionLeg(
+                id=f"leg-{i}",
+                order_id="order-1",
+                strike_price=100.0 + i,
+                expiration_date="2025-12-19",
+                option_type="call",
+                side="buy",
+                position_effect="open",
+                ratio_quantity=1,
+            )
+            for i in range(200)
+        ]
+
+        assert repo.create_many(legs) is legs
+        assert len(repo.find_by_order_id("order-1")) == 200
+        assert repo.get_by_id("leg-199").strike_price == 299.0
+        assert repo.create_many([]) == []
@@ -1,18 +1,16 @@
 """Tests for OptionOrderRepository."""
 
-import json
-
 from tradedata.data.models import OptionOrder, Transaction
 from tradedata.data.repositories import OptionOrderRepository, TransactionRepository
-from tradedata.data.storage import Storage
+
+_EMPTY_JSON = "{}"
 
 
 class TestOptionOrderRepository:
     """Tests for OptionOrderRepository."""
 
-    def test_create_and_get_by_id(self):
+    def test_create_and_get_by_id(self, storage):
         """Test creating and retrieving an option order."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = OptionOrderRepository(storage)
 
@@ -24,7 +22,7 @@ class TestOptionOrderRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -46,11 +44,8 @@ class TestOptionOrderRepository:
         assert retrieved.chain_symbol == "AAPL"
         assert retrieved.premium == 100.50
 
-        storage.close()
-
-    def test_update(self):
+    def test_update(self, storage):
         """Test updating an option order."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = OptionOrderRepository(storage)
 
@@ -62,7 +57,7 @@ class TestOptionOrderRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -84,11 +79,8 @@ class TestOptionOrderRepository:
         assert retrieved is not None
         assert retrieved.premium == 150.75
 
-        storage.close()
-
-    def test_delete(self):
+    def test_delete(self, storage):
         """Test deleting an option order."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = OptionOrderRepository(storage)
 
@@ -100,7 +92,7 @@ class TestOptionOrderRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -120,5 +112,3 @@ class TestOptionOrderRepository:
 
         retrieved = repo.get_by_id("order-1")
         assert retrieved is None
-
-        storage.close()
@@ -2,15 +2,13 @@
 
 from tradedata.data.models import Position
 from tradedata.data.repositories import PositionRepository
-from tradedata.data.storage import Storage
 
 
 class TestPositionRepository:
     """Tests for PositionRepository."""
 
-    def test_create_and_get_by_id(self):
+    def test_create_and_get_by_id(self, storage):
         """Test creating and retrieving a position."""
-        storage = Storage(db_path=":memory:")
         repo = PositionRepository(storage)
 
         position = Position(
@@ -33,11 +31,8 @@ class TestPositionRepository:
         assert retrieved.symbol == "AAPL"
         assert retrieved.quantity == 100.0
 
-        storage.close()
-
-    def test_find_by_source(self):
+    def test_find_by_source(self, storage):
         """Test finding positions by source."""
-        storage = Storage(db_path=":memory:")
         repo = PositionRepository(storage)
 
         pos1 = Position(
@@ -63,11 +58,8 @@ class TestPositionRepository:
             last_updated="2025-12-02T10:00:00Z",
         )
 
-        repo.create(pos1)
-        repo.create(pos2)
+        assert repo.create_many([pos1, pos2]) == [pos1, pos2]
 
         robinhood_pos = repo.find_by_source("robinhood")
         assert len(robinhood_pos) == 1
         assert robinhood_pos[0].source == "robinhood"
-
-        storage.close()
@@ -1,18 +1,16 @@
 """Tests for StockOrderRepository."""
 
-import json
-
 from tradedata.data.models import StockOrder, Transaction
 from tradedata.data.repositories import StockOrderRepository, TransactionRepository
-from tradedata.data.storage import Storage
+
+_EMPTY_JSON = "{}"
 
 
 class TestStockOrderRepository:
     """Tests for StockOrderRepository."""
 
-    def test_create_and_get_by_id(self):
+    def test_create_and_get_by_id(self, storage):
         """Test creating and retrieving a stock order."""
-        storage = Storage(db_path=":memory:")
         tx_repo = TransactionRepository(storage)
         repo = StockOrderRepository(storage)
 
@@ -24,7 +22,7 @@ class TestStockOrderRepository:
             type="stock",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx_repo.create(transaction)
 
@@ -45,4 +43,5 @@ class TestStockOrderRepository:
         assert retrieved.symbol == "AAPL"
         assert retrieved.quantity == 100.0
 
-        storage.close()
+        assert [o.id for o in repo.find_by_ids(["missing", "stock-order-1"])] == ["stock-order-1"]
+        assert repo.find_by_ids([]) == []
@@ -1,18 +1,19 @@
 """Tests for TransactionRepository."""
 
-import json
+import pytest
 
 from tradedata.data.models import Transaction
 from tradedata.data.repositories import TransactionRepository
-from tradedata.data.storage import Storage
+
+_EMPTY_JSON = "{}"
+_KEY_VALUE_JSON = '{"key": "value"}'
 
 
 class TestTransactionRepository:
     """Tests for TransactionRepository."""
 
-    def test_create_and_get_by_id(self):
+    def test_create_and_get_by_id(self, storage):
         """Test creating and retrieving a transaction."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         transaction = Transaction(
@@ -22,7 +23,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({"key": "value"}),
+            raw_data=_KEY_VALUE_JSON,
         )
 
         created = repo.create(transaction)
@@ -34,21 +35,15 @@ class TestTransactionRepository:
         assert retrieved.source == transaction.source
         assert retrieved.type == transaction.type
 
-        storage.close()
-
-    def test_get_by_id_not_found(self):
+    def test_get_by_id_not_found(self, storage):
         """Test getting non-existent transaction."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         result = repo.get_by_id("nonexistent")
         assert result is None
 
-        storage.close()
-
-    def test_update(self):
+    def test_update(self, storage):
         """Test updating a transaction."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         transaction = Transaction(
@@ -58,7 +53,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({"key": "value"}),
+            raw_data=_KEY_VALUE_JSON,
         )
         repo.create(transaction)
 
@@ -69,11 +64,8 @@ class TestTransactionRepository:
         assert retrieved is not None
         assert retrieved.type == "stock"
 
-        storage.close()
-
-    def test_delete(self):
+    def test_delete(self, storage):
         """Test deleting a transaction."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         transaction = Transaction(
@@ -83,7 +75,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({"key": "value"}),
+            raw_data=_KEY_VALUE_JSON,
         )
         repo.create(transaction)
 
@@ -96,11 +88,8 @@ class TestTransactionRepository:
         deleted_again = repo.delete("tx-1")
         assert deleted_again is False
 
-        storage.close()
-
-    def test_find_all(self):
+    def test_find_all(self, storage):
         """Test finding all transactions."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         tx1 = Transaction(
@@ -110,7 +99,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx2 = Transaction(
             id="tx-2",
@@ -119,20 +108,16 @@ class TestTransactionRepository:
             type="stock",
             created_at="2025-12-02T11:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
 
-        repo.create(tx1)
-        repo.create(tx2)
+        repo.create_many([tx1, tx2])
 
         all_tx = repo.find_all()
         assert len(all_tx) == 2
 
-        storage.close()
-
-    def test_find_by_source(self):
+    def test_find_by_source(self, storage):
         """Test finding transactions by source."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         tx1 = Transaction(
@@ -142,7 +127,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx2 = Transaction(
             id="tx-2",
@@ -151,21 +136,17 @@ class TestTransactionRepository:
             type="stock",
             created_at="2025-12-02T11:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
 
-        repo.create(tx1)
-        repo.create(tx2)
+        repo.create_many([tx1, tx2])
 
         robinhood_tx = repo.find_by_source("robinhood")
         assert len(robinhood_tx) == 1
         assert robinhood_tx[0].source == "robinhood"
 
-        storage.close()
-
-    def test_find_by_type(self):
+    def test_find_by_type(self, storage):
         """Test finding transactions by type."""
-        storage = Storage(db_path=":memory:")
         repo = TransactionRepository(storage)
 
         tx1 = Transaction(
@@ -175,7 +156,7 @@ class TestTransactionRepository:
             type="option",
             created_at="2025-12-02T10:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
         tx2 = Transaction(
             id="tx-2",
@@ -184,14 +165,83 @@ class TestTransactionRepository:
             type="stock",
             created_at="2025-12-02T11:00:00Z",
             account_id="acc-123",
-            raw_data=json.dumps({}),
+            raw_data=_EMPTY_JSON,
         )
 
-        repo.create(tx1)
-        repo.create(tx2)
+        repo.create_many([tx1, tx2])
 
         option_tx = repo.find_by_type("option")
         assert len(option_tx) == 1
         assert option_tx[0].type == "option"
 
-        storage.close()
+    def test_find_existing_source_ids(self, storage):
+        """Test batched duplicate lookup across more IDs than one query can bind."""
+        repo = TransactionRepository(storage)
+
+        for source, source_id in [
+            ("robinhood", "rh-5"),
+            ("robinhood", "rh-1500"),
+            ("ibkr", "rh-7"),
+        ]:
+            repo.create(
+                Transaction(
+                    id=f"{source}-{source_id}",
+                    source=source,
+                    source_id=source_id,
+                    type="stock",
+                    created_at="2025-12-02T10:00:00Z",
+                    account_id=None,
+                    raw_data=_EMPTY_JSON,
+                )
+            )
+
+        candidates = [f"rh-{i}" for i in range(2000)]
+        assert repo.find_existing_source_ids("robinhood", candidates) == {"rh-5", "rh-1500"}
+        assert repo.find_existing_source_ids("robinhood", []) == set()
+
+    def test_count(self, storage):
+        """Test counting transactions without loading them."""
+        repo = TransactionRepository(storage)
+        assert repo.count() == 0
+
+        for i in range(3):
+            repo.create(
+                Transaction(
+                    id=f"tx-{i}",
+                    source="robinhood",
+                    source_id=f"rh-{i}",
+                    type="stock",
+                    created_at="2025-12-02T10:00:00Z",
+                    account_id=None,
+                    raw_data=_EMPTY_JSON,
+                )
+            )
+
+        assert repo.count() == 3
+        assert repo.count() == len(repo.find_all())
+
+    def test_batched_insert_rejects_invalid_table_name(self, storage):
+        """Test batched inserts refuse a table constant that is not an identifier."""
+
+        class _BadTableRepository(TransactionRepository):
+            _TABLE = "transactions; DROP TABLE transactions"
+
+        transaction = Transaction(
+            id="tx-bad",
+            source="robinhood",
+            source_id="rh-bad",
+            type="stock",
+            created_at="2025-12-02T10:00:00Z",
+            account_id=None,
+            raw_data=_EMPTY_JSON,
+        )
+        with pytest.raises(ValueError, match="invalid table or column names"):
+            _BadTableRepository(storage).create_many([transaction])
+        assert TransactionRepository(storage).count() == 0
+
+    def test_batched_lookup_rejects_unknown_column(self, storage):
+        """Test batched lookups refuse columns outside the repository's table."""
+        repo = TransactionRepository(storage)
+
+        with pytest.raises(ValueError, match="Unknown transactions columns: bogus"):
+            repo._fetchall_in("bogus", ["rh-1"])
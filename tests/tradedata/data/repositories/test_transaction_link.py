@@ -1,33 +1,37 @@
 """Tests for TransactionLinkRepository."""
 
-import json
-
 from tradedata.data.models import Transaction, TransactionLink
 from tradedata.data.repositories import TransactionLinkRepository, TransactionRepository
-from tradedata.data.storage import Storage
-
 
-class TestTransactionLinkRepository:
-    """Tests for TransactionLinkRepository."""
+_EMPTY_JSON = "{}"
 
-    def test_create_and_get_by_id(self):
-        """Test creating and retrieving a transaction link."""
-        storage = Storage(db_path=":memory:")
-        tx_repo = TransactionRepository(storage)
-        repo = TransactionLinkRepository(storage)
 
-        # Create parent transactions first
-        for tx_id in ["tx-open-1", "tx-close-1"]:
-            transaction = Transaction(
+def _create_parent_transactions(storage, tx_ids: list[str]) -> None:
+    """Create the transactions links reference, in one batched insert."""
+    TransactionRepository(storage).create_many(
+        [
+            Transaction(
                 id=tx_id,
                 source="robinhood",
                 source_id=f"rh-{tx_id}",
                 type="option",
                 created_at="2025-12-02T10:00:00Z",
                 account_id="acc-123",
-                raw_data=json.dumps({}),
+                raw_data=_EMPTY_JSON,
             )
-            tx_repo.create(transaction)
+            for tx_id in tx_ids
+        ]
+    )
+
+
+class TestTransactionLinkRepository:
+    """Tests for TransactionLinkRepository."""
+
+    def test_create_and_get_by_id(self, storage):
+        """Test creating and retrieving a transaction link."""
+        repo = TransactionLinkRepository(storage)
+
+        _create_parent_transactions(storage, ["tx-open-1", "tx-close-1"])
 
         link = TransactionLink(
             id="link-1",
@@ -44,26 +48,11 @@ class TestTransactionLinkRepository:
         assert retrieved is not None
         assert retrieved.link_type == "spread"
 
-        storage.close()
-
-    def test_find_by_opening_transaction(self):
+    def test_find_by_opening_transaction(self, storage):
         """Test finding links by opening transaction ID."""
-        storage = Storage(db_path=":memory:")
-        tx_repo = TransactionRepository(storage)
         repo = TransactionLinkRepository(storage)
 
-        # Create parent transactions first
-        for tx_id in ["tx-open-1", "tx-close-1", "tx-close-2"]:
-            transaction = Transaction(
-                id=tx_id,
-                source="robinhood",
-                source_id=f"rh-{tx_id}",
-                type="option",
-                created_at="2025-12-02T10:00:00Z",
-                account_id="acc-123",
-                raw_data=json.dumps({}),
-            )
-            tx_repo.create(transaction)
+        _create_parent_transactions(storage, ["tx-open-1", "tx-close-1", "tx-close-2"])
 
         link1 = TransactionLink(
             id="link-1",
@@ -80,32 +69,16 @@ class TestTransactionLinkRepository:
             created_at="2025-12-02T11:00:00Z",
         )
 
-        repo.create(link1)
-        repo.create(link2)
+        assert repo.create_many([link1, link2]) == [link1, link2]
 
         opening_links = repo.find_by_opening_transaction("tx-open-1")
         assert len(opening_links) == 2
 
-        storage.close()
-
-    def test_find_by_closing_transaction(self):
+    def test_find_by_closing_transaction(self, storage):
         """Test finding links by closing transaction ID."""
-        storage = Storage(db_path=":memory:")
-        tx_repo = TransactionRepository(storage)
         repo = TransactionLinkRepository(storage)
 
-        # Create parent transactions first
-        for tx_id in ["tx-open-1", "tx-close-1"]:
-            transaction = Transaction(
-                id=tx_id,
-                source="robinhood",
-                source_id=f"rh-{tx_id}",
-                type="option",
-                created_at="2025-12-02T10:00:00Z",
-                account_id="acc-123",
-                raw_data=json.dumps({}),
-            )
-            tx_repo.create(transaction)
+        _create_parent_transactions(storage, ["tx-open-1", "tx-close-1"])
 
         link = TransactionLink(
             id="link-1",
@@ -120,5 +93,3 @@ class TestTransactionLinkRepository:
         closing_links = repo.find_by_closing_transaction("tx-close-1")
         assert len(closing_links) == 1
         assert closing_links[0].closing_transaction_id == "tx-close-1"
-
-        storage.close()
@@ -0,0 +1,79 @@
+"""Tests for identifier generation."""
+
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from tradedata.data import ids as ids_module
+from tradedata.data.ids import new_ids
+
+# 2025-01-01T00:00:00Z in nanoseconds
+_FIXED_NS = 1_735_689_600_000_000_000
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze the ID clock at _FIXED_NS and reset the shared sequence state."""
+    clock = SimpleNamespace(time_ns=lambda: _FIXED_NS)
+    monkeypatch.setattr(ids_module, "time", clock)
+    monkeypatch.setattr(ids_module, "_last_ms", -1)
+    monkeypatch.setattr(ids_module, "_last_sequence", ids_module._SEQUENCE_MASK)
+    return clock
+
+
+def test_new_ids_are_unique_version_7_uuids():
+    """Test generated IDs are distinct, canonical UUIDv7 strings."""
+    ids = new_ids(500)
+
+    assert len(set(ids)) == 500
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+
+def test_new_ids_sort_in_generation_order():
+    """Test IDs from one batch, and from a later batch, sort after earlier ones."""
+    first = new_ids(100)
+    time.sleep(0.002)
+    second = new_ids(3)
+
+    assert sorted(first) == first
+    assert max(first) < min(second)
+
+
+def test_new_ids_sort_across_batches_in_one_millisecond(frozen_clock):
+    """Test a second batch minted in the same millisecond sorts after the first."""
+    first = new_ids(3)
+    second = new_ids(3)
+
+    assert sorted(first + second) == first + second
+    assert {uuid.UUID(value).int >> 80 for value in first + second} == {_FIXED_NS // 1_000_000}
+
+
+@pytest.mark.parametrize("step_ns", [0, -5_000_000], ids=["same_ms", "clock_back"])
+def test_new_ids_stay_ordered_past_sequence_overflow(frozen_clock, step_ns):
+    """Test IDs keep sorting after the 12-bit sequence runs out or the clock steps back."""
+    first = new_ids(5000)
+    frozen_clock.time_ns = lambda: _FIXED_NS + step_ns
+    second = new_ids(2)
+
+    assert sorted(first + second) == first + second
+    assert len(set(first + second)) == 5002
+
+
+def test_new_ids_embed_current_millisecond():
+    """Test the leading 48 bits hold the Unix timestamp in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    (value,) = new_ids(1)
+    after = time.time_ns() // 1_000_000
+
+    assert before <= uuid.UUID(value).int >> 80 <= after
+
+
+def test_new_ids_empty():
+    """Test requesting no IDs returns an empty list."""
+    assert new_ids(0) == []
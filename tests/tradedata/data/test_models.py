@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from tradedata.data.models import (
     Execution,
     OptionLeg,
@@ -39,21 +41,26 @@ def test_transaction_model():
     )
 
     # Test from_db_row
-    transaction2 = Transaction.from_db_row(db_tuple)
-    assert transaction2.id == transaction.id
-    assert transaction2.source == transaction.source
-    assert transaction2.source_id == transaction.source_id
-    assert transaction2.type == transaction.type
-    assert transaction2.created_at == transaction.created_at
-    assert transaction2.account_id == transaction.account_id
-    assert transaction2.raw_data == transaction.raw_data
+    assert Transaction.from_db_row(db_tuple) == transaction
 
     # Test get_raw_data_dict
     assert transaction.get_raw_data_dict() == raw_data
 
 
-def test_transaction_with_none_account_id():
-    """Test Transaction with None account_id."""
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_dump_raw_data_matches_across_encoders(monkeypatch, use_orjson):
+    """Test orjson and the stdlib fallback store identical raw_data."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("tradedata.data.models.orjson", None)
+    raw = {"a": "é", "c": float("nan"), "d": [float("inf"), 1.5]}
+
+    assert Transaction.dump_raw_data(raw) == '{"a":"é","c":null,"d":[null,1.5]}'
+
+
+def test_transaction_uses_slots():
+    """Test Transaction instances carry no per-instance __dict__."""
     transaction = Transaction(
         id="test-id",
         source="robinhood",
@@ -61,14 +68,31 @@ def test_transaction_with_none_account_id():
         type="option",
         created_at="2025-12-02T10:00:00Z",
         account_id=None,
-        raw_data=json.dumps({}),
+        raw_data="{}",
     )
 
-    db_tuple = transaction.to_db_tuple()
-    assert db_tuple[5] is None
-
-    transaction2 = Transaction.from_db_row(db_tuple)
-    assert transaction2.account_id is None
+    assert not hasattr(transaction, "__dict__")
+    transaction.type = "stock"
+    assert transaction.type == "stock"
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        OptionOrder.from_db_row(("order-1", "AAPL", None, None, None, None, None)),
+        OptionLeg.from_db_row(("leg-1", "order-1", 150.0, "2025-12-19", "call", "buy", "open", 1)),
+        Execution.from_db_row(("exec-1", "order-1", None, 2.5, 10.0, "2025-12-02", None)),
+        StockOrder.from_db_row(("order-1", "AAPL", "buy", 1.0, None, None)),
+        Position.from_db_row(
+            ("pos-1", "robinhood", None, "AAPL", 1.0, None, None, None, "2025-12-02")
+        ),
+        TransactionLink.from_db_row(("link-1", "tx-open", "tx-close", None, "2025-12-02")),
+    ],
+    ids=lambda model: type(model).__name__,
+)
+def test_extracted_models_use_slots(model):
+    """Test stored models carry no per-instance __dict__."""
+    assert not hasattr(model, "__dict__")
 
 
 def test_option_order_model():
@@ -96,41 +120,7 @@ def test_option_order_model():
     )
 
     # Test from_db_row
-    option_order2 = OptionOrder.from_db_row(db_tuple)
-    assert option_order2.id == option_order.id
-    assert option_order2.chain_symbol == option_order.chain_symbol
-    assert option_order2.opening_strategy == option_order.opening_strategy
-    assert option_order2.closing_strategy == option_order.closing_strategy
-    assert option_order2.direction == option_order.direction
-    assert option_order2.premium == option_order.premium
-    assert option_order2.net_amount == option_order.net_amount
-
-
-def test_option_order_with_none_fields():
-    """Test OptionOrder with None optional fields."""
-    option_order = OptionOrder(
-        id="order-123",
-        chain_symbol="AAPL",
-        opening_strategy=None,
-        closing_strategy=None,
-        direction=None,
-        premium=None,
-        net_amount=None,
-    )
-
-    db_tuple = option_order.to_db_tuple()
-    assert db_tuple[2] is None
-    assert db_tuple[3] is None
-    assert db_tuple[4] is None
-    assert db_tuple[5] is None
-    assert db_tuple[6] is None
-
-    option_order2 = OptionOrder.from_db_row(db_tuple)
-    assert option_order2.opening_strategy is None
-    assert option_order2.closing_strategy is None
-    assert option_order2.direction is None
-    assert option_order2.premium is None
-    assert option_order2.net_amount is None
+    assert OptionOrder.from_db_row(db_tuple) == option_order
 
 
 def test_option_leg_model():
@@ -160,15 +150,7 @@ def test_option_leg_model():
     )
 
     # Test from_db_row
-    option_leg2 = OptionLeg.from_db_row(db_tuple)
-    assert option_leg2.id == option_leg.id
-    assert option_leg2.order_id == option_leg.order_id
-    assert option_leg2.strike_price == option_leg.strike_price
-    assert option_leg2.expiration_date == option_leg.expiration_date
-    assert option_leg2.option_type == option_leg.option_type
-    assert option_leg2.side == option_leg.side
-    assert option_leg2.position_effect == option_leg.position_effect
-    assert option_leg2.ratio_quantity == option_leg.ratio_quantity
+    assert OptionLeg.from_db_row(db_tuple) == option_leg
 
 
 def test_execution_model():
@@ -196,35 +178,7 @@ def test_execution_model():
     )
 
     # Test from_db_row
-    execution2 = Execution.from_db_row(db_tuple)
-    assert execution2.id == execution.id
-    assert execution2.order_id == execution.order_id
-    assert execution2.leg_id == execution.leg_id
-    assert execution2.price == execution.price
-    assert execution2.quantity == execution.quantity
-    assert execution2.timestamp == execution.timestamp
-    assert execution2.settlement_date == execution.settlement_date
-
-
-def test_execution_with_none_leg_id():
-    """Test Execution with None leg_id."""
-    execution = Execution(
-        id="exec-123",
-        order_id="order-123",
-        leg_id=None,
-        price=2.50,
-        quantity=10.0,
-        timestamp="2025-12-02T10:00:00Z",
-        settlement_date=None,
-    )
-
-    db_tuple = execution.to_db_tuple()
-    assert db_tuple[2] is None
-    assert db_tuple[6] is None
-
-    execution2 = Execution.from_db_row(db_tuple)
-    assert execution2.leg_id is None
-    assert execution2.settlement_date is None
+    assert Execution.from_db_row(db_tuple) == execution
 
 
 def test_stock_order_model():
@@ -243,33 +197,7 @@ def test_stock_order_model():
     assert db_tuple == ("stock-order-123", "AAPL", "buy", 100.0, 150.0, 149.50)
 
     # Test from_db_row
-    stock_order2 = StockOrder.from_db_row(db_tuple)
-    assert stock_order2.id == stock_order.id
-    assert stock_order2.symbol == stock_order.symbol
-    assert stock_order2.side == stock_order.side
-    assert stock_order2.quantity == stock_order.quantity
-    assert stock_order2.price == stock_order.price
-    assert stock_order2.average_price == stock_order.average_price
-
-
-def test_stock_order_with_none_fields():
-    """Test StockOrder with None optional fields."""
-    stock_order = StockOrder(
-        id="stock-order-123",
-        symbol="AAPL",
-        side="buy",
-        quantity=100.0,
-        price=None,
-        average_price=None,
-    )
-
-    db_tuple = stock_order.to_db_tuple()
-    assert db_tuple[4] is None
-    assert db_tuple[5] is None
-
-    stock_order2 = StockOrder.from_db_row(db_tuple)
-    assert stock_order2.price is None
-    assert stock_order2.average_price is None
+    assert StockOrder.from_db_row(db_tuple) == stock_order
 
 
 def test_position_model():
@@ -301,43 +229,7 @@ def test_position_model():
     )
 
     # Test from_db_row
-    position2 = Position.from_db_row(db_tuple)
-    assert position2.id == position.id
-    assert position2.source == position.source
-    assert position2.account_id == position.account_id
-    assert position2.symbol == position.symbol
-    assert position2.quantity == position.quantity
-    assert position2.cost_basis == position.cost_basis
-    assert position2.current_price == position.current_price
-    assert position2.unrealized_pnl == position.unrealized_pnl
-    assert position2.last_updated == position.last_updated
-
-
-def test_position_with_none_fields():
-    """Test Position with None optional fields."""
-    position = Position(
-        id="pos-123",
-        source="robinhood",
-        account_id=None,
-        symbol="AAPL",
-        quantity=100.0,
-        cost_basis=None,
-        current_price=None,
-        unrealized_pnl=None,
-        last_updated="2025-12-02T10:00:00Z",
-    )
-
-    db_tuple = position.to_db_tuple()
-    assert db_tuple[2] is None
-    assert db_tuple[5] is None
-    assert db_tuple[6] is None
-    assert db_tuple[7] is None
-
-    position2 = Position.from_db_row(db_tuple)
-    assert position2.account_id is None
-    assert position2.cost_basis is None
-    assert position2.current_price is None
-    assert position2.unrealized_pnl is None
+    assert Position.from_db_row(db_tuple) == position
 
 
 def test_transaction_link_model():
@@ -361,29 +253,7 @@ def test_transaction_link_model():
     )
 
     # Test from_db_row
-    transaction_link2 = TransactionLink.from_db_row(db_tuple)
-    assert transaction_link2.id == transaction_link.id
-    assert transaction_link2.opening_transaction_id == transaction_link.opening_transaction_id
-    assert transaction_link2.closing_transaction_id == transaction_link.closing_transaction_id
-    assert transaction_link2.link_type == transaction_link.link_type
-    assert transaction_link2.created_at == transaction_link.created_at
-
-
-def test_transaction_link_with_none_link_type():
-    """Test TransactionLink with None link_type."""
-    transaction_link = TransactionLink(
-        id="link-123",
-        opening_transaction_id="tx-open-123",
-        closing_transaction_id="tx-close-123",
-        link_type=None,
-        created_at="2025-12-02T10:00:00Z",
-    )
-
-    db_tuple = transaction_link.to_db_tuple()
-    assert db_tuple[3] is None
-
-    transaction_link2 = TransactionLink.from_db_row(db_tuple)
-    assert transaction_link2.link_type is None
+    assert TransactionLink.from_db_row(db_tuple) == transaction_link
 
 
 def test_all_models_have_type_hints():
@@ -399,32 +269,79 @@ def test_all_models_have_type_hints():
     assert hasattr(TransactionLink, "__annotations__")
 
 
-def test_models_round_trip_serialization():
-    """Test that models can be serialized and deserialized correctly."""
-    # Test Transaction
-    transaction = Transaction(
-        id="test-id",
-        source="robinhood",
-        source_id="rh-123",
-        type="option",
-        created_at="2025-12-02T10:00:00Z",
-        account_id="acc-123",
-        raw_data=json.dumps({"test": "data"}),
-    )
-    db_tuple = transaction.to_db_tuple()
-    transaction2 = Transaction.from_db_row(db_tuple)
-    assert transaction == transaction2
-
-    # Test OptionOrder
-    option_order = OptionOrder(
-        id="order-123",
-        chain_symbol="AAPL",
-        opening_strategy="vertical_call_spread",
-        closing_strategy=None,
-        direction="debit",
-        premium=100.50,
-        net_amount=-100.50,
-    )
-    db_tuple = option_order.to_db_tuple()
-    option_order2 = OptionOrder.from_db_row(db_tuple)
-    assert option_order == option_order2
+def test_from_db_row_interns_categorical_columns():
+    """Test categorical columns from separate rows share one string object."""
+    rows = [
+        ("tx-1", "".join(["robin", "hood"]), "rh-1", "".join(["st", "ock"]), "2025", None, "{}"),
+        ("tx-2", "".join(["robin", "hood"]), "rh-2", "".join(["st", "ock"]), "2025", None, "{}"),
+    ]
+    assert rows[0][1] is not rows[1][1]
+
+    first, second = (Transaction.from_db_row(row) for row in rows)
+
+    assert first.source is second.source
+    assert first.type is second.type
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        Transaction(
+            id="test-id",
+            source="robinhood",
+            source_id="rh-123",
+            type="option",
+            created_at="2025-12-02T10:00:00Z",
+            account_id=None,
+            raw_data="{}",
+        ),
+        OptionOrder(
+            id="order-123",
+            chain_symbol="AAPL",
+            opening_strategy=None,
+            closing_strategy=None,
+            direction=None,
+            premium=None,
+            net_amount=None,
+        ),
+        Execution(
+            id="exec-123",
+            order_id="order-123",
+            leg_id=None,
+            price=2.50,
+            quantity=10.0,
+            timestamp="2025-12-02T10:00:00Z",
+            settlement_date=None,
+        ),
+        StockOrder(
+            id="stock-order-123",
+            symbol="AAPL",
+            side="buy",
+            quantity=100.0,
+            price=None,
+            average_price=None,
+        ),
+        Position(
+            id="pos-123",
+            source="robinhood",
+            account_id=None,
+            symbol="AAPL",
+            quantity=100.0,
+            cost_basis=None,
+            current_price=None,
+            unrealized_pnl=None,
+            last_updated="2025-12-02T10:00:00Z",
+        ),
+        TransactionLink(
+            id="link-123",
+            opening_transaction_id="tx-open-123",
+            closing_transaction_id="tx-close-123",
+            link_type=None,
+            created_at="2025-12-02T10:00:00Z",
+        ),
+    ],
+    ids=lambda model: type(model).__name__,
+)
+def test_models_round_trip_with_none_fields(model):
+    """Test optional fields left as None survive a database round trip."""
+    assert type(model).from_db_row(model.to_db_tuple()) == model
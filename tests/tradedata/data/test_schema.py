@@ -2,16 +2,38 @@
 
 import os
 import sqlite3
-import tempfile
 from pathlib import Path
 
+import pytest
+
 from tradedata.data.schema import (
+    enable_pragmas,
     get_db_path,
     get_default_db_path,
     get_schema_sql,
     initialize_database,
 )
 
+_EXPECTED_TABLES = frozenset(
+    {
+        "executions",
+        "option_legs",
+        "option_orders",
+        "positions",
+        "stock_orders",
+        "transaction_links",
+        "transactions",
+    }
+)
+
+
+def _table_names(conn: sqlite3.Connection) -> set[str]:
+    """Names of the user tables in a database."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    return {row[0] for row in rows}
+
 
 def test_get_default_db_path():
     """Test default database path is ~/.tradedata/trading.db."""
@@ -60,88 +82,39 @@ def test_get_db_path_memory():
     assert result == ":memory:"
 
 
-def test_initialize_database_in_memory():
-    """Test database initialization with in-memory database."""
-    conn = initialize_database(db_path=":memory:")
+@pytest.mark.parametrize("db_kind", ["memory", "file"])
+def test_initialize_database(db_kind, tmp_path):
+    """Test database initialization with in-memory and file databases."""
+    db_path = ":memory:" if db_kind == "memory" else str(tmp_path / "test.db")
+    conn = initialize_database(db_path=db_path)
     assert isinstance(conn, sqlite3.Connection)
 
-    # Verify tables exist
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT name FROM sqlite_master
-        WHERE type='table' AND name NOT LIKE 'sqlite_%'
-        ORDER BY name
-    """
-    )
-    tables = [row[0] for row in cursor.fetchall()]
-    expected_tables = [
-        "executions",
-        "option_legs",
-        "option_orders",
-        "positions",
-        "stock_orders",
-        "transaction_links",
-        "transactions",
-    ]
-    assert set(tables) == set(expected_tables)
-
-    conn.close()
+    if db_kind == "file":
+        assert os.path.exists(db_path)
 
+    assert _table_names(conn) == _EXPECTED_TABLES
+    assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
 
-def test_initialize_database_file():
-    """Test database initialization with file path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "test.db")
-        conn = initialize_database(db_path=db_path)
+    conn.close()
 
-        # Verify file was created
-        assert os.path.exists(db_path)
 
-        # Verify tables exist
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%'
-            ORDER BY name
-        """
-        )
-        tables = [row[0] for row in cursor.fetchall()]
-        expected_tables = [
-            "executions",
-            "option_legs",
-            "option_orders",
-            "positions",
-            "stock_orders",
-            "transaction_links",
-            "transactions",
-        ]
-        assert set(tables) == set(expected_tables)
-
-        conn.close()
-
-
-def test_initialize_database_creates_directory():
+def test_initialize_database_creates_directory(tmp_path):
     """Test that database directory is created if it doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "subdir", "nested", "test.db")
-        conn = initialize_database(db_path=db_path)
+    db_path = str(tmp_path / "subdir" / "nested" / "test.db")
+    conn = initialize_database(db_path=db_path)
 
-        # Verify directory was created
-        assert os.path.exists(os.path.dirname(db_path))
-        assert os.path.exists(db_path)
+    # Verify directory was created
+    assert os.path.exists(os.path.dirname(db_path))
+    assert os.path.exists(db_path)
 
-        conn.close()
+    conn.close()
 
 
 def test_foreign_keys_enabled():
     """Test that foreign key constraints are enabled."""
-    conn = initialize_database(db_path=":memory:")
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA foreign_keys")
-    result = cursor.fetchone()
-    assert result[0] == 1  # Foreign keys should be enabled
+    conn = sqlite3.connect(":memory:")
+    enable_pragmas(conn)
+    assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
     conn.close()
 
 
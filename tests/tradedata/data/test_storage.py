@@ -2,11 +2,42 @@
 
 import os
 import sqlite3
-import tempfile
+from collections.abc import Iterator
+
+import pytest
 
 from tradedata.data.schema import get_default_db_path
 from tradedata.data.storage import Storage
 
+_EXPECTED_TABLES = frozenset(
+    {
+        "executions",
+        "option_legs",
+        "option_orders",
+        "positions",
+        "stock_orders",
+        "transaction_links",
+        "transactions",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def _module_storage() -> Iterator[Storage]:
+    """In-memory storage with a scratch ``test`` table, created once per module."""
+    storage = Storage(db_path=":memory:")
+    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def storage(_module_storage: Storage) -> Iterator[Storage]:
+    """Shared storage with the ``test`` table emptied after each test."""
+    yield _module_storage
+    with _module_storage.transaction() as conn:
+        conn.execute("DELETE FROM test")
+
 
 def test_storage_default_path():
     """Test Storage uses default path when no parameter provided."""
@@ -16,34 +47,31 @@ def test_storage_default_path():
     storage.close()
 
 
-def test_storage_custom_path():
+def test_storage_custom_path(tmp_path):
     """Test Storage uses custom path when provided."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "custom.db")
-        storage = Storage(db_path=db_path)
-        assert storage.db_path == db_path
-        storage.close()
+    db_path = str(tmp_path / "custom.db")
+    storage = Storage(db_path=db_path)
+    assert storage.db_path == db_path
+    storage.close()
 
 
-def test_storage_env_var_path(monkeypatch):
+def test_storage_env_var_path(monkeypatch, tmp_path):
     """Test Storage uses environment variable path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_path = os.path.join(tmpdir, "env.db")
-        monkeypatch.setenv("TRADEDATA_DB_PATH", env_path)
-        storage = Storage()
-        assert storage.db_path == env_path
-        storage.close()
+    env_path = str(tmp_path / "env.db")
+    monkeypatch.setenv("TRADEDATA_DB_PATH", env_path)
+    storage = Storage()
+    assert storage.db_path == env_path
+    storage.close()
 
 
-def test_storage_parameter_overrides_env(monkeypatch):
+def test_storage_parameter_overrides_env(monkeypatch, tmp_path):
     """Test Storage parameter overrides environment variable."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        env_path = os.path.join(tmpdir, "env.db")
-        custom_path = os.path.join(tmpdir, "custom.db")
-        monkeypatch.setenv("TRADEDATA_DB_PATH", env_path)
-        storage = Storage(db_path=custom_path)
-        assert storage.db_path == custom_path
-        storage.close()
+    env_path = str(tmp_path / "env.db")
+    custom_path = str(tmp_path / "custom.db")
+    monkeypatch.setenv("TRADEDATA_DB_PATH", env_path)
+    storage = Storage(db_path=custom_path)
+    assert storage.db_path == custom_path
+    storage.close()
 
 
 def test_storage_memory_database():
@@ -53,13 +81,12 @@ def test_storage_memory_database():
     storage.close()
 
 
-def test_storage_creates_directory():
+def test_storage_creates_directory(tmp_path):
     """Test Storage creates database directory if it doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "subdir", "nested", "test.db")
-        storage = Storage(db_path=db_path)
-        assert os.path.exists(os.path.dirname(db_path))
-        storage.close()
+    db_path = str(tmp_path / "subdir" / "nested" / "test.db")
+    storage = Storage(db_path=db_path)
+    assert os.path.exists(os.path.dirname(db_path))
+    storage.close()
 
 
 def test_storage_connection():
@@ -81,12 +108,8 @@ def test_storage_context_manager():
     assert storage._connection is None
 
 
-def test_storage_transaction_commit():
+def test_storage_transaction_commit(storage):
     """Test transaction commits on success."""
-    storage = Storage(db_path=":memory:")
-    # Initialize schema
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
-
     with storage.transaction() as conn:
         conn.execute("INSERT INTO test (name) VALUES (?)", ("test1",))
         conn.execute("INSERT INTO test (name) VALUES (?)", ("test2",))
@@ -96,15 +119,10 @@ def test_storage_transaction_commit():
     assert len(rows) == 2
     assert rows[0][0] == "test1"
     assert rows[1][0] == "test2"
-    storage.close()
 
 
-def test_storage_transaction_rollback():
+def test_storage_transaction_rollback(storage):
     """Test transaction rolls back on exception."""
-    storage = Storage(db_path=":memory:")
-    # Initialize schema
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
-
     try:
         with storage.transaction() as conn:
             conn.execute("INSERT INTO test (name) VALUES (?)", ("test1",))
@@ -117,26 +135,18 @@ def test_storage_transaction_rollback():
     # Verify data was rolled back
     rows = storage.fetchall("SELECT name FROM test")
     assert len(rows) == 0
-    storage.close()
 
 
-def test_storage_execute():
+def test_storage_execute(storage):
     """Test execute method."""
-    storage = Storage(db_path=":memory:")
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
-
     storage.execute("INSERT INTO test (name) VALUES (?)", ("test",))
     rows = storage.fetchall("SELECT name FROM test")
     assert len(rows) == 1
     assert rows[0][0] == "test"
-    storage.close()
 
 
-def test_storage_executemany():
+def test_storage_executemany(storage):
     """Test executemany method."""
-    storage = Storage(db_path=":memory:")
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
-
     params = [("test1",), ("test2",), ("test3",)]
     storage.executemany("INSERT INTO test (name) VALUES (?)", params)
     rows = storage.fetchall("SELECT name FROM test ORDER BY name")
@@ -144,30 +154,24 @@ def test_storage_executemany():
     assert rows[0][0] == "test1"
     assert rows[1][0] == "test2"
     assert rows[2][0] == "test3"
-    storage.close()
 
 
-def test_storage_executescript():
+def test_storage_executescript(storage):
     """Test executescript method."""
-    storage = Storage(db_path=":memory:")
     storage.executescript(
         """
-        CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);
         INSERT INTO test (name) VALUES ('test1');
         INSERT INTO test (name) VALUES ('test2');
         """
     )
     rows = storage.fetchall("SELECT name FROM test ORDER BY name")
     assert len(rows) == 2
-    storage.close()
 
 
-def test_storage_fetchone():
+def test_storage_fetchone(storage):
     """Test fetchone method."""
-    storage = Storage(db_path=":memory:")
     storage.executescript(
         """
-        CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);
         INSERT INTO test (name) VALUES ('test1');
         INSERT INTO test (name) VALUES ('test2');
         """
@@ -179,15 +183,12 @@ def test_storage_fetchone():
 
     row = storage.fetchone("SELECT name FROM test WHERE name = ?", ("nonexistent",))
     assert row is None
-    storage.close()
 
 
-def test_storage_fetchall():
+def test_storage_fetchall(storage):
     """Test fetchall method."""
-    storage = Storage(db_path=":memory:")
     storage.executescript(
         """
-        CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);
         INSERT INTO test (name) VALUES ('test1');
         INSERT INTO test (name) VALUES ('test2');
         INSERT INTO test (name) VALUES ('test3');
@@ -199,64 +200,82 @@ def test_storage_fetchall():
     assert rows[0][0] == "test1"
     assert rows[1][0] == "test2"
     assert rows[2][0] == "test3"
-    storage.close()
 
 
-def test_storage_lastrowid_from_cursor():
+def test_storage_lastrowid_from_cursor(storage):
     """Test getting lastrowid from cursor after execute."""
-    storage = Storage(db_path=":memory:")
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
-
     cursor = storage.execute("INSERT INTO test (name) VALUES (?)", ("test",))
     rowid = cursor.lastrowid
     assert rowid is not None
     assert rowid == 1
-    storage.close()
 
 
-def test_storage_foreign_keys_enabled():
+def test_storage_foreign_keys_enabled(storage):
     """Test that foreign keys are enabled."""
-    storage = Storage(db_path=":memory:")
     conn = storage.connect()
     cursor = conn.execute("PRAGMA foreign_keys")
     result = cursor.fetchone()
     assert result[0] == 1  # Foreign keys should be enabled
-    storage.close()
 
 
-def test_storage_initializes_database():
+def test_storage_initializes_database(tmp_path):
     """Test that Storage initializes database with schema."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "test.db")
-        storage = Storage(db_path=db_path)
-
-        # Verify tables exist
-        tables = storage.fetchall(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%'
-            ORDER BY name
-            """
-        )
-        table_names = [row[0] for row in tables]
-        expected_tables = [
-            "executions",
-            "option_legs",
-            "option_orders",
-            "positions",
-            "stock_orders",
-            "transaction_links",
-            "transactions",
-        ]
-        assert set(table_names) == set(expected_tables)
-        storage.close()
-
-
-def test_storage_multiple_transactions():
-    """Test multiple transactions work correctly."""
-    storage = Storage(db_path=":memory:")
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
+    db_path = str(tmp_path / "test.db")
+    storage = Storage(db_path=db_path)
+
+    # Verify tables exist
+    tables = storage.fetchall(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+        """
+    )
+    assert frozenset(row[0] for row in tables) == _EXPECTED_TABLES
+    storage.close()
+
+
+def test_storage_reuses_initialization_connection(tmp_path):
+    """Test that a new file database keeps its schema connection for reuse."""
+    db_path = str(tmp_path / "test.db")
+    storage = Storage(db_path=db_path)
+
+    conn = storage.connect()
+    assert storage.connect() is conn
+    assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
+    storage.close()
+
+    # Reopening an existing file starts a fresh connection
+    reopened = Storage(db_path=db_path)
+    assert reopened.connect() is not conn
+    reopened.close()
+
 
+def test_storage_file_database_uses_wal(monkeypatch, tmp_path):
+    """Test that file databases use WAL journaling with relaxed syncing."""
+    monkeypatch.delenv("TRADEDATA_TEST_FAST", raising=False)
+    storage = Storage(db_path=str(tmp_path / "test.db"))
+
+    assert storage.fetchone("PRAGMA journal_mode") == ("wal",)
+    # NORMAL == 1
+    assert storage.fetchone("PRAGMA synchronous") == (1,)
+    assert storage.fetchone("PRAGMA mmap_size") == (268435456,)
+    storage.close()
+
+
+def test_storage_fast_mode_skips_journal_and_sync(monkeypatch, tmp_path):
+    """Test the fast-mode env var switches file databases to unsynced memory journaling."""
+    monkeypatch.setenv("TRADEDATA_TEST_FAST", "1")
+    storage = Storage(db_path=str(tmp_path / "test.db"))
+
+    assert storage.fetchone("PRAGMA journal_mode") == ("memory",)
+    # OFF == 0
+    assert storage.fetchone("PRAGMA synchronous") == (0,)
+    storage.close()
+
+
+def test_storage_multiple_transactions(storage):
+    """Test multiple transactions work correctly."""
     # First transaction
     with storage.transaction() as conn:
         conn.execute("INSERT INTO test (name) VALUES (?)", ("test1",))
@@ -267,14 +286,37 @@ def test_storage_multiple_transactions():
 
     rows = storage.fetchall("SELECT name FROM test ORDER BY name")
     assert len(rows) == 2
-    storage.close()
 
 
-def test_storage_nested_transaction_rollback():
-    """Test that nested transaction-like operations rollback correctly."""
-    storage = Storage(db_path=":memory:")
-    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
+def test_storage_nested_transaction_failure_keeps_outer_work(storage):
+    """Test a failing inner transaction undoes only its own writes."""
+    with storage.transaction() as conn:
+        conn.execute("INSERT INTO test (name) VALUES (?)", ("outer",))
+        try:
+            with storage.transaction() as inner:
+                inner.execute("INSERT INTO test (name) VALUES (?)", ("inner",))
+                raise ValueError("Inner error")
+        except ValueError:
+            pass
+
+    assert storage.fetchall("SELECT name FROM test") == [("outer",)]
+
+
+def test_storage_nested_transaction_defers_commit_to_outer(storage):
+    """Test an inner block's writes are rolled back when the outer block fails."""
+    try:
+        with storage.transaction():
+            with storage.transaction() as inner:
+                inner.execute("INSERT INTO test (name) VALUES (?)", ("inner",))
+            raise ValueError("Outer error")
+    except ValueError:
+        pass
+
+    assert storage.fetchall("SELECT name FROM test") == []
 
+
+def test_storage_nested_transaction_rollback(storage):
+    """Test that nested transaction-like operations rollback correctly."""
     # Outer transaction
     try:
         with storage.transaction() as conn:
@@ -294,4 +336,36 @@ def test_storage_nested_transaction_rollback():
     # All should be rolled back
     rows = storage.fetchall("SELECT name FROM test")
     assert len(rows) == 0
+
+
+@pytest.mark.parametrize("nested", [False, True], ids=["outer", "nested"])
+def test_storage_transaction_rolls_back_on_keyboard_interrupt(storage, nested):
+    """Test a KeyboardInterrupt rolls back and leaves no transaction open."""
+    with pytest.raises(KeyboardInterrupt):
+        with storage.transaction() as conn:
+            if nested:
+                with storage.transaction() as inner:
+                    inner.execute("INSERT INTO test (name) VALUES (?)", ("inner",))
+                    raise KeyboardInterrupt
+            conn.execute("INSERT INTO test (name) VALUES (?)", ("outer",))
+            raise KeyboardInterrupt
+
+    assert not storage.connect().in_transaction
+    with storage.transaction() as conn:
+        conn.execute("INSERT INTO test (name) VALUES (?)", ("after",))
+    assert storage.fetchall("SELECT name FROM test") == [("after",)]
+
+
+def test_storage_autocommits_outside_transaction(tmp_path):
+    """Test statements outside transaction() commit without an explicit commit."""
+    db_path = str(tmp_path / "test.db")
+    storage = Storage(db_path=db_path)
+    storage.executescript("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT);")
+
+    storage.execute("INSERT INTO test (name) VALUES (?)", ("test1",))
+    assert not storage.connect().in_transaction
+
+    reader = sqlite3.connect(db_path)
+    assert reader.execute("SELECT name FROM test").fetchall() == [("test1",)]
+    reader.close()
     storage.close()
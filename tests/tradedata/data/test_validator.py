@@ -22,6 +22,10 @@ from tradedata.data.validator import (
     validate_transaction_link,
 )
 
+_UUID_A = "550e8400-e29b-41d4-a716-446655440000"
+_UUID_B = "550e8400-e29b-41d4-a716-446655440001"
+_UUID_C = "550e8400-e29b-41d4-a716-446655440002"
+
 
 class TestTransactionValidation:
     """Tests for transaction validation."""
@@ -29,7 +33,7 @@ class TestTransactionValidation:
     def test_valid_transaction(self):
         """Test validation of valid transaction."""
         tx = Transaction(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             source="robinhood",
             source_id="order-123",
             type="stock",
@@ -54,10 +58,20 @@ class TestTransactionValidation:
         with pytest.raises(ValidationError, match="Transaction.id"):
             validate_transaction(tx)
 
-    def test_transaction_invalid_uuid(self):
+    @pytest.mark.parametrize(
+        "bad_id",
+        [
+            "not-a-uuid",
+            "0192f3a1-7b2c-7abc-8def-0123456789a",
+            "0192f3a1-7b2c-7abc-8def-0123456789abc",
+            "0192f3a17b2c-7abc-8def-0123456789ab-",
+            "0192f3a1--b2c-7abc-8def-0123456789ab",
+        ],
+    )
+    def test_transaction_invalid_uuid(self, bad_id):
         """Test validation fails with invalid UUID."""
         tx = Transaction(
-            id="not-a-uuid",
+            id=bad_id,
             source="robinhood",
             source_id="order-123",
             type="stock",
@@ -71,7 +85,7 @@ class TestTransactionValidation:
     def test_transaction_invalid_timestamp(self):
         """Test validation fails with invalid timestamp."""
         tx = Transaction(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             source="robinhood",
             source_id="order-123",
             type="stock",
@@ -85,7 +99,7 @@ class TestTransactionValidation:
     def test_transaction_timestamp_with_z(self):
         """Test validation accepts timestamp with Z suffix."""
         tx = Transaction(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             source="robinhood",
             source_id="order-123",
             type="stock",
@@ -102,7 +116,7 @@ class TestOptionOrderValidation:
     def test_valid_option_order(self):
         """Test validation of valid option order."""
         order = OptionOrder(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             chain_symbol="AAPL 250117C150",
             opening_strategy="vertical_call_spread",
             closing_strategy=None,
@@ -115,7 +129,7 @@ class TestOptionOrderValidation:
     def test_option_order_missing_chain_symbol(self):
         """Test validation fails with missing chain_symbol."""
         order = OptionOrder(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             chain_symbol="",
             opening_strategy=None,
             closing_strategy=None,
@@ -133,8 +147,8 @@ class TestOptionLegValidation:
     def test_valid_option_leg(self):
         """Test validation of valid option leg."""
         leg = OptionLeg(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             strike_price=150.0,
             expiration_date="2025-01-17",
             option_type="call",
@@ -147,8 +161,8 @@ class TestOptionLegValidation:
     def test_option_leg_invalid_option_type(self):
         """Test validation fails with invalid option_type."""
         leg = OptionLeg(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             strike_price=150.0,
             expiration_date="2025-01-17",
             option_type="invalid",
@@ -162,8 +176,8 @@ class TestOptionLegValidation:
     def test_option_leg_invalid_side(self):
         """Test validation fails with invalid side."""
         leg = OptionLeg(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             strike_price=150.0,
             expiration_date="2025-01-17",
             option_type="call",
@@ -177,8 +191,8 @@ class TestOptionLegValidation:
     def test_option_leg_negative_strike(self):
         """Test validation fails with negative strike price."""
         leg = OptionLeg(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             strike_price=-150.0,
             expiration_date="2025-01-17",
             option_type="call",
@@ -192,8 +206,8 @@ class TestOptionLegValidation:
     def test_option_leg_zero_ratio_quantity(self):
         """Test validation fails with zero ratio_quantity."""
         leg = OptionLeg(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             strike_price=150.0,
             expiration_date="2025-01-17",
             option_type="call",
@@ -211,9 +225,9 @@ class TestExecutionValidation:
     def test_valid_execution(self):
         """Test validation of valid execution."""
         execution = Execution(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
-            leg_id="550e8400-e29b-41d4-a716-446655440002",
+            id=_UUID_A,
+            order_id=_UUID_B,
+            leg_id=_UUID_C,
             price=150.0,
             quantity=10.0,
             timestamp="2025-12-01T10:30:00Z",
@@ -224,8 +238,8 @@ class TestExecutionValidation:
     def test_execution_negative_price(self):
         """Test validation fails with negative price."""
         execution = Execution(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             leg_id=None,
             price=-150.0,
             quantity=10.0,
@@ -238,8 +252,8 @@ class TestExecutionValidation:
     def test_execution_zero_quantity(self):
         """Test validation fails with zero quantity."""
         execution = Execution(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            order_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            order_id=_UUID_B,
             leg_id=None,
             price=150.0,
             quantity=0.0,
@@ -256,7 +270,7 @@ class TestStockOrderValidation:
     def test_valid_stock_order(self):
         """Test validation of valid stock order."""
         order = StockOrder(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             symbol="AAPL",
             side="buy",
             quantity=100.0,
@@ -268,7 +282,7 @@ class TestStockOrderValidation:
     def test_stock_order_invalid_side(self):
         """Test validation fails with invalid side."""
         order = StockOrder(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             symbol="AAPL",
             side="invalid",
             quantity=100.0,
@@ -281,7 +295,7 @@ class TestStockOrderValidation:
     def test_stock_order_zero_quantity(self):
         """Test validation fails with zero quantity."""
         order = StockOrder(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             symbol="AAPL",
             side="buy",
             quantity=0.0,
@@ -298,7 +312,7 @@ class TestPositionValidation:
     def test_valid_position(self):
         """Test validation of valid position."""
         position = Position(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             source="robinhood",
             account_id="acc-123",
             symbol="AAPL",
@@ -313,7 +327,7 @@ class TestPositionValidation:
     def test_position_missing_symbol(self):
         """Test validation fails with missing symbol."""
         position = Position(
-            id="550e8400-e29b-41d4-a716-446655440000",
+            id=_UUID_A,
             source="robinhood",
             account_id=None,
             symbol="",
@@ -333,9 +347,9 @@ class TestTransactionLinkValidation:
     def test_valid_transaction_link(self):
         """Test validation of valid transaction link."""
         link = TransactionLink(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            opening_transaction_id="550e8400-e29b-41d4-a716-446655440001",
-            closing_transaction_id="550e8400-e29b-41d4-a716-446655440002",
+            id=_UUID_A,
+            opening_transaction_id=_UUID_B,
+            closing_transaction_id=_UUID_C,
             link_type="spread",
             created_at="2025-12-01T10:00:00Z",
         )
@@ -344,9 +358,9 @@ class TestTransactionLinkValidation:
     def test_transaction_link_same_ids(self):
         """Test validation fails when opening and closing IDs are same."""
         link = TransactionLink(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            opening_transaction_id="550e8400-e29b-41d4-a716-446655440001",
-            closing_transaction_id="550e8400-e29b-41d4-a716-446655440001",
+            id=_UUID_A,
+            opening_transaction_id=_UUID_B,
+            closing_transaction_id=_UUID_B,
             link_type=None,
             created_at="2025-12-01T10:00:00Z",
         )
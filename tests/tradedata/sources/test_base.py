@@ -0,0 +1,78 @@
+"""Tests for DataSourceAdapter base class."""
+
+import asyncio
+from typing import Any, Optional
+
+from tradedata.data.models import Transaction
+from tradedata.sources.base import DataSourceAdapter
+
+
+class RecordingAdapter(DataSourceAdapter):
+    """Adapter that records the date ranges it was asked to extract."""
+
+    def __init__(self):
+        self.calls: list[tuple[Optional[str], Optional[str]]] = []
+
+    def extract_transactions(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        self.calls.append((start_date, end_date))
+        return [{"id": f"{start_date}:{end_date}"}]
+
+    def extract_positions(self) -> list[dict[str, Any]]:
+        return [{"symbol": "AAPL", "quantity": 10}]
+
+    def normalize_transaction(self, raw_transaction: dict[str, Any]) -> Transaction:
+        return Transaction(
+            id=f"normalized-{raw_transaction['id']}",
+            source="recording",
+            source_id=raw_transaction["id"],
+            type="stock",
+            created_at="2025-01-01T00:00:00Z",
+            account_id=None,
+            raw_data="{}",
+        )
+
+
+def test_extract_transactions_async_delegates_to_sync():
+    """Default async extraction runs the synchronous implementation."""
+    adapter = RecordingAdapter()
+
+    result = asyncio.run(adapter.extract_transactions_async("2025-01-01", "2025-01-31"))
+
+    assert result == [{"id": "2025-01-01:2025-01-31"}]
+    assert adapter.calls == [("2025-01-01", "2025-01-31")]
+
+
+def test_extract_positions_async_delegates_to_sync():
+    """Default async position extraction runs the synchronous implementation."""
+    adapter = RecordingAdapter()
+
+    result = asyncio.run(adapter.extract_positions_async())
+
+    assert result == [{"symbol": "AAPL", "quantity": 10}]
+
+
+def test_extract_many_preserves_range_order():
+    """extract_many returns one result per range in input order."""
+    adapter = RecordingAdapter()
+    ranges = [("2025-01-01", "2025-01-31"), ("2025-02-01", "2025-02-28"), (None, None)]
+
+    results = asyncio.run(adapter.extract_many(ranges))
+
+    assert results == [
+        [{"id": "2025-01-01:2025-01-31"}],
+        [{"id": "2025-02-01:2025-02-28"}],
+        [{"id": "None:None"}],
+    ]
+    assert sorted(adapter.calls, key=str) == sorted(ranges, key=str)
+
+
+def test_normalize_transactions_maps_each_item_in_order():
+    """Batch normalization defaults to per-item normalize_transaction()."""
+    adapter = RecordingAdapter()
+
+    transactions = adapter.normalize_transactions([{"id": "a"}, {"id": "b"}])
+
+    assert [tx.source_id for tx in transactions] == ["a", "b"]
+    assert [tx.id for tx in transactions] == ["normalized-a", "normalized-b"]
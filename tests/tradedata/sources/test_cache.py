@@ -0,0 +1,184 @@
+"""Tests for source extraction caching."""
+
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from tradedata.data.models import Transaction
+from tradedata.sources import _cache
+from tradedata.sources.base import DataSourceAdapter
+
+
+class CountingAdapter(DataSourceAdapter):
+    """Adapter with caching enabled that counts API calls."""
+
+    cache_ttl = 60
+
+    def __init__(self, scope: str = ""):
+        self.calls = 0
+        self.scope = scope
+
+    def cache_scope(self) -> str:
+        return self.scope
+
+    def extract_transactions(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        self.calls += 1
+        return [{"id": "tx-1", "start": start_date, "end": end_date}]
+
+    def extract_positions(self) -> list[dict[str, Any]]:
+        self.calls += 1
+        return [{"symbol": "AAPL"}]
+
+    def normalize_transaction(self, raw_transaction: dict[str, Any]) -> Transaction:
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "cache.db"
+    monkeypatch.setenv("TRADEDATA_CACHE_PATH", str(path))
+    yield path
+    for conn in _cache._connections.values():
+        conn.close()
+    _cache._connections.clear()
+
+
+def test_get_cache_path_uses_env_var(cache_path):
+    """TRADEDATA_CACHE_PATH overrides the default location."""
+    assert _cache.get_cache_path() == str(cache_path)
+
+
+def test_cached_extract_transactions_hits_cache(cache_path):
+    """Repeated calls with identical arguments are served from cache."""
+    adapter = CountingAdapter()
+
+    first = adapter.extract_transactions("2025-01-01", "2025-01-31")
+    second = adapter.extract_transactions("2025-01-01", "2025-01-31")
+
+    assert first == second
+    assert adapter.calls == 1
+    assert cache_path.exists()
+
+
+def test_cache_is_shared_across_instances():
+    """Instances of one adapter class with the same scope share cached results."""
+    CountingAdapter().extract_positions()
+    adapter = CountingAdapter()
+
+    assert adapter.extract_positions() == [{"symbol": "AAPL"}]
+    assert adapter.calls == 0
+
+
+def test_different_scopes_miss_cache():
+    """Instances reading different accounts never share cached results."""
+    CountingAdapter(scope="alice").extract_positions()
+    adapter = CountingAdapter(scope="bob")
+
+    adapter.extract_positions()
+
+    assert adapter.calls == 1
+
+
+def test_connection_is_reused_across_calls(monkeypatch):
+    """The cache database is opened once per process, not once per call."""
+    connect_calls = []
+    real_connect = _cache.sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connect_calls.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(_cache.sqlite3, "connect", counting_connect)
+    adapter = CountingAdapter()
+
+    adapter.extract_transactions("2025-01-01", "2025-01-31")
+    adapter.extract_transactions("2025-01-01", "2025-01-31")
+    adapter.extract_positions()
+
+    assert len(connect_calls) == 1
+
+
+def test_different_arguments_miss_cache():
+    """Different date ranges are cached independently."""
+    adapter = CountingAdapter()
+
+    adapter.extract_transactions("2025-01-01", "2025-01-31")
+    adapter.extract_transactions("2025-02-01", "2025-02-28")
+
+    assert adapter.calls == 2
+
+
+def test_expired_entries_are_refreshed(monkeypatch):
+    """Entries older than the TTL trigger a fresh call."""
+    adapter = CountingAdapter()
+    clock = SimpleNamespace(time=lambda: 1000.0)
+    monkeypatch.setattr(_cache, "time", clock)
+
+    adapter.extract_positions()
+    clock.time = lambda: 1061.0
+    adapter.extract_positions()
+
+    assert adapter.calls == 2
+
+
+def test_adapters_without_ttl_are_not_cached():
+    """Caching is opt-in; adapters without cache_ttl always call through."""
+
+    class UncachedAdapter(CountingAdapter):
+        cache_ttl = None
+
+        def extract_positions(self) -> list[dict[str, Any]]:
+            self.calls += 1
+            return []
+
+    adapter = UncachedAdapter()
+    adapter.extract_positions()
+    adapter.extract_positions()
+
+    assert adapter.calls == 2
+
+
+def test_subclass_without_ttl_does_not_inherit_cached_methods():
+    """A subclass setting cache_ttl = None calls through on inherited methods too."""
+
+    class UncachedChild(CountingAdapter):
+        cache_ttl = None
+
+    adapter = UncachedChild()
+    adapter.extract_transactions("2025-01-01", "2025-01-31")
+    adapter.extract_transactions("2025-01-01", "2025-01-31")
+
+    assert adapter.calls == 2
+
+
+def test_subclass_ttl_applies_to_inherited_methods(monkeypatch):
+    """A subclass's cache_ttl, not the parent's, governs inherited methods."""
+
+    class ShortLivedChild(CountingAdapter):
+        cache_ttl = 5
+
+    adapter = ShortLivedChild()
+    clock = SimpleNamespace(time=lambda: 1000.0)
+    monkeypatch.setattr(_cache, "time", clock)
+
+    adapter.extract_positions()
+    clock.time = lambda: 1006.0
+    adapter.extract_positions()
+
+    assert adapter.calls == 2
+
+
+def test_same_named_adapters_in_different_modules_miss_cache():
+    """Cache keys include the adapter's module, not just its class name."""
+    other = type(
+        "CountingAdapter", (CountingAdapter,), {"__module__": "elsewhere", "cache_ttl": 60}
+    )
+    CountingAdapter().extract_positions()
+    adapter = other()
+
+    adapter.extract_positions()
+
+    assert adapter.calls == 1
@@ -1,5 +1,6 @@
 """Tests for source factory pattern."""
 
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import pytest
@@ -9,6 +10,17 @@ from tradedata.sources.base import DataSourceAdapter
 from tradedata.sources.factory import SourceFactory, create_adapter, get_factory
 
 
+@pytest.fixture(autouse=True)
+def _restore_default_registry() -> Iterator[None]:
+    """Undo registrations a test makes on the shared default registry."""
+    registry = DataSourceAdapter._REGISTRY
+    saved = dict(registry)
+    yield
+    # The default factory holds this dict, so restore it in place
+    registry.clear()
+    registry.update(saved)
+
+
 class MockAdapter(DataSourceAdapter):
     """Mock adapter for testing."""
 
@@ -39,24 +51,30 @@ class MockAdapter(DataSourceAdapter):
         )
 
 
+@pytest.fixture
+def two_source_factory() -> SourceFactory:
+    """Factory with MockAdapter registered as both "mock1" and "mock2"."""
+    factory = SourceFactory()
+    factory.register("mock1", MockAdapter)
+    factory.register("mock2", MockAdapter)
+    return factory
+
+
 class TestSourceFactory:
     """Tests for SourceFactory class."""
 
-    def test_register_and_create_adapter(self):
-        """Test registering and creating an adapter."""
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [({}, "default"), ({"test_param": "custom"}, "custom")],
+    )
+    def test_register_and_create_adapter(self, kwargs, expected):
+        """Test registering and creating an adapter, with and without constructor args."""
         factory = SourceFactory()
         factory.register("mock", MockAdapter)
 
-        adapter = factory.create_adapter("mock")
+        adapter = factory.create_adapter("mock", **kwargs)
         assert isinstance(adapter, MockAdapter)
-
-    def test_register_with_constructor_args(self):
-        """Test creating adapter with constructor arguments."""
-        factory = SourceFactory()
-        factory.register("mock", MockAdapter)
-
-        adapter = factory.create_adapter("mock", test_param="custom")
-        assert adapter.test_param == "custom"
+        assert adapter.test_param == expected
 
     def test_register_duplicate_raises_error(self):
         """Test that registering duplicate source raises ValueError."""
@@ -83,41 +101,71 @@ class TestSourceFactory:
         with pytest.raises(ValueError, match="not registered"):
             factory.create_adapter("nonexistent")
 
-    def test_is_registered(self):
+    def test_is_registered(self, two_source_factory):
         """Test checking if source is registered."""
-        factory = SourceFactory()
-        assert factory.is_registered("mock") is False
+        assert two_source_factory.is_registered("mock1") is True
+        assert two_source_factory.is_registered("mock") is False
 
-        factory.register("mock", MockAdapter)
-        assert factory.is_registered("mock") is True
-
-    def test_list_sources(self):
+    def test_list_sources(self, two_source_factory):
         """Test listing registered sources."""
-        factory = SourceFactory()
-        assert factory.list_sources() == []
+        assert SourceFactory().list_sources() == []
 
-        factory.register("mock1", MockAdapter)
-        factory.register("mock2", MockAdapter)
-
-        sources = factory.list_sources()
+        sources = two_source_factory.list_sources()
         assert "mock1" in sources
         assert "mock2" in sources
         assert len(sources) == 2
 
-    def test_multiple_adapters_same_class(self):
+    def test_multiple_adapters_same_class(self, two_source_factory):
         """Test registering multiple adapters with same class."""
-        factory = SourceFactory()
-        factory.register("mock1", MockAdapter)
-        factory.register("mock2", MockAdapter)
-
-        adapter1 = factory.create_adapter("mock1")
-        adapter2 = factory.create_adapter("mock2")
+        adapter1 = two_source_factory.create_adapter("mock1")
+        adapter2 = two_source_factory.create_adapter("mock2")
 
         assert isinstance(adapter1, MockAdapter)
         assert isinstance(adapter2, MockAdapter)
         # They should be different instances
         assert adapter1 is not adapter2
 
+    def test_extract_all(self, two_source_factory):
+        """Test extracting transactions from several sources at once."""
+        results = two_source_factory.extract_all(
+            {"mock1": {}, "mock2": {"test_param": "custom"}},
+            start_date="2025-01-01",
+            end_date="2025-12-31",
+        )
+
+        assert set(results) == {"mock1", "mock2"}
+        assert results["mock1"] == [{"id": "test-1", "source": "mock"}]
+        assert results["mock2"] == [{"id": "test-1", "source": "mock"}]
+
+    @pytest.mark.parametrize("fail", [False, True], ids=["success", "extract_error"])
+    def test_extract_all_closes_adapters(self, two_source_factory, monkeypatch, fail):
+        """Test that extract_all closes every adapter it created, even when a fetch fails."""
+        closed: list[str] = []
+        monkeypatch.setattr(MockAdapter, "close", lambda self: closed.append(self.test_param))
+        if fail:
+
+            def failing_extract(self, start_date=None, end_date=None):
+                raise RuntimeError("broker down")
+
+            monkeypatch.setattr(MockAdapter, "extract_transactions", failing_extract)
+
+        sources = {"mock1": {"test_param": "a"}, "mock2": {"test_param": "b"}}
+        if fail:
+            with pytest.raises(RuntimeError, match="broker down"):
+                two_source_factory.extract_all(sources)
+        else:
+            two_source_factory.extract_all(sources)
+
+        assert sorted(closed) == ["a", "b"]
+
+    def test_extract_all_unregistered_raises_error(self):
+        """Test that extract_all fails before dispatching when a source is unknown."""
+        factory = SourceFactory()
+        factory.register("mock", MockAdapter)
+
+        with pytest.raises(ValueError, match="not registered"):
+            factory.extract_all({"mock": {}, "nonexistent": {}})
+
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
@@ -128,19 +176,34 @@ class TestConvenienceFunctions:
         factory2 = get_factory()
         assert factory1 is factory2
 
-    def test_create_adapter_convenience_function(self):
-        """Test the create_adapter convenience function."""
-        factory = get_factory()
-        factory.register("mock", MockAdapter)
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [({}, "default"), ({"test_param": "convenience"}, "convenience")],
+    )
+    def test_create_adapter_convenience_function(self, kwargs, expected):
+        """Test the create_adapter convenience function, with and without constructor args."""
+        get_factory().register("mock", MockAdapter)
 
-        adapter = create_adapter("mock")
+        adapter = create_adapter("mock", **kwargs)
         assert isinstance(adapter, MockAdapter)
+        assert adapter.test_param == expected
+
+    def test_robinhood_is_auto_registered(self):
+        """Test that importing the package registers the Robinhood adapter."""
+        from tradedata.sources import RobinhoodAdapter
+
+        assert get_factory().is_registered("robinhood")
+        assert DataSourceAdapter._REGISTRY["robinhood"] is RobinhoodAdapter
+
+    def test_source_name_subclass_registers_with_default_factory(self):
+        """Test that declaring source_name registers the adapter automatically."""
 
-    def test_create_adapter_with_args(self):
-        """Test create_adapter with constructor arguments."""
-        factory = get_factory()
-        # Use a different source name since 'mock' might already be registered
-        factory.register("mock_with_args", MockAdapter)
+        class AutoAdapter(MockAdapter, source_name="auto_mock"):
+            pass
+
+        assert isinstance(create_adapter("auto_mock"), AutoAdapter)
+
+        with pytest.raises(ValueError, match="already registered"):
 
-        adapter = create_adapter("mock_with_args", test_param="convenience")
-        assert adapter.test_param == "convenience"
+            class DuplicateAdapter(MockAdapter, source_name="auto_mock"):
+                pass
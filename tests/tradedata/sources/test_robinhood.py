@@ -1,13 +1,102 @@
 """Tests for Robinhood adapter."""
 
 import json
+import uuid
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, Mock
 
 import pytest
+import requests
 
 from tradedata.sources.robinhood import RobinhoodAdapter, RobinhoodAPIWrapper
 
+_OPTION_ORDER_RAW: dict[str, Any] = {
+    "id": "rh-option-789",
+    "legs": [],
+    "chain_symbol": "AAPL",
+    "opening_strategy": "vertical_call_spread",
+    "closing_strategy": None,
+    "direction": "debit",
+    "premium": "2.50",
+    "net_amount": "-250.00",
+}
+
+_OPTION_LEGS_RAW: dict[str, Any] = {
+    "id": "rh-option-789",
+    "legs": [
+        {
+            "strike_price": "150.0",
+            "expiration_date": "2025-01-17",
+            "option_type": "call",
+            "side": "buy",
+            "position_effect": "open",
+            "ratio_quantity": 1,
+        },
+        {
+            "strike_price": "155.0",
+            "expiration_date": "2025-01-17",
+            "option_type": "call",
+            "side": "sell",
+            "position_effect": "open",
+            "ratio_quantity": 1,
+        },
+    ],
+}
+
+_EXECUTIONS_RAW: dict[str, Any] = {
+    "id": "rh-order-123",
+    "executions": [
+        {
+            "price": "2.50",
+            "quantity": "10.0",
+            "timestamp": "2025-01-15T10:05:00Z",
+        },
+        {
+            "price": "2.55",
+            "quantity": "5.0",
+            "timestamp": "2025-01-15T10:10:00Z",
+        },
+    ],
+}
+
+_DATED_STOCK_ORDERS: list[dict[str, Any]] = [
+    {"id": "stock-1", "symbol": "AAPL", "created_at": "2025-01-15T10:00:00Z"},
+    {"id": "stock-2", "symbol": "MSFT", "created_at": "2025-02-15T10:00:00Z"},
+]
+
+
+class _FakeRobinhood:
+    """Stand-in for the robin_stocks API with only the calls the adapter makes.
+
+    Each endpoint is a plain Mock returning no rows, which is far cheaper to build
+    than a MagicMock that grows child mocks on demand.
+    """
+
+    def __init__(self) -> None:
+        self.login = Mock()
+        self.get_all_stock_orders = Mock(return_value=[])
+        self.get_all_option_orders = Mock(return_value=[])
+        self.get_dividends = Mock(return_value=[])
+        self.get_bank_transfers = Mock(return_value=[])
+        self.get_crypto_orders = Mock(return_value=[])
+        self.get_open_stock_positions = Mock(return_value=[])
+        self.get_open_option_positions = Mock(return_value=[])
+        self.get_symbol_by_url = Mock(return_value=None)
+
+
+@pytest.fixture
+def mock_rh() -> _FakeRobinhood:
+    """Stand-in for the robin_stocks API."""
+    return _FakeRobinhood()
+
+
+@pytest.fixture
+def adapter(mock_rh: _FakeRobinhood) -> RobinhoodAdapter:
+    """Adapter wired to the mock_rh stand-in."""
+    return RobinhoodAdapter(robin_stocks=mock_rh)
+
 
 class TestRobinhoodAdapter:
     """Tests for RobinhoodAdapter class."""
@@ -39,34 +128,74 @@ class TestRobinhoodAdapter:
 
         assert "option orders" in str(excinfo.value)
 
-    def test_init_without_credentials(self):
-        """Test adapter initialization without credentials."""
+    def test_wrapper_resolves_api_per_wrapper(self):
+        """Test that each wrapper resolves the module's current API surface."""
+        mock_rh = MagicMock()
+        first = RobinhoodAPIWrapper(mock_rh)
+        dividends = first._api.get_dividends
+
+        # Patching the module after the first wrap is seen by a new wrapper only
+        mock_rh.get_dividends = MagicMock(return_value=[{"id": "div-1"}])
+        second = RobinhoodAPIWrapper(mock_rh)
+
+        assert first._api.get_dividends is dividends
+        assert second.get_dividends() == [{"id": "div-1"}]
+
+    def test_wrapper_pools_robin_stocks_session(self):
+        """Test configure_session mounts a pooled adapter and close() restores the original."""
+        session = requests.Session()
+        original = session.get_adapter("https://api.robinhood.com/")
         mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
+        mock_rh.helper.SESSION = session
+
+        wrapper = RobinhoodAPIWrapper(mock_rh)
+        assert session.get_adapter("https://api.robinhood.com/") is original
+
+        wrapper.configure_session()
+        adapter = session.get_adapter("https://api.robinhood.com/")
+        assert adapter.max_retries.total == 3
+        assert adapter._pool_maxsize == 8
+
+        # Configuring again keeps the already-mounted adapter
+        wrapper.configure_session()
+        assert session.get_adapter("https://api.robinhood.com/") is adapter
+
+        wrapper.close()
+        assert session.get_adapter("https://api.robinhood.com/") is original
+
+    def test_adapter_owns_session_of_its_wrapper(self, monkeypatch):
+        """Test the adapter configures robin_stocks' session itself and restores it on close."""
+        session = requests.Session()
+        original = session.get_adapter("https://api.robinhood.com/")
+        mock_rh = MagicMock()
+        mock_rh.helper.SESSION = session
+        monkeypatch.setattr("tradedata.sources.robinhood.rh_module", mock_rh)
+
+        adapter = RobinhoodAdapter()
+        assert session.get_adapter("https://api.robinhood.com/") is not original
+
+        adapter.close()
+        assert session.get_adapter("https://api.robinhood.com/") is original
+
+    def test_init_without_credentials(self, mock_rh, adapter):
+        """Test adapter initialization without credentials."""
         assert adapter.username is None
         assert adapter.password is None
         assert adapter.rh is mock_rh
 
-    def test_init_with_credentials(self):
+    def test_init_with_credentials(self, mock_rh):
         """Test adapter initialization with credentials."""
-        mock_rh = MagicMock()
         adapter = RobinhoodAdapter(username="test_user", password="test_pass", robin_stocks=mock_rh)
         assert adapter.username == "test_user"
         assert adapter.password == "test_pass"
         assert adapter.rh is mock_rh
         mock_rh.login.assert_called_once_with("test_user", "test_pass")
 
-    def test_extract_transactions(self):
+    def test_extract_transactions(self, mock_rh, adapter):
         """Test extracting transactions from Robinhood API."""
-        mock_rh = MagicMock()
         mock_rh.get_all_stock_orders.return_value = self._load_fixture("stock_orders.json")
         mock_rh.get_all_option_orders.return_value = self._load_fixture("option_orders.json")
-        mock_rh.get_dividends.return_value = []
-        mock_rh.get_bank_transfers.return_value = []
-        mock_rh.get_crypto_orders.return_value = []
-        mock_rh.get_crypto_orders.return_value = []
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transactions = adapter.extract_transactions()
 
         assert len(transactions) == 2
@@ -75,24 +204,69 @@ class TestRobinhoodAdapter:
         mock_rh.get_all_stock_orders.assert_called_once()
         mock_rh.get_all_option_orders.assert_called_once()
 
-    def test_extract_transactions_with_date_filter(self):
-        """Test extracting transactions with date filtering."""
-        mock_rh = MagicMock()
+    def test_iter_transactions_yields_chunks_per_endpoint(self, mock_rh, adapter):
+        """Transactions stream per endpoint, split into page_size chunks."""
         mock_rh.get_all_stock_orders.return_value = [
-            {"id": "stock-1", "symbol": "AAPL", "created_at": "2025-01-15T10:00:00Z"},
-            {"id": "stock-2", "symbol": "MSFT", "created_at": "2025-02-15T10:00:00Z"},
+            {"id": f"stock-{idx}", "symbol": "AAPL"} for idx in range(3)
+        ]
+        mock_rh.get_dividends.return_value = self._load_fixture("dividends.json")
+
+        chunks = list(adapter.iter_transactions(page_size=2))
+
+        assert [[tx["id"] for tx in chunk] for chunk in chunks] == [
+            ["stock-0", "stock-1"],
+            ["stock-2"],
+            ["dividend-1"],
         ]
-        mock_rh.get_all_option_orders.return_value = []
-        mock_rh.get_dividends.return_value = []
-        mock_rh.get_bank_transfers.return_value = []
-        mock_rh.get_crypto_orders.return_value = []
-        mock_rh.get_crypto_orders.return_value = []
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
-        transactions = adapter.extract_transactions(start_date="2025-01-20", end_date="2025-02-10")
+    def test_iter_transactions_fetches_endpoints_one_at_a_time(self, mock_rh, adapter):
+        """Each endpoint is fetched only after the previous one's chunks are consumed."""
+        mock_rh.get_all_stock_orders.return_value = [{"id": "stock-0", "symbol": "AAPL"}]
 
-        # Only stock-2 should be in range
-        assert len(transactions) == 0  # stock-1 is before start, stock-2 is after end
+        chunks = adapter.iter_transactions()
+        first = next(chunks)
+
+        assert [tx["id"] for tx in first] == ["stock-0"]
+        mock_rh.get_all_option_orders.assert_not_called()
+        assert list(chunks) == []
+        mock_rh.get_all_option_orders.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("start_date", "end_date", "expected_ids"),
+        [
+            # stock-1 is before start, stock-2 is after end
+            ("2025-01-20", "2025-02-10", []),
+            ("2025-01-01", "2025-02-28", ["stock-1", "stock-2"]),
+            ("2025-02-01", None, ["stock-2"]),
+            (None, "2025-01-31", ["stock-1"]),
+            (None, None, ["stock-1", "stock-2"]),
+        ],
+        ids=["neither", "both", "start-only", "end-only", "unfiltered"],
+    )
+    def test_extract_transactions_with_date_filter(
+        self, mock_rh, adapter, start_date, end_date, expected_ids
+    ):
+        """Test extracting transactions with date filtering."""
+        mock_rh.get_all_stock_orders.return_value = _DATED_STOCK_ORDERS
+
+        transactions = adapter.extract_transactions(start_date=start_date, end_date=end_date)
+
+        assert [tx["id"] for tx in transactions] == expected_ids
+
+    def test_filter_by_date_mixed_timestamp_formats(self, adapter):
+        """Test date filtering across UTC 'Z', microsecond, and offset timestamps."""
+        transactions = [
+            {"id": "before", "created_at": "2025-01-31T23:59:59.999999Z"},
+            {"id": "start", "created_at": "2025-02-01T00:00:00Z"},
+            {"id": "micro", "created_at": "2025-02-10T12:00:00.500000Z"},
+            {"id": "offset", "created_at": "2025-02-28T20:00:00-05:00"},
+            {"id": "end", "created_at": "2025-02-28T23:59:59.999999Z"},
+            {"id": "after", "created_at": "2025-03-01T00:00:00Z"},
+        ]
+
+        filtered = adapter._filter_by_date(transactions, "2025-02-01", "2025-02-28")
+
+        assert [tx["id"] for tx in filtered] == ["start", "micro", "end"]
 
     def test_extract_transactions_top_level_option_orders(self):
         """Use top-level option orders when options module lacks method."""
@@ -112,16 +286,11 @@ class TestRobinhoodAdapter:
         assert len(transactions) == 2
         mock_rh.get_all_option_orders.assert_called_once()
 
-    def test_extract_transactions_includes_dividends_and_transfers(self):
+    def test_extract_transactions_includes_dividends_and_transfers(self, mock_rh, adapter):
         """Dividends and bank transfers should be included and validated."""
-        mock_rh = MagicMock()
-        mock_rh.get_all_stock_orders.return_value = []
-        mock_rh.get_all_option_orders.return_value = []
         mock_rh.get_dividends.return_value = self._load_fixture("dividends.json")
         mock_rh.get_bank_transfers.return_value = self._load_fixture("bank_transfers.json")
-        mock_rh.get_crypto_orders.return_value = []
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transactions = adapter.extract_transactions()
 
         assert len(transactions) == 2
@@ -130,69 +299,45 @@ class TestRobinhoodAdapter:
         mock_rh.get_dividends.assert_called_once()
         mock_rh.get_bank_transfers.assert_called_once()
 
-    def test_extract_transactions_raises_on_missing_required_dividend_fields(self):
+    def test_extract_transactions_raises_on_missing_required_dividend_fields(
+        self, mock_rh, adapter
+    ):
         """Fail fast when required dividend fields are missing."""
-        mock_rh = MagicMock()
-        mock_rh.get_all_stock_orders.return_value = []
-        mock_rh.get_all_option_orders.return_value = []
         mock_rh.get_dividends.return_value = [{"amount": "1.00"}]  # id missing
-        mock_rh.get_bank_transfers.return_value = []
-        mock_rh.get_crypto_orders.return_value = []
-
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
 
         with pytest.raises(ValueError):
             adapter.extract_transactions()
 
-    def test_extract_transactions_raises_on_missing_required_transfer_fields(self):
+    def test_extract_transactions_raises_on_missing_required_transfer_fields(
+        self, mock_rh, adapter
+    ):
         """Fail fast when required transfer fields are missing."""
-        mock_rh = MagicMock()
-        mock_rh.get_all_stock_orders.return_value = []
-        mock_rh.get_all_option_orders.return_value = []
-        mock_rh.get_dividends.return_value = []
         mock_rh.get_bank_transfers.return_value = [
             {"id": "x", "direction": "deposit"}
         ]  # amount missing
-        mock_rh.get_crypto_orders.return_value = []
-
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
 
         with pytest.raises(ValueError):
             adapter.extract_transactions()
 
-    def test_extract_transactions_includes_crypto_orders(self):
+    def test_extract_transactions_includes_crypto_orders(self, mock_rh, adapter):
         """Crypto orders should be included and validated."""
-        mock_rh = MagicMock()
-        mock_rh.get_all_stock_orders.return_value = []
-        mock_rh.get_all_option_orders.return_value = []
-        mock_rh.get_dividends.return_value = []
-        mock_rh.get_bank_transfers.return_value = []
         mock_rh.get_crypto_orders.return_value = self._load_fixture("crypto_orders.json")
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transactions = adapter.extract_transactions()
 
         assert len(transactions) == 1
         assert transactions[0]["id"] == "crypto-order-1"
         mock_rh.get_crypto_orders.assert_called_once()
 
-    def test_extract_transactions_raises_on_missing_required_crypto_fields(self):
+    def test_extract_transactions_raises_on_missing_required_crypto_fields(self, mock_rh, adapter):
         """Fail fast when required crypto fields are missing."""
-        mock_rh = MagicMock()
-        mock_rh.get_all_stock_orders.return_value = []
-        mock_rh.get_all_option_orders.return_value = []
-        mock_rh.get_dividends.return_value = []
-        mock_rh.get_bank_transfers.return_value = []
         mock_rh.get_crypto_orders.return_value = [{"currency_code": "BTC", "side": "buy"}]
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
-
         with pytest.raises(ValueError):
             adapter.extract_transactions()
 
-    def test_extract_positions(self):
+    def test_extract_positions(self, mock_rh, adapter):
         """Test extracting positions from Robinhood API."""
-        mock_rh = MagicMock()
         mock_rh.get_open_stock_positions.return_value = [
             {"symbol": "AAPL", "quantity": "10.0", "cost_basis": "150.0"},
         ]
@@ -200,22 +345,18 @@ class TestRobinhoodAdapter:
             {"symbol": "AAPL250120C150", "quantity": "5.0"},
         ]
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         positions = adapter.extract_positions()
 
         assert len(positions) == 2
         assert positions[0]["symbol"] == "AAPL"
         assert positions[1]["symbol"] == "AAPL250120C150"
 
-    def test_extract_positions_fallbacks_for_stock_positions(self):
+    def test_extract_positions_fallbacks_for_stock_positions(self, mock_rh, adapter):
         """Use top-level stock positions when stocks module lacks method."""
-        mock_rh = MagicMock()
         mock_rh.get_open_stock_positions.return_value = [
             {"symbol": "AAPL", "quantity": "1.0", "cost_basis": "1.0", "current_price": "2.0"},
         ]
 
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
-
         positions = adapter.extract_positions()
 
         assert len(positions) == 1
@@ -256,7 +397,7 @@ class TestRobinhoodAdapter:
         assert len(positions) == 2
         mock_rh.options.get_all_option_positions.assert_called_once()
 
-    def test_normalize_transaction_stock(self):
+    def test_normalize_transaction_stock(self, adapter):
         """Test normalizing a stock transaction."""
         raw_tx = {
             "id": "rh-stock-123",
@@ -268,8 +409,6 @@ class TestRobinhoodAdapter:
             "account": "acc-123",
         }
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transaction = adapter.normalize_transaction(raw_tx)
 
         assert transaction.source == "robinhood"
@@ -277,9 +416,9 @@ class TestRobinhoodAdapter:
         assert transaction.type == "stock"
         assert transaction.created_at == "2025-01-15T10:00:00Z"
         assert transaction.account_id == "acc-123"
-        assert json.loads(transaction.raw_data) == raw_tx
+        assert transaction.raw_data == json.dumps(raw_tx, separators=(",", ":"))
 
-    def test_normalize_transaction_option(self):
+    def test_normalize_transaction_option(self, adapter):
         """Test normalizing an option transaction."""
         raw_tx = {
             "id": "rh-option-456",
@@ -288,70 +427,118 @@ class TestRobinhoodAdapter:
             "created_at": "2025-01-15T10:00:00Z",
         }
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transaction = adapter.normalize_transaction(raw_tx)
 
         assert transaction.source == "robinhood"
         assert transaction.source_id == "rh-option-456"
         assert transaction.type == "option"
 
-    def test_extract_option_order(self):
-        """Test extracting OptionOrder from raw transaction."""
-        raw_tx = {
-            "id": "rh-option-789",
-            "legs": [],
-            "chain_symbol": "AAPL",
-            "opening_strategy": "vertical_call_spread",
-            "closing_strategy": None,
-            "direction": "debit",
-            "premium": "2.50",
-            "net_amount": "-250.00",
-        }
+    def test_normalize_transaction_raw_data_without_orjson(self, monkeypatch, adapter):
+        """Test raw_data falls back to the stdlib json encoder, still compact."""
+        monkeypatch.setattr("tradedata.data.models.orjson", None)
+        raw_tx = {"id": "order-1", "symbol": "AAPL", "created_at": "2025-01-15T10:30:00Z"}
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transaction = adapter.normalize_transaction(raw_tx)
-        option_order = adapter.extract_option_order(raw_tx, transaction.id)
+
+        assert transaction.raw_data == json.dumps(raw_tx, separators=(",", ":"), ensure_ascii=False)
+        assert " " not in transaction.raw_data
+
+    def test_normalize_transaction_without_raw_data(self):
+        """Test raw_data serialization can be skipped."""
+        adapter = RobinhoodAdapter(robin_stocks=MagicMock(), store_raw_data=False)
+        raw_tx = {"id": "order-1", "symbol": "AAPL", "created_at": "2025-01-15T10:30:00Z"}
+
+        transaction = adapter.normalize_transaction(raw_tx)
+
+        assert transaction.raw_data == "{}"
+        assert transaction.source_id == "order-1"
+
+    def test_normalize_transaction_custom_raw_data_encoder(self):
+        """Test a caller-supplied raw_data encoder is used."""
+        adapter = RobinhoodAdapter(
+            robin_stocks=MagicMock(), raw_data_encoder=lambda raw: json.dumps(raw, sort_keys=True)
+        )
+        raw_tx = {"symbol": "AAPL", "id": "order-1"}
+
+        transaction = adapter.normalize_transaction(raw_tx)
+
+        assert transaction.raw_data == '{"id": "order-1", "symbol": "AAPL"}'
+
+    def test_normalize_transactions_batch(self, adapter):
+        """Test normalizing a batch matches per-item normalization."""
+        raw_txs = [
+            {"id": "rh-stock-1", "symbol": "AAPL", "created_at": "2025-01-15T10:00:00Z"},
+            {"id": "rh-option-1", "legs": [], "created_at": "2025-01-16T10:00:00Z"},
+        ]
+
+        transactions = adapter.normalize_transactions(raw_txs)
+
+        assert [tx.source_id for tx in transactions] == ["rh-stock-1", "rh-option-1"]
+        assert [tx.type for tx in transactions] == ["stock", "option"]
+        assert transactions[0].id != transactions[1].id
+        assert transactions[1].raw_data == json.dumps(raw_txs[1], separators=(",", ":"))
+
+    def test_extract_option_order(self, adapter):
+        """Test extracting OptionOrder from raw transaction."""
+        option_order = adapter.extract_option_order(_OPTION_ORDER_RAW, "tx-1")
 
         assert option_order is not None
-        assert option_order.id == transaction.id
+        assert option_order.id == "tx-1"
         assert option_order.chain_symbol == "AAPL"
         assert option_order.opening_strategy == "vertical_call_spread"
         assert option_order.direction == "debit"
         assert option_order.premium == 2.50
         assert option_order.net_amount == -250.00
 
-    def test_extract_option_legs(self):
-        """Test extracting OptionLeg models from raw transaction."""
-        raw_tx = {
-            "id": "rh-option-789",
-            "legs": [
-                {
-                    "strike_price": "150.0",
-                    "expiration_date": "2025-01-17",
-                    "option_type": "call",
-                    "side": "buy",
-                    "position_effect": "open",
-                    "ratio_quantity": 1,
-                },
-                {
-                    "strike_price": "155.0",
-                    "expiration_date": "2025-01-17",
-                    "option_type": "call",
-                    "side": "sell",
-                    "position_effect": "open",
-                    "ratio_quantity": 1,
-                },
-            ],
-        }
+    def test_extract_orders_use_given_transaction_type(self, monkeypatch, adapter):
+        """Test that extract helpers skip classification when the type is passed in."""
+        calls = []
+        determine = adapter._determine_transaction_type
+
+        def counting_determine(raw):
+            calls.append(raw["id"])
+            return determine(raw)
+
+        monkeypatch.setattr(adapter, "_determine_transaction_type", counting_determine)
+        raw_tx = {"id": "order-1", "symbol": "AAPL", "side": "buy", "quantity": "1"}
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transaction = adapter.normalize_transaction(raw_tx)
-        option_order = adapter.extract_option_order(raw_tx, transaction.id)
-        order_id = option_order.id if option_order else transaction.id
-        legs = adapter.extract_option_legs(raw_tx, order_id)
+        stock_order = adapter.extract_stock_order(raw_tx, transaction.id, transaction.type)
+        option_order = adapter.extract_option_order(raw_tx, transaction.id, transaction.type)
+
+        assert calls == ["order-1"]
+        assert stock_order is not None
+        assert option_order is None
+
+    def test_extract_orders_classify_mutated_raw_transaction(self, adapter):
+        """Test that extract helpers classify the dict as it is now, not as first seen."""
+        raw_tx = {"id": "order-1", "symbol": "AAPL", "side": "buy", "quantity": "1"}
+        adapter.normalize_transaction(raw_tx)
+
+        raw_tx.update({"legs": [], "chain_symbol": "AAPL"})
+
+        assert adapter.extract_stock_order(raw_tx, "tx-1") is None
+        assert adapter.extract_option_order(raw_tx, "tx-1") is not None
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("150.25", 150.25),
+            (1.5, 1.5),
+            (3, 3.0),
+            ("", None),
+            (None, None),
+            ("n/a", None),
+            ({}, None),
+        ],
+    )
+    def test_safe_float(self, value, expected):
+        """Test float coercion of raw API values."""
+        assert RobinhoodAdapter._safe_float(value) == expected
+
+    def test_extract_option_legs(self, adapter):
+        """Test extracting OptionLeg models from raw transaction."""
+        legs = adapter.extract_option_legs(_OPTION_LEGS_RAW, "order-1")
 
         assert len(legs) == 2
         assert legs[0].strike_price == 150.0
@@ -359,29 +546,12 @@ class TestRobinhoodAdapter:
         assert legs[0].side == "buy"
         assert legs[1].strike_price == 155.0
         assert legs[1].side == "sell"
+        assert legs[0].id != legs[1].id
+        assert all(uuid.UUID(leg.id).version == 7 for leg in legs)
 
-    def test_extract_executions(self):
+    def test_extract_executions(self, adapter):
         """Test extracting Execution models from raw transaction."""
-        raw_tx = {
-            "id": "rh-order-123",
-            "executions": [
-                {
-                    "price": "2.50",
-                    "quantity": "10.0",
-                    "timestamp": "2025-01-15T10:05:00Z",
-                },
-                {
-                    "price": "2.55",
-                    "quantity": "5.0",
-                    "timestamp": "2025-01-15T10:10:00Z",
-                },
-            ],
-        }
-
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
-        transaction = adapter.normalize_transaction(raw_tx)
-        executions = adapter.extract_executions(raw_tx, transaction.id)
+        executions = adapter.extract_executions(_EXECUTIONS_RAW, "tx-1")
 
         assert len(executions) == 2
         assert executions[0].price == 2.50
@@ -389,7 +559,50 @@ class TestRobinhoodAdapter:
         assert executions[1].price == 2.55
         assert executions[1].quantity == 5.0
 
-    def test_extract_stock_order(self):
+    def test_extract_option_legs_canonicalizes_case(self, adapter):
+        """Test leg enum fields are lowercased, including unknown values."""
+        raw_tx = {
+            "id": "rh-option-1",
+            "legs": [
+                {"option_type": "CALL", "side": "Sell", "position_effect": "OPEN"},
+                {"option_type": "put", "side": "buy", "position_effect": "Exercise"},
+            ],
+        }
+
+        legs = adapter.extract_option_legs(raw_tx, "order-1")
+
+        assert [(leg.option_type, leg.side, leg.position_effect) for leg in legs] == [
+            ("call", "sell", "open"),
+            ("put", "buy", "exercise"),
+        ]
+
+    def test_iter_executions_and_legs_are_lazy(self, adapter):
+        """Test generator variants yield the same models as the list methods."""
+        raw_tx = {
+            "id": "rh-option-1",
+            "legs": [{"strike_price": "150.0", "option_type": "call", "side": "buy"}],
+            "executions": [{"price": "2.50", "quantity": "1.0"}, {"price": "2.60"}],
+        }
+
+        legs = adapter.iter_option_legs(raw_tx, "order-1")
+        executions = adapter.iter_executions(raw_tx, "tx-1", ["leg-1"])
+
+        assert not isinstance(legs, list)
+        assert [leg.strike_price for leg in legs] == [150.0]
+        first = next(executions)
+        assert (first.price, first.leg_id) == (2.50, "leg-1")
+        assert [execution.leg_id for execution in executions] == [None]
+
+    def test_extract_executions_without_timestamps_share_default(self, adapter):
+        """Executions lacking timestamps get one UTC 'now' per extraction."""
+        raw_tx = {"id": "rh-order-123", "executions": [{"price": "1.0"}, {"price": "2.0"}]}
+
+        executions = adapter.extract_executions(raw_tx, "tx-1")
+
+        assert executions[0].timestamp == executions[1].timestamp
+        assert executions[0].timestamp.endswith("Z")
+
+    def test_extract_stock_order(self, adapter):
         """Test extracting StockOrder from raw transaction."""
         raw_tx = {
             "id": "rh-stock-123",
@@ -400,20 +613,17 @@ class TestRobinhoodAdapter:
             "average_price": "150.5",
         }
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
-        transaction = adapter.normalize_transaction(raw_tx)
-        stock_order = adapter.extract_stock_order(raw_tx, transaction.id)
+        stock_order = adapter.extract_stock_order(raw_tx, "tx-1")
 
         assert stock_order is not None
-        assert stock_order.id == transaction.id
+        assert stock_order.id == "tx-1"
         assert stock_order.symbol == "AAPL"
         assert stock_order.side == "buy"
         assert stock_order.quantity == 10.0
         assert stock_order.price == 150.0
         assert stock_order.average_price == 150.5
 
-    def test_extract_stock_order_missing_symbol_raises(self):
+    def test_extract_stock_order_missing_symbol_raises(self, mock_rh, adapter):
         """StockOrder extraction should fail when symbol is missing."""
         raw_tx = {
             "id": "rh-stock-123",
@@ -424,14 +634,12 @@ class TestRobinhoodAdapter:
             "average_price": "150.5",
         }
 
-        mock_rh = MagicMock()
         mock_rh.get_symbol_by_url = MagicMock(return_value=None)
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
 
         with pytest.raises(ValueError):
             adapter.normalize_transaction(raw_tx)
 
-    def test_extract_stock_order_resolves_symbol_from_instrument(self):
+    def test_extract_stock_order_resolves_symbol_from_instrument(self, mock_rh, adapter):
         """StockOrder should resolve symbol via instrument URL when symbol is absent."""
         raw_tx = {
             "id": "rh-stock-456",
@@ -441,9 +649,7 @@ class TestRobinhoodAdapter:
             "price": "100.0",
         }
 
-        mock_rh = MagicMock()
         mock_rh.get_symbol_by_url = MagicMock(return_value="MSFT")
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         transaction = adapter.normalize_transaction(raw_tx)
 
         stock_order = adapter.extract_stock_order(raw_tx, transaction.id)
@@ -451,7 +657,7 @@ class TestRobinhoodAdapter:
         assert stock_order is not None
         assert stock_order.symbol == "MSFT"
 
-    def test_normalize_position(self):
+    def test_normalize_position(self, adapter):
         """Test normalizing a position."""
         raw_position = {
             "symbol": "AAPL",
@@ -463,8 +669,6 @@ class TestRobinhoodAdapter:
             "account": "https://api.robinhood.com/accounts/ACC123/",
         }
 
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         position = adapter.normalize_position(raw_position)
 
         assert position.source == "robinhood"
@@ -475,11 +679,9 @@ class TestRobinhoodAdapter:
         assert position.unrealized_pnl == 50.0
         assert position.account_id == "ACC123"
 
-    def test_normalize_position_resolves_symbol_from_instrument(self):
+    def test_normalize_position_resolves_symbol_from_instrument(self, mock_rh, adapter):
         """Symbol should be resolved via instrument URL when missing."""
-        mock_rh = MagicMock()
         mock_rh.get_symbol_by_url.return_value = "MSFT"
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         raw_position = {
             "instrument": "https://api.robinhood.com/instruments/some-id/",
             "quantity": "5.0",
@@ -495,10 +697,22 @@ class TestRobinhoodAdapter:
         assert position.account_id is None
         mock_rh.get_symbol_by_url.assert_called_once()
 
-    def test_normalize_position_uses_chain_symbol(self):
+    def test_normalize_position_caches_symbol_per_instrument(self, mock_rh, adapter):
+        """Repeated positions for one instrument should resolve the symbol once."""
+        mock_rh.get_symbol_by_url.return_value = "MSFT"
+        raw_position = {
+            "instrument": "https://api.robinhood.com/instruments/some-id/",
+            "quantity": "5.0",
+            "updated_at": "2025-02-01T00:00:00Z",
+        }
+
+        positions = [adapter.normalize_position(dict(raw_position)) for _ in range(3)]
+
+        assert [position.symbol for position in positions] == ["MSFT"] * 3
+        mock_rh.get_symbol_by_url.assert_called_once_with(raw_position["instrument"])
+
+    def test_normalize_position_uses_chain_symbol(self, adapter):
         """Option positions should use chain_symbol when symbol missing."""
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         raw_position = {
             "chain_symbol": "AVGO",
             "quantity": "1.0",
@@ -514,11 +728,9 @@ class TestRobinhoodAdapter:
         assert position.symbol == "AVGO"
         assert position.account_id == "acc-999"
 
-    def test_normalize_position_raises_when_symbol_unresolved(self):
+    def test_normalize_position_raises_when_symbol_unresolved(self, mock_rh, adapter):
         """Fail when neither symbol nor chain_symbol nor instrument resolution is available."""
-        mock_rh = MagicMock()
         mock_rh.get_symbol_by_url = MagicMock(return_value=None)
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
         raw_position = {
             "instrument": "https://api.robinhood.com/instruments/missing/",
             "quantity": "1.0",
@@ -531,57 +743,115 @@ class TestRobinhoodAdapter:
         with pytest.raises(ValueError):
             adapter.normalize_position(raw_position)
 
-    def test_determine_transaction_type(self):
+    def test_normalize_positions_batch(self, adapter):
+        """Batch normalization should match per-row results with distinct IDs."""
+        raw_positions = [
+            {"symbol": "AAPL", "quantity": "10.0", "cost_basis": "150.0"},
+            {"chain_symbol": "AVGO", "quantity": 2, "updated_at": "2025-02-01T00:00:00Z"},
+        ]
+
+        positions = adapter.normalize_positions(raw_positions)
+
+        assert [p.symbol for p in positions] == ["AAPL", "AVGO"]
+        assert [p.quantity for p in positions] == [10.0, 2.0]
+        assert positions[0].cost_basis == 150.0
+        assert positions[1].current_price == 0.0
+        assert positions[1].last_updated == "2025-02-01T00:00:00Z"
+        assert positions[0].id != positions[1].id
+        assert adapter.normalize_positions([]) == []
+
+    @pytest.mark.parametrize(
+        ("raw_tx", "expected"),
+        [
+            ({"legs": []}, "option"),
+            ({"symbol": "AAPL"}, "stock"),
+            # Stock via instrument resolution
+            ({"instrument": "https://api.robinhood.com/instruments/aapl/"}, "stock"),
+            ({"type": "crypto_purchase"}, "crypto"),
+            ({"currency_code": "ETH", "side": "buy"}, "crypto"),
+            ({"type": "dividend"}, "dividend"),
+            ({"ach_relationship": "https://api.robinhood.com/ach/relationships/abc/"}, "transfer"),
+        ],
+        ids=[
+            "option",
+            "stock",
+            "stock-via-instrument",
+            "crypto",
+            "crypto-currency",
+            "dividend",
+            "transfer",
+        ],
+    )
+    def test_determine_transaction_type(self, mock_rh, adapter, raw_tx, expected):
         """Test determining transaction type from raw data."""
-        mock_rh = MagicMock()
         mock_rh.get_symbol_by_url = MagicMock(return_value="AAPL")
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
+        assert adapter._determine_transaction_type(raw_tx) == expected
+
+    @pytest.mark.parametrize(
+        ("raw_tx", "expected"),
+        [
+            ({"created_at": "2025-01-15T10:00:00Z"}, "2025-01-15T10:00:00Z"),
+            ({"updated_at": "2025-01-15T11:00:00Z"}, "2025-01-15T11:00:00Z"),
+            # Transfer-specific timestamp field
+            (
+                {"expected_landing_datetime": "2025-06-02T09:00:00-04:00"},
+                "2025-06-02T09:00:00-04:00",
+            ),
+        ],
+        ids=["created_at", "updated_at", "expected_landing_datetime"],
+    )
+    def test_extract_timestamp(self, adapter, raw_tx, expected):
+        """Test extracting timestamp from raw transaction."""
+        assert adapter._extract_timestamp(raw_tx) == expected
 
-        # Option transaction
-        option_tx = {"legs": []}
-        assert adapter._determine_transaction_type(option_tx) == "option"
+    def test_normalize_transactions_reads_clock_only_on_missing_timestamp(
+        self, monkeypatch, adapter
+    ):
+        """Test batch normalization reads the clock once, and only if a row needs it."""
+        clock_reads = []
 
-        # Stock transaction
-        stock_tx = {"symbol": "AAPL"}
-        assert adapter._determine_transaction_type(stock_tx) == "stock"
+        def fake_now():
+            clock_reads.append(1)
+            return "2025-01-01T12:30:00Z"
 
-        # Stock via instrument resolution
-        stock_tx_via_instrument = {"instrument": "https://api.robinhood.com/instruments/aapl/"}
-        assert adapter._determine_transaction_type(stock_tx_via_instrument) == "stock"
+        monkeypatch.setattr("tradedata.sources.robinhood._utc_now_iso", fake_now)
+        dated = [{"id": f"order-{i}", "created_at": "2025-01-15T10:00:00Z"} for i in range(3)]
 
-        # Crypto transaction
-        crypto_tx = {"type": "crypto_purchase"}
-        assert adapter._determine_transaction_type(crypto_tx) == "crypto"
-        crypto_tx_currency = {"currency_code": "ETH", "side": "buy"}
-        assert adapter._determine_transaction_type(crypto_tx_currency) == "crypto"
+        adapter.normalize_transactions(dated)
+        assert clock_reads == []
 
-        # Dividend transaction
-        dividend_tx = {"type": "dividend"}
-        assert adapter._determine_transaction_type(dividend_tx) == "dividend"
+        undated = adapter.normalize_transactions([{"id": "order-4"}, {"id": "order-5"}])
+        assert clock_reads == [1]
+        assert [tx.created_at for tx in undated] == ["2025-01-01T12:30:00Z"] * 2
 
-        # Transfer transaction
-        transfer_tx = {"ach_relationship": "https://api.robinhood.com/ach/relationships/abc/"}
-        assert adapter._determine_transaction_type(transfer_tx) == "transfer"
+    def test_batch_helpers_skip_clock_when_rows_are_dated(self, monkeypatch, adapter):
+        """Test executions, positions and date filtering never read the clock for dated rows."""
+        monkeypatch.setattr(
+            "tradedata.sources.robinhood._utc_now_iso",
+            MagicMock(side_effect=AssertionError("clock read")),
+        )
+        dated = "2025-01-15T10:00:00Z"
 
-    def test_extract_timestamp(self):
-        """Test extracting timestamp from raw transaction."""
-        mock_rh = MagicMock()
-        adapter = RobinhoodAdapter(robin_stocks=mock_rh)
+        executions = adapter.extract_executions(
+            {"executions": [{"price": "1", "quantity": "1", "timestamp": dated}]}, "tx-1"
+        )
+        positions = adapter.normalize_positions(
+            [{"symbol": "AAPL", "quantity": "1", "updated_at": dated}]
+        )
+        filtered = adapter._filter_by_date([{"created_at": dated}], "2025-01-01", None)
+
+        assert executions[0].timestamp == dated
+        assert positions[0].last_updated == dated
+        assert len(filtered) == 1
 
-        # Test with created_at
-        tx1 = {"created_at": "2025-01-15T10:00:00Z"}
-        assert adapter._extract_timestamp(tx1) == "2025-01-15T10:00:00Z"
+    def test_extract_timestamp_defaults_to_now(self, monkeypatch, adapter):
+        """Test a transaction without timestamps defaults to the current UTC time."""
 
-        # Test with updated_at
-        tx2 = {"updated_at": "2025-01-15T11:00:00Z"}
-        assert adapter._extract_timestamp(tx2) == "2025-01-15T11:00:00Z"
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2025, 1, 1, 12, 30, tzinfo=tz)
 
-        # Test with no timestamp (should default to current time)
-        tx3 = {}
-        timestamp = adapter._extract_timestamp(tx3)
-        assert timestamp is not None
-        assert "Z" in timestamp or "+" in timestamp
+        monkeypatch.setattr("tradedata.sources.robinhood.datetime", FrozenDatetime)
 
-        # Test with transfer-specific timestamp field
-        tx4 = {"expected_landing_datetime": "2025-06-02T09:00:00-04:00"}
-        assert adapter._extract_timestamp(tx4) == "2025-06-02T09:00:00-04:00"
+        assert adapter._extract_timestamp({}) == "2025-01-01T12:30:00Z"